@@ -3,10 +3,41 @@
 
 import math
 import tkinter as tk
+from itertools import chain
+from operator import itemgetter
 from tkinter import ttk, messagebox
 
+# Sort key for (position, load) tuples
+_position = itemgetter(0)
+
 
 class ValleyBeamInputs:
+    # Fixed attribute set (legacy and new names); one instance is built per
+    # beam on every recalculation, so skip the per-instance __dict__
+    __slots__ = (
+        "tributary_width",
+        "tributary_perp_ft",
+        "beam_width_b",
+        "beam_width_in",
+        "beam_depth_d",
+        "beam_depth_trial_in",
+        "Fb",
+        "fb_allowable_psi",
+        "Fv",
+        "fv_allowable_psi",
+        "E",
+        "modulus_e_psi",
+        "deflection_limit_n",
+        "deflection_snow_limit",
+        "deflection_total_limit",
+        "rafter_sloped_length_ft",
+        "jack_spacing_inches",
+        "ps_balanced_psf",
+        "governing_pd_max_psf",
+        "roof_dead_psf",
+        "governing_drift_width_ft",
+    )
+
     def __init__(
         self,
         tributary_width=4.0,
@@ -72,6 +103,49 @@ class ValleyBeamInputs:
         self.governing_drift_width_ft = governing_drift_width_ft or 20.0
 
 
+def _point_load_envelope(
+    point_loads_sorted, reaction_eave_point, reaction_eave_self_weight, w_plf, lv
+):
+    """
+    Max moment, its location and max shear for a simply supported beam carrying
+    point loads (sorted by position) plus a uniform self-weight w_plf.
+
+    Moments are sampled at 0.1 ft intervals (at least 50 stations); shears at the
+    supports and each load point. Because the loads are sorted, each station only
+    visits the loads to its left.
+    """
+    num_points = max(50, int(lv / 0.1))  # At least 50 points or 10 points per foot
+
+    max_moment = -1.0
+    max_moment_location = 0.0
+    for i in range(num_points):
+        x = i * lv / (num_points - 1)
+        # Moment from point loads: reaction_eave_point * x minus moments of loads to the left
+        moment = reaction_eave_point * x
+        for pos, load in point_loads_sorted:
+            if pos >= x:
+                break
+            moment -= load * (x - pos)
+        # Add moment from self-weight distributed load: w*x*(L-x)/2
+        moment = abs(moment + w_plf * x * (lv - x) / 2.0)
+        if moment > max_moment:
+            max_moment, max_moment_location = moment, x
+
+    max_shear = 0
+    for x in [0] + [pos for pos, _ in point_loads_sorted] + [lv]:
+        shear = reaction_eave_point
+        for pos, load in point_loads_sorted:
+            if pos >= x:
+                break
+            shear -= load
+        # Add shear from self-weight distributed load: reaction - w*x
+        shear = abs(shear + (reaction_eave_self_weight - w_plf * x))
+        if shear > max_shear:
+            max_shear = shear
+
+    return max_moment, max_moment_location, max_shear
+
+
 class ValleyBeamDesigner:
     def __init__(self, inputs: ValleyBeamInputs):
         self.inputs = inputs
@@ -116,10 +190,7 @@ class ValleyBeamDesigner:
             # Convert point load positions from sloped to horizontal coordinates if needed
             # Check if positions exceed horizontal length (indicating they're sloped)
             max_pos = (
-                max(
-                    [pos for pos, _ in snow_point_loads]
-                    + [pos for pos, _ in dead_point_loads]
-                )
+                max(pos for pos, _ in chain(snow_point_loads, dead_point_loads))
                 if snow_point_loads and dead_point_loads
                 else 0
             )
@@ -142,20 +213,16 @@ class ValleyBeamDesigner:
                 dead_point_loads_horizontal = dead_point_loads
 
             # Sort point loads by position (from eave to ridge)
-            snow_point_loads_sorted = sorted(
-                snow_point_loads_horizontal, key=lambda x: x[0]
-            )
-            dead_point_loads_sorted = sorted(
-                dead_point_loads_horizontal, key=lambda x: x[0]
-            )
+            snow_point_loads_sorted = sorted(snow_point_loads_horizontal, key=_position)
+            dead_point_loads_sorted = sorted(dead_point_loads_horizontal, key=_position)
 
             # Combine loads for structural analysis (ASD: D + 0.7S for stresses)
-            point_loads_sorted = []
-            for i, ((pos_s, load_s), (pos_d, load_d)) in enumerate(
-                zip(snow_point_loads_sorted, dead_point_loads_sorted)
-            ):
-                combined_load = load_d + 0.7 * load_s  # ASD loads for stress analysis
-                point_loads_sorted.append((pos_s, combined_load))
+            point_loads_sorted = [
+                (pos_s, load_d + 0.7 * load_s)
+                for (pos_s, load_s), (_, load_d) in zip(
+                    snow_point_loads_sorted, dead_point_loads_sorted
+                )
+            ]
 
             # Calculate beam self-weight as distributed load (plf) using SLOPED length
             self_weight_plf_sloped = self._calculate_beam_self_weight_plf(
@@ -174,9 +241,9 @@ class ValleyBeamDesigner:
             total_point_load = sum(load for _, load in point_loads_sorted)
 
             # Reaction at eave (x=0): sum of moments about ridge (x=L)
-            reaction_eave_point = 0
-            for pos, load in point_loads_sorted:
-                reaction_eave_point += load * (lv - pos) / lv
+            reaction_eave_point = sum(
+                load * (lv - pos) / lv for pos, load in point_loads_sorted
+            )
 
             reaction_ridge_point = total_point_load - reaction_eave_point
 
@@ -192,51 +259,13 @@ class ValleyBeamDesigner:
             reaction_eave = reaction_eave_point + reaction_eave_self_weight
             reaction_ridge = reaction_ridge_point + reaction_ridge_self_weight
 
-            # Calculate moments at multiple points along the beam for exact maximum
-            # Use 0.1 ft intervals for precise calculation
-            num_points = max(
-                50, int(lv / 0.1)
-            )  # At least 50 points or 10 points per foot
-            positions = [i * lv / (num_points - 1) for i in range(num_points)]
-            moments = []
-
-            for x in positions:
-                # Moment from point loads: reaction_eave_point * x minus moments of loads to the left
-                moment = reaction_eave_point * x
-                for pos, load in point_loads_sorted:
-                    if pos < x:
-                        moment -= load * (x - pos)
-
-                # Add moment from self-weight distributed load: w*x*(L-x)/2
-                moment_self_weight = self_weight_plf * x * (lv - x) / 2.0
-                moment += moment_self_weight
-
-                moments.append(abs(moment))
-
-            max_moment = max(moments) if moments else 0
-
-            # Find location of max moment (approximate)
-            max_moment_idx = moments.index(max_moment)
-            max_moment_location = positions[max_moment_idx]
-
-            # Calculate max shear at supports and load points
-            shear_positions = [0] + [pos for pos, _ in point_loads_sorted] + [lv]
-            shears = []
-
-            for x in shear_positions:
-                # Shear from point loads
-                shear = reaction_eave_point
-                for pos, load in point_loads_sorted:
-                    if pos < x:
-                        shear -= load
-
-                # Add shear from self-weight distributed load: reaction - w*x
-                shear_self_weight = reaction_eave_self_weight - self_weight_plf * x
-                shear += shear_self_weight
-
-                shears.append(abs(shear))
-
-            max_shear = max(shears) if shears else 0
+            max_moment, max_moment_location, max_shear = _point_load_envelope(
+                point_loads_sorted,
+                reaction_eave_point,
+                reaction_eave_self_weight,
+                self_weight_plf,
+                lv,
+            )
 
             # Total load including self-weight
             total_load_with_self_weight = total_point_load + self_weight_total
@@ -206,32 +206,31 @@ class ValleySnowCalculator:
         self.is_combobox.set(is_options[0])  # Default to Risk Category II
         self.is_combobox.grid(row=3, column=1, sticky="ew", pady=3, padx=5)
 
-        # Add tooltip on hover
+        # Add tooltip on hover. One hidden window is reused for every hover
+        # instead of creating and destroying a Toplevel each time
+        tooltip_text = {
+            "1.0 - Risk Cat II (default)": "Risk Category II: Standard buildings, residential; pg reliability-targeted for this category",
+            "0.8 - Risk Cat I": "Risk Category I: Low hazard to human life",
+            "1.1 - Risk Cat III": "Risk Category III: Substantial hazard, schools, large assembly",
+            "1.2 - Risk Cat IV": "Risk Category IV: Essential facilities, hospitals, emergency",
+        }
+        self.tooltip = tk.Toplevel(master)
+        self.tooltip.wm_overrideredirect(True)
+        tooltip_label = tk.Label(
+            self.tooltip, bg="yellow", relief="solid", borderwidth=1
+        )
+        tooltip_label.pack()
+        self.tooltip.withdraw()
+
         def show_tooltip(event):
-            tooltip_text = {
-                "1.0 - Risk Cat II (default)": "Risk Category II: Standard buildings, residential; pg reliability-targeted for this category",
-                "0.8 - Risk Cat I": "Risk Category I: Low hazard to human life",
-                "1.1 - Risk Cat III": "Risk Category III: Substantial hazard, schools, large assembly",
-                "1.2 - Risk Cat IV": "Risk Category IV: Essential facilities, hospitals, emergency",
-            }
             current_selection = self.is_combobox.get()
             if current_selection in tooltip_text:
-                # Create a simple tooltip
-                tooltip = tk.Toplevel()
-                tooltip.wm_overrideredirect(True)
-                tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                tk.Label(
-                    tooltip,
-                    text=tooltip_text[current_selection],
-                    bg="yellow",
-                    relief="solid",
-                    borderwidth=1,
-                ).pack()
-                self.tooltip = tooltip
+                tooltip_label.config(text=tooltip_text[current_selection])
+                self.tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+                self.tooltip.deiconify()
 
         def hide_tooltip(event):
-            if hasattr(self, "tooltip"):
-                self.tooltip.destroy()
+            self.tooltip.withdraw()
 
         self.is_combobox.bind("<Enter>", show_tooltip)
         self.is_combobox.bind("<Leave>", hide_tooltip)
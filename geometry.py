@@ -22,4 +22,4 @@ def valley_rafter_length(
     h_n = de_north * s_north
     h_w = de_west * s_west
     h_avg = (h_n + h_w) / 2
-    return round(math.sqrt(lv**2 + h_avg**2), 2)
+    return round(math.hypot(lv, h_avg), 2)
@@ -4,37 +4,18 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Optional
+from typing import Optional, Tuple
 import math
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, chain
+from operator import itemgetter, mul, sub
+import io
 import json
+import logging
 import os
-import threading
-import time
 from datetime import datetime
 
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import (
-        SimpleDocTemplate,
-        Paragraph,
-        Spacer,
-        Table,
-        TableStyle,
-        PageBreak,
-        Image,
-    )
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    print("Warning: ReportLab not available. PDF reports will not be supported.")
-
 from slope_factors import calculate_cs
 from geometry import valley_rafter_length
 from beam_design import ValleyBeamInputs, ValleyBeamDesigner, create_beam_summary
@@ -48,6 +29,308 @@ from validation import (
     validate_thermal_factor,
 )
 
+logger = logging.getLogger(__name__)
+
+# Cs lookups repeat for the same (theta, Ct, slippery) across recalculations
+_calculate_cs_cached = lru_cache(maxsize=256)(calculate_cs)
+
+# Entry fields read by calculate(), in the order they are prompted
+_CALC_FIELDS: Tuple[str, ...] = (
+    "pg",
+    "north_span",
+    "south_span",
+    "ew_half_width",
+    "valley_offset",
+    "w2",
+    "ce",
+    "ct",
+    "pitch_north",
+    "pitch_west",
+    "valley_angle",
+    "beam_width",
+    "modulus_e",
+    "fb_allowable",
+    "fv_allowable",
+    "deflection_snow_limit",
+    "deflection_total_limit",
+    "beam_depth_trial",
+    "jack_spacing_inches",
+    "dead_load_horizontal",
+)
+
+# Required calculate() inputs and the labels reported when they are missing.
+# Beam width, E, Fb and Fv fall back to Glulam defaults so are not listed.
+_REQUIRED: Tuple[Tuple[str, str], ...] = (
+    ("pg", "Ground snow load (pg)"),
+    ("north_span", "North span"),
+    ("ew_half_width", "E-W half-width"),
+    ("w2", "Winter wind parameter (W2)"),
+    ("ce", "Exposure factor (Ce)"),
+    ("ct", "Thermal factor (Ct)"),
+    ("pitch_north", "Pitch north"),
+    ("pitch_west", "Pitch west"),
+    ("valley_angle", "Valley angle"),
+    ("deflection_snow_limit", "Deflection snow limit"),
+    ("deflection_total_limit", "Deflection total limit"),
+    ("jack_spacing_inches", "Jack spacing"),
+    ("dead_load_horizontal", "Dead load horizontal"),
+)
+
+# Auto-save backup layout: section -> (saved key, entry field, restore default)
+_BACKUP_SECTIONS: Tuple[Tuple[str, Tuple[Tuple[str, str, str], ...]], ...] = (
+    (
+        "snow_load_parameters",
+        (
+            ("pg", "pg", "50"),
+            ("w2", "w2", "0.55"),
+            ("ce", "ce", "1.0"),
+            ("ct", "ct", "1.2"),
+        ),
+    ),
+    (
+        "building_geometry",
+        (
+            ("pitch_north", "pitch_north", "6"),
+            ("pitch_west", "pitch_west", "6"),
+            ("north_span", "north_span", "16"),
+            ("south_span", "south_span", "16"),
+            ("ew_half_width", "ew_half_width", "42"),
+            ("valley_offset", "valley_offset", "16"),
+            ("valley_angle", "valley_angle", "90"),
+            ("jack_spacing_inches", "jack_spacing_inches", "24"),
+        ),
+    ),
+    (
+        "beam_design",
+        (
+            ("beam_width", "beam_width", "3.5"),
+            ("beam_depth_trial", "beam_depth_trial", "16"),
+        ),
+    ),
+    (
+        "ns_ridge_beam_design",
+        (
+            ("beam_width", "ns_ridge_beam_width", "3.5"),
+            ("beam_depth_trial", "ns_ridge_beam_depth_trial", "16"),
+            ("fb_allowable", "ns_ridge_fb_allowable", "2400"),
+            ("fv_allowable", "ns_ridge_fv_allowable", "265"),
+            ("modulus_e", "ns_ridge_modulus_e", "1800000"),
+            ("deflection_total_limit", "ns_ridge_deflection_total_limit", "240"),
+            ("deflection_snow_limit", "ns_ridge_deflection_snow_limit", "360"),
+        ),
+    ),
+)
+
+# Backup sections that also record a material combobox, saved as "material"
+_BACKUP_MATERIALS = {
+    "beam_design": "material_combobox",
+    "ns_ridge_beam_design": "ns_ridge_material_combobox",
+}
+
+_EIGHT_THIRDS = 8.0 / 3.0
+
+# Pause after the last keystroke before an entry is validated
+_VALIDATE_DELAY_MS = 150
+
+# Pass flag, check ratios and actual/allowable values from a successful
+# ValleyBeamDesigner.design_with_point_loads() result, fetched in one call
+_beam_check_values = itemgetter(
+    "passes",
+    "ratio_bending",
+    "ratio_shear",
+    "ratio_deflection_snow",
+    "ratio_deflection_total",
+    "fb_actual_psi",
+    "fb_allowable_psi",
+    "fv_actual_psi",
+    "fv_allowable_psi",
+    "delta_snow_in",
+    "delta_limit_snow_in",
+    "delta_total_in",
+    "delta_limit_total_in",
+)
+
+# Static opening section of the calculation report
+_REFERENCES_BLOCK = (
+    "=== REFERENCES AND METHODOLOGY ===\n\n"
+    "CALCULATION BASED ON:\n"
+    "• ASCE 7-22: Minimum Design Loads for Buildings and Other Structures\n"
+    "• Chapter 7: Snow Loads\n"
+    "• Ground snow loads from ASCE Design Ground Snow Load Geodatabase (2022-1.0)\n"
+    "• Risk-targeted ground snow loads (pg) for Risk Categories I-IV\n"
+    "• Winter wind parameter W2 (percent time wind >10 mph Oct-Apr)\n\n"
+    "METHODOLOGY:\n"
+    "• Determine ground snow load pg from geodatabase based on site location\n"
+    "• Calculate flat roof snow load pf using exposure and thermal factors\n"
+    "• Calculate sloped roof snow load ps using slope factor Cs\n"
+    "• Apply minimum snow load pm for low-slope roofs (Sec. 7.3)\n"
+    "• Determine balanced vs unbalanced loads based on roof geometry (Sec. 7.6)\n\n"
+)
+
+# Stock (widths, depths, inches per ply) used for upsizing suggestions, keyed by
+# a substring of the material name
+_MATERIAL_TABLES = {
+    # single, double, triple 2x; 2x8, 2x10, 2x12 actual; 2x nominal = 1.5" per ply
+    "Sawn Lumber": ((1.5, 3.5, 5.5), (7.25, 9.25, 11.25), 1.5),
+    # ply factor approximate for glulam
+    "Glulam": (
+        (3.125, 3.5, 5.125, 5.5, 6.75, 8.75),
+        (9, 10.5, 12, 13.5, 15, 16.5, 18, 19.5, 21, 22.5, 24),
+        1.5,
+    ),
+    # individual ply, 2, 3, 4 plies; 1.75" per ply
+    "LVL": (
+        (1.75, 3.5, 5.25, 7.0),
+        (9.25, 9.5, 11.25, 11.875, 14, 16, 18, 20, 24),
+        1.75,
+    ),
+}
+
+# Check verdict and summary tag, indexed by the bool pass flag
+_PF = ("FAIL", "PASS")
+_TAG_PASS, _TAG_FAIL = "pass", "fail"  # Summary panel verdict tags
+_PF_TAG = (_TAG_FAIL, _TAG_PASS)
+_TAG_OK, _TAG_BAD = "green", "red"  # Report status line tags
+
+
+def _check_segment(label, actual, allowable, ratio, unit="psi"):
+    """(text, tag) summary segment for one beam check, tagged pass/fail by ratio.
+
+    Stresses print as whole psi; deflections (unit="in") to 0.001 in.
+    """
+    if unit == "psi":
+        values = f"{actual:.0f}/{allowable:.0f} psi"
+    else:
+        values = f'{actual:.3f}"/{allowable:.3f}"'
+    ok = ratio <= 1
+    return f"{label}: {values} = {ratio:.3f} ({_PF[ok]})\n", _PF_TAG[ok]
+
+
+@lru_cache(maxsize=256)
+def _gable_drift(pg_074, lu, w2_17, gamma, sqrt_S):
+    """Leeward drift hd, surcharge pd and width w (ASCE 7-22 Eq. 7.6-1, 7.6-2).
+
+    Takes pg**0.74, W2**1.7 and sqrt(S) precomputed so callers can share them.
+    Cached, so the report's repeat of the wind analysis reuses the results.
+    """
+    hd = 1.5 * math.sqrt((pg_074 * lu**0.70 * w2_17) / gamma)
+    # w = 8·hd·√S/3 with the constant folded, leaving pd as the only division
+    return hd, hd * gamma / sqrt_S, hd * sqrt_S * _EIGHT_THIRDS
+
+
+@lru_cache(maxsize=64)
+def _fixed_positions(count, spacing):
+    """Point-load positions 0, spacing, 2·spacing, ... for `count` jacks.
+
+    Depends only on the jack count, so the tuple is shared between runs.
+    """
+    return tuple(i * spacing for i in range(count))
+
+
+# Column layouts of the jack rafter reaction and valley/ridge comparison tables
+_JACK_TABLE_HEADER = "{:<12} {:<15} {:<15} {:<18} {:<18} {:<18} {:<18}\n"
+_JACK_TABLE_ROW = (
+    "{:<12.1f} {:<15.0f} {:<15.0f} {:<18.0f} {:<18.0f} {:<18.0f} {:<18.0f}\n"
+)
+_COMPARE_TABLE_HEADER = "{:<12} {:<15} {:<15} {:<15} {:<18} {:<18} {:<10}\n"
+_COMPARE_TABLE_ROW = (
+    "{:<12.1f} {:<15.2f} {:<15.0f} {:<15.0f} {:<18.0f} {:<18.0f} {:<10}\n"
+)
+_COMPARE_TABLE_NA_ROW = "{:<12.1f} {:<15.2f} {:<15} {:<15} {:<18.0f} {:<18.0f} {:<10}\n"
+
+# Per-direction report text for the Section 7.6.1 wind analysis; the case is
+# picked once from the fetch and filled with a single format call
+_NARROW_WIND_TEMPLATE = (
+    "{windward_uc} WIND ANALYSIS:\n"
+    "Fetch lu = {lu:.1f} ft (Narrow roof)\n"
+    "Narrow roof case (W ≤ 20 ft):\n"
+    "• Windward ({windward}): 0 psf\n"
+    "• Leeward ({leeward}): pg = {pg:.1f} psf\n"
+    "\n"
+)
+_WIDE_WIND_TEMPLATE = (
+    "{windward_uc} WIND ANALYSIS:\n"
+    "Fetch lu = {lu:.1f} ft (Wide roof)\n"
+    "Wide roof case (W > 20 ft):\n"
+    "• Windward ({windward}): 0.3 × ps\n"
+    "• Windward ({windward}): 0.3 × {ps_dir:.1f} = {windward_load:.1f} psf\n"
+    "• Leeward surcharge calculation:\n"
+    "  Fetch lu = distance from ridge to upwind eave\n"
+    "  lu = {lu:.1f} ft\n"
+    "  hd = 1.5 × √[(pg^0.74 × lu^0.70 × W2^1.7) / γ]  (Eq. 7.6-1)\n"
+    "  hd = 1.5 × √[({pg}^0.74 × {lu}^0.7 × {w2}^1.7) / {gamma}] = {hd:.2f} ft\n"
+    "  pd = hd × γ / √S  (Eq. 7.6-2)\n"
+    "  pd = {hd:.2f} × {gamma:.1f} / √{S:.2f} = {pd:.1f} psf\n"
+    "• Leeward ({leeward}): ps + pd = {ps:.1f} + {pd:.1f} = {ps_pd:.1f} psf\n"
+    "\n"
+)
+
+
+def _wind_direction_report(
+    windward, leeward, lu, ps_dir, S, sqrt_S, *, ps, pg, w2, gamma, pg_074, w2_17
+):
+    """Report text for one wind direction of the Section 7.6.1 unbalanced analysis.
+
+    lu is the fetch to the upwind (windward) eave; roofs with lu <= 20 ft take the
+    narrow-roof case. Drift values come from the cached _gable_drift kernel.
+    """
+    if lu <= 20:
+        return _NARROW_WIND_TEMPLATE.format(
+            windward_uc=windward.upper(),
+            windward=windward,
+            leeward=leeward,
+            lu=lu,
+            pg=pg,
+        )
+    hd, pd, _ = _gable_drift(pg_074, lu, w2_17, gamma, sqrt_S)
+    return _WIDE_WIND_TEMPLATE.format(
+        windward_uc=windward.upper(),
+        windward=windward,
+        leeward=leeward,
+        lu=lu,
+        ps_dir=ps_dir,
+        windward_load=0.3 * ps_dir if ps_dir > 0 else 0,
+        pg=pg,
+        w2=w2,
+        gamma=gamma,
+        hd=hd,
+        pd=pd,
+        S=S,
+        ps=ps,
+        ps_pd=ps + pd,
+    )
+
+
+def _shear_moment_sweep(distances, loads, length, reaction_eave):
+    """Shear and moment along a simply supported beam, walking from the eave.
+
+    Returns (shears, moments): shears[0] is the eave reaction and shears[k] the
+    shear just past load k; moments[0] is 0 at the eave, moments[k] the moment
+    under load k and moments[-1] the moment at `length` (~0 in equilibrium).
+    """
+    # Running sums: shear drops by each load, and moment grows by shear times
+    # the distance to the next load (linear between point loads)
+    shears = list(accumulate(loads, sub, initial=reaction_eave))
+    edges = list(chain(distances, (length,)))
+    moments = list(
+        accumulate(map(mul, shears, map(sub, edges, chain((0.0,), edges))), initial=0.0)
+    )
+    return shears, moments
+
+
+def _beam_equilibrium(distances, loads, length):
+    """Reactions and shear/moment sweep for point loads on a simply supported beam.
+
+    Moments are taken about the eave end (distance 0). Returns (total load,
+    eave reaction, ridge reaction, shears, moments) with shears/moments as in
+    _shear_moment_sweep.
+    """
+    total = sum(loads)
+    reaction_ridge = sum(map(mul, loads, distances)) / length
+    reaction_eave = total - reaction_ridge
+    shears, moments = _shear_moment_sweep(distances, loads, length, reaction_eave)
+    return total, reaction_eave, reaction_ridge, shears, moments
+
 
 class ValleySnowCalculator:
     def __init__(self, master: tk.Tk):
@@ -85,10 +368,10 @@ class ValleySnowCalculator:
 
             # Force menu bar to be visible
             master.update()
-            print("Menu bar created successfully")
+            logger.debug("Menu bar created successfully")
 
         except Exception as e:
-            print(f"Error creating menu bar: {e}")
+            logger.error("Error creating menu bar: %s", e)
             # Continue without menu bar if there's an error
 
         # Create scrollable canvas setup
@@ -101,37 +384,44 @@ class ValleySnowCalculator:
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
-        # Single safe bind for scroll region
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
+        # Single safe bind for scroll region. The frame is the canvas's only
+        # item, so its size is the scroll region; cache it instead of bbox("all")
+        self._last_canvas_bbox = (0, 0, 0, 0)
+        self._scrollregion_pending = False
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
 
         # Pack canvas below menu bar
         self.canvas.pack(fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-        # Enable mouse wheel scrolling for the entire window
+        # Enable mouse wheel scrolling for the entire window. Wheel ticks are
+        # summed and applied in one yview_scroll when Tk is next idle
+        self._wheel_accum = 0.0
+        self._wheel_pending = False
+
         def _on_mousewheel_windows(event):
             """Handle mouse wheel scrolling on Windows."""
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            self._queue_wheel(event, -event.delta / 120)
 
         def _on_mousewheel_linux_up(event):
             """Handle mouse wheel scrolling up on Linux."""
-            self.canvas.yview_scroll(-1, "units")
+            self._queue_wheel(event, -1)
 
         def _on_mousewheel_linux_down(event):
             """Handle mouse wheel scrolling down on Linux."""
-            self.canvas.yview_scroll(1, "units")
+            self._queue_wheel(event, 1)
 
-        # Bind mouse wheel events
-        self.canvas.bind_all("<MouseWheel>", _on_mousewheel_windows)  # Windows
-        self.canvas.bind_all("<Button-4>", _on_mousewheel_linux_up)  # Linux scroll up
-        self.canvas.bind_all(
-            "<Button-5>", _on_mousewheel_linux_down
-        )  # Linux scroll down
+        # Mouse wheel events: Windows, Linux scroll up, Linux scroll down. They
+        # are bound application-wide only while the pointer is over the canvas
+        self._wheel_bindings = (
+            ("<MouseWheel>", _on_mousewheel_windows),
+            ("<Button-4>", _on_mousewheel_linux_up),
+            ("<Button-5>", _on_mousewheel_linux_down),
+        )
+        self.canvas.bind("<Enter>", self._bind_wheel)
+        self.canvas.bind("<Leave>", self._unbind_wheel)
 
-        print("Canvas and scrollable frame created")  # Debug print
+        logger.debug("Canvas and scrollable frame created")
 
         # Title banner
         banner = tk.Label(
@@ -146,6 +436,10 @@ class ValleySnowCalculator:
 
         # Create three grouped input frames
         self.entries = {}
+        # Entries validated as the user types, by Tk widget path
+        self._entry_keys = {}
+        # Pending after() ids of debounced real-time validation, by field
+        self._validate_after = {}
 
         # Snow Load Parameters Frame
         snow_frame = ttk.LabelFrame(
@@ -191,10 +485,7 @@ class ValleySnowCalculator:
             entry.insert(0, default)
             entry.grid(row=row, column=col + 1, sticky="ew", pady=3, padx=5)
             # Add real-time validation
-            entry.bind(
-                "<KeyRelease>",
-                lambda e, k=key: self.validate_input_realtime(e.widget.get(), k),
-            )
+            self._entry_keys[str(entry)] = key
             self.entries[key] = entry
 
         # Add Slippery surface checkbox
@@ -296,10 +587,7 @@ class ValleySnowCalculator:
             entry.insert(0, default)
             entry.grid(row=row, column=col + 1, sticky="ew", pady=5, padx=10)
             # Add real-time validation
-            entry.bind(
-                "<KeyRelease>",
-                lambda e, k=key: self.validate_input_realtime(e.widget.get(), k),
-            )
+            self._entry_keys[str(entry)] = key
             self.entries[key] = entry
 
         # Add low-slope note in Geometry section
@@ -366,10 +654,8 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         self.material_combobox.grid(row=0, column=1, sticky="ew", pady=5)
         # Bind the event AFTER grid placement to ensure combobox is fully initialized
         self.material_combobox.bind("<<ComboboxSelected>>", self.on_material_change)
-        print(
-            f"Material dropdown created with {len(material_values)} options"
-        )  # Debug print
-        print(f"Current selection: {self.material_combobox.get()}")  # Debug print
+        logger.debug("Material dropdown created with %d options", len(material_values))
+        logger.debug("Current selection: %s", self.material_combobox.get())
 
         beam_inputs = [
             ("DL horizontal (psf; default 15)", "15", "dead_load_horizontal"),
@@ -413,10 +699,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             entry.grid(row=row, column=col + 1, sticky="ew", pady=3, padx=5)
             # Add real-time validation (skip for material properties that use DoubleVar)
             if not isinstance(default, tk.DoubleVar):
-                entry.bind(
-                    "<KeyRelease>",
-                    lambda e, k=key: self.validate_input_realtime(e.widget.get(), k),
-                )
+                self._entry_keys[str(entry)] = key
             self.entries[key] = entry
 
         # Initialize default material properties after entries are created
@@ -500,15 +783,12 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             entry.grid(row=row, column=col + 1, sticky="ew", pady=3, padx=5)
             # Add real-time validation (skip for material properties that use DoubleVar)
             if not isinstance(default, tk.DoubleVar):
-                entry.bind(
-                    "<KeyRelease>",
-                    lambda e, k=key: self.validate_input_realtime(e.widget.get(), k),
-                )
+                self._entry_keys[str(entry)] = key
             self.entries[key] = entry
 
         # Initialize N-S ridge beam material properties after entries are created
         self.on_ns_ridge_material_change(None)
-        print("N-S Ridge Beam independent input section created")
+        logger.debug("N-S Ridge Beam independent input section created")
 
         # Beam Design Summary Frame - prominent dedicated section
         summary_frame = ttk.LabelFrame(
@@ -531,15 +811,31 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         self.summary_label.pack(side="left", fill="both", expand=True)
         summary_scrollbar.pack(side="right", fill="y")
 
+        # Tags for the summary verdicts, configured once here rather than on
+        # every calculation
+        self.summary_label.tag_configure(
+            _TAG_PASS, foreground="green", font=("Helvetica", 10, "bold")
+        )
+        self.summary_label.tag_configure(
+            _TAG_FAIL, foreground="red", font=("Helvetica", 10, "bold")
+        )
+        self.summary_label.tag_configure(
+            "ok", foreground="green", font=("Helvetica", 10, "bold")
+        )
+        self.summary_label.tag_configure(
+            "header", foreground="black", font=("Helvetica", 11, "bold")
+        )
+        self.summary_label.tag_configure(
+            "error", foreground="red", font=("Helvetica", 11, "bold")
+        )
+
         self.summary_label.insert(1.0, "Run calculation to see beam design summary...")
         self.summary_label.config(state="disabled")  # Make it read-only
 
         # Calculate button
         # Create calculate button with error handling wrapper
         def calculate_wrapper():
-            print("=" * 60)
-            print("BUTTON CLICKED - WRAPPER CALLED")
-            print("=" * 60)
+            logger.debug("Calculate button clicked")
             try:
                 self.calculate()
             except Exception as e:
@@ -547,12 +843,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
                 full_traceback = traceback.format_exc()
                 error_msg = f"Exception in calculate:\n\nType: {type(e).__name__}\nMessage: {str(e)}\n\nFull traceback:\n{full_traceback}"
-                # Show in both dialog and console
+                # Show in both dialog and log
                 messagebox.showerror("Calculation Error", error_msg)
-                print("=" * 60)
-                print("EXCEPTION CAUGHT:")
-                print(error_msg)
-                print("=" * 60)
+                logger.exception("Exception in calculate")
                 # Also write to output text
                 self.output_text.insert(tk.END, f"\n\n!!! ERROR !!!\n{error_msg}\n")
 
@@ -562,7 +855,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             command=calculate_wrapper,
         )
         self.calc_button.pack(pady=20)
-        print("Calculate button created with wrapper")
+        logger.debug("Calculate button created with wrapper")
 
         # Output area - results with expanded height
         output_frame = ttk.LabelFrame(
@@ -570,8 +863,27 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         )
         output_frame.pack(pady=10, padx=20, fill=tk.BOTH, expand=True)
 
+        # The full report is kept after each calculation and only written into
+        # the results area while this is ticked
+        self.show_details_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            output_frame,
+            text="Show full calculation report",
+            variable=self.show_details_var,
+            command=self._render_details,
+        ).pack(side=tk.TOP, anchor="w")
+
+        # Kept as a Text widget: auto-save, backups and the PDF/HTML exports read
+        # the report back with get(). calculate() writes it in one insert, so
+        # the per-insert relayout cost of many small writes does not apply.
+        # Undo stays off so each report rewrite does not grow an undo stack.
         self.output_text = tk.Text(
-            output_frame, height=30, wrap="word", font=("Consolas", 10)
+            output_frame,
+            height=30,
+            wrap="word",
+            font=("Consolas", 10),
+            undo=False,
+            autoseparators=False,
         )
         # Enable color support
         self.output_text.config(fg="black")
@@ -584,6 +896,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         self.output_text.tag_configure(
             "blue", foreground="navy", font=("Helvetica", 10, "bold")
         )
+        # Equilibrium and overall status lines in the report
+        self.output_text.tag_configure(_TAG_OK, foreground="green")
+        self.output_text.tag_configure(_TAG_BAD, foreground="red")
         # Alternative tag for testing
         self.output_text.tag_configure(
             "highlight",
@@ -602,6 +917,27 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         plot_frame.pack(pady=10, padx=20, fill=tk.X, expand=False)
         self.plot_frame = plot_frame
 
+        # Calculation results written by calculate() - created up front so the
+        # instance attribute set stays fixed across recalculations
+        self.governing_north = 0.0
+        self.governing_south = 0.0
+        self.governing_west = 0.0
+        self.governing_east = 0.0
+        self.south_load_north_wind = 0.0
+        self.east_load_west_wind = 0.0
+        self.valley_beam_positions = []
+        self.valley_beam_total_loads = []
+        self.valley_beam_sloped_positions = []
+        self.valley_beam_sloped_loads = []
+        self.ns_ridge_snow_point_loads = []
+        self.ns_ridge_dead_point_loads = []
+        self.ns_ridge_load_positions = []
+        self.ns_ridge_total_loads = []
+        self.ns_ridge_beam_length = 0.0
+        self._validated_inputs = None  # Entry values that last passed validation
+        self._last_calc_key = None  # Inputs behind the results currently shown
+        self._report_args = []  # Text.insert arguments of the last full report
+
         # Auto-save system initialization
         self.auto_save_file = "state.backup.json"
         self.crash_flag_file = ".crash"
@@ -609,6 +945,8 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         self.last_save_time = datetime.now()
         self.data_changed = False
         self.auto_save_timer = None
+        self._last_saved_state = None  # Inputs and results last written
+        self._saved_texts = {}  # Results widget contents as last read
 
         # Check for crash recovery on startup
         self.check_crash_recovery()
@@ -622,6 +960,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # Bind data change events to input fields
         self.bind_data_change_events()
 
+        # One class binding drives real-time validation for every entry
+        master.bind_class("TEntry", "<KeyRelease>", self._on_entry_key, add="+")
+
         # Bind cleanup on window close
         master.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -631,7 +972,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             with open(self.crash_flag_file, "w") as f:
                 f.write(datetime.now().isoformat())
         except Exception as e:
-            print(f"Warning: Could not create crash flag: {e}")
+            logger.warning("Could not create crash flag: %s", e)
 
     def remove_crash_flag(self):
         """Remove crash flag file when application closes normally."""
@@ -639,7 +980,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             if os.path.exists(self.crash_flag_file):
                 os.remove(self.crash_flag_file)
         except Exception as e:
-            print(f"Warning: Could not remove crash flag: {e}")
+            logger.warning("Could not remove crash flag: %s", e)
 
     def check_crash_recovery(self):
         """Check for crash flag and attempt recovery on startup."""
@@ -670,24 +1011,21 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                         pass
 
             except Exception as e:
-                print(f"Error during crash recovery: {e}")
+                logger.error("Error during crash recovery: %s", e)
 
             # Remove crash flag after recovery attempt
             self.remove_crash_flag()
 
     def start_auto_save_timer(self):
         """Start the auto-save timer."""
+        # Tk's after() runs the save on the main thread; no timer thread needed
+        self.auto_save_timer = self.master.after(
+            self.auto_save_interval, self._auto_save_tick
+        )
 
-        def auto_save_loop():
-            while True:
-                time.sleep(120)  # 2 minutes
-                # Use Tkinter's after method to run in main thread
-                if hasattr(self, "master") and self.master:
-                    self.master.after(0, self.perform_auto_save)
-
-        # Start timer in background thread
-        timer_thread = threading.Thread(target=auto_save_loop, daemon=True)
-        timer_thread.start()
+    def _auto_save_tick(self):
+        self.perform_auto_save()
+        self.start_auto_save_timer()
 
     def perform_auto_save(self):
         """Perform automatic save of current state."""
@@ -696,9 +1034,11 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 self.save_current_state()
                 self.data_changed = False
                 self.last_save_time = datetime.now()
-                print(f"Auto-saved at {self.last_save_time.strftime('%H:%M:%S')}")
+                logger.info(
+                    "Auto-saved at %s", self.last_save_time.strftime("%H:%M:%S")
+                )
         except Exception as e:
-            print(f"Auto-save error: {e}")
+            logger.error("Auto-save error: %s", e)
 
     def save_current_state(self):
         """Save current application state to backup file."""
@@ -711,62 +1051,60 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                     "auto_saved": datetime.now().isoformat(),
                     "description": "Auto-saved valley snow load calculation state",
                 },
-                "inputs": {
-                    "snow_load_parameters": {
-                        "pg": self.entries["pg"].get(),
-                        "w2": self.entries["w2"].get(),
-                        "ce": self.entries["ce"].get(),
-                        "ct": self.entries["ct"].get(),
-                    },
-                    "building_geometry": {
-                        "pitch_north": self.entries["pitch_north"].get(),
-                        "pitch_west": self.entries["pitch_west"].get(),
-                        "north_span": self.entries["north_span"].get(),
-                        "south_span": self.entries["south_span"].get(),
-                        "ew_half_width": self.entries["ew_half_width"].get(),
-                        "valley_offset": self.entries["valley_offset"].get(),
-                        "valley_angle": self.entries["valley_angle"].get(),
-                        "jack_spacing_inches": self.entries[
-                            "jack_spacing_inches"
-                        ].get(),
-                    },
-                    "beam_design": {
-                        "material": self.material_combobox.get(),
-                        "beam_width": self.entries["beam_width"].get(),
-                        "beam_depth_trial": self.entries["beam_depth_trial"].get(),
-                    },
-                    "ns_ridge_beam_design": {
-                        "material": self.ns_ridge_material_combobox.get(),
-                        "beam_width": self.entries["ns_ridge_beam_width"].get(),
-                        "beam_depth_trial": self.entries[
-                            "ns_ridge_beam_depth_trial"
-                        ].get(),
-                        "fb_allowable": self.entries["ns_ridge_fb_allowable"].get(),
-                        "fv_allowable": self.entries["ns_ridge_fv_allowable"].get(),
-                        "modulus_e": self.entries["ns_ridge_modulus_e"].get(),
-                        "deflection_total_limit": self.entries[
-                            "ns_ridge_deflection_total_limit"
-                        ].get(),
-                        "deflection_snow_limit": self.entries[
-                            "ns_ridge_deflection_snow_limit"
-                        ].get(),
-                    },
-                },
+                "inputs": self._backup_inputs(),
                 "results": {
-                    "output_text": self.output_text.get(1.0, tk.END)
-                    if hasattr(self, "output_text")
-                    else "",
-                    "summary_text": self.summary_label.get(1.0, tk.END)
-                    if hasattr(self, "summary_label")
-                    else "",
+                    "output_text": self._report_text(),
+                    "summary_text": self._saved_text("summary_label"),
                 },
             }
 
-            with open(self.auto_save_file, "w") as f:
+            # Keystrokes that leave the values as they were (arrows, Shift,
+            # retyping a digit) still mark data_changed; skip the rewrite then
+            state = (project_data["inputs"], project_data["results"])
+            if state == self._last_saved_state and os.path.exists(self.auto_save_file):
+                return
+
+            # Write a temporary file and rename it over the backup, so a crash
+            # mid-write never leaves a truncated backup behind
+            tmp_file = self.auto_save_file + ".tmp"
+            with open(tmp_file, "w") as f:
                 json.dump(project_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.auto_save_file)
+            self._last_saved_state = state
 
         except Exception as e:
-            print(f"Error saving state: {e}")
+            logger.error("Error saving state: %s", e)
+
+    def _backup_inputs(self):
+        """Current entry and material values in the auto-save layout"""
+        inputs = {}
+        for section, fields in _BACKUP_SECTIONS:
+            values = {}
+            if section in _BACKUP_MATERIALS:
+                values["material"] = getattr(self, _BACKUP_MATERIALS[section]).get()
+            for key, field, _ in fields:
+                values[key] = self.entries[field].get()
+            inputs[section] = values
+        return inputs
+
+    def _report_text(self):
+        """Text of the last full report, even while the details toggle hides it"""
+        if self._report_args:
+            return "".join(self._report_args[::2])
+        return self._saved_text("output_text")
+
+    def _saved_text(self, name):
+        """Contents of a results Text widget, re-read only after it changed"""
+        widget = getattr(self, name, None)
+        if widget is None:
+            return ""
+        # Tk sets the modified flag on every insert/delete, whoever writes
+        if widget.edit_modified() or name not in self._saved_texts:
+            self._saved_texts[name] = widget.get(1.0, tk.END)
+            widget.edit_modified(False)
+        return self._saved_texts[name]
 
     def restore_from_backup(self):
         """Restore application state from backup file."""
@@ -779,99 +1117,26 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
             # Restore inputs (same logic as load_project)
             inputs = backup_data.get("inputs", {})
-
-            # Snow load parameters
-            snow_params = inputs.get("snow_load_parameters", {})
-            self.entries["pg"].delete(0, tk.END)
-            self.entries["pg"].insert(0, snow_params.get("pg", "50"))
-            self.entries["w2"].delete(0, tk.END)
-            self.entries["w2"].insert(0, snow_params.get("w2", "0.55"))
-            self.entries["ce"].delete(0, tk.END)
-            self.entries["ce"].insert(0, snow_params.get("ce", "1.0"))
-            self.entries["ct"].delete(0, tk.END)
-            self.entries["ct"].insert(0, snow_params.get("ct", "1.2"))
-            # Building geometry
-            geom_params = inputs.get("building_geometry", {})
-            self.entries["pitch_north"].delete(0, tk.END)
-            self.entries["pitch_north"].insert(0, geom_params.get("pitch_north", "6"))
-            self.entries["pitch_west"].delete(0, tk.END)
-            self.entries["pitch_west"].insert(0, geom_params.get("pitch_west", "6"))
-            self.entries["north_span"].delete(0, tk.END)
-            self.entries["north_span"].insert(0, geom_params.get("north_span", "16"))
-            self.entries["south_span"].delete(0, tk.END)
-            self.entries["south_span"].insert(0, geom_params.get("south_span", "16"))
-            self.entries["ew_half_width"].delete(0, tk.END)
-            self.entries["ew_half_width"].insert(
-                0, geom_params.get("ew_half_width", "42")
-            )
-            self.entries["valley_offset"].delete(0, tk.END)
-            self.entries["valley_offset"].insert(
-                0, geom_params.get("valley_offset", "16")
-            )
-            self.entries["valley_angle"].delete(0, tk.END)
-            self.entries["valley_angle"].insert(
-                0, geom_params.get("valley_angle", "90")
-            )
-            self.entries["jack_spacing_inches"].delete(0, tk.END)
-            self.entries["jack_spacing_inches"].insert(
-                0, geom_params.get("jack_spacing_inches", "24")
-            )
-
-            # Beam design
-            beam_params = inputs.get("beam_design", {})
-            self.material_combobox.set(
-                beam_params.get("material", "Glulam 24F-V4 DF (Fb=2400 psi)")
-            )
-            self.entries["beam_width"].delete(0, tk.END)
-            self.entries["beam_width"].insert(0, beam_params.get("beam_width", "3.5"))
-            self.entries["beam_depth_trial"].delete(0, tk.END)
-            self.entries["beam_depth_trial"].insert(
-                0, beam_params.get("beam_depth_trial", "16")
-            )
-
-            # N-S Ridge Beam design
-            ns_ridge_params = inputs.get("ns_ridge_beam_design", {})
-            if ns_ridge_params:
-                self.ns_ridge_material_combobox.set(
-                    ns_ridge_params.get("material", "Glulam 24F-V4 DF (Fb=2400 psi)")
-                )
-                self.entries["ns_ridge_beam_width"].delete(0, tk.END)
-                self.entries["ns_ridge_beam_width"].insert(
-                    0, ns_ridge_params.get("beam_width", "3.5")
-                )
-                self.entries["ns_ridge_beam_depth_trial"].delete(0, tk.END)
-                self.entries["ns_ridge_beam_depth_trial"].insert(
-                    0, ns_ridge_params.get("beam_depth_trial", "16")
-                )
-                if "fb_allowable" in self.entries:
-                    self.entries["ns_ridge_fb_allowable"].delete(0, tk.END)
-                    self.entries["ns_ridge_fb_allowable"].insert(
-                        0, ns_ridge_params.get("fb_allowable", "2400")
-                    )
-                if "fv_allowable" in self.entries:
-                    self.entries["ns_ridge_fv_allowable"].delete(0, tk.END)
-                    self.entries["ns_ridge_fv_allowable"].insert(
-                        0, ns_ridge_params.get("fv_allowable", "265")
-                    )
-                if "modulus_e" in self.entries:
-                    self.entries["ns_ridge_modulus_e"].delete(0, tk.END)
-                    self.entries["ns_ridge_modulus_e"].insert(
-                        0, ns_ridge_params.get("modulus_e", "1800000")
-                    )
-                if "deflection_total_limit" in self.entries:
-                    self.entries["ns_ridge_deflection_total_limit"].delete(0, tk.END)
-                    self.entries["ns_ridge_deflection_total_limit"].insert(
-                        0, ns_ridge_params.get("deflection_total_limit", "240")
+            for section, fields in _BACKUP_SECTIONS:
+                params = inputs.get(section, {})
+                if section == "ns_ridge_beam_design" and not params:
+                    continue  # Backups from before the N-S ridge beam inputs
+                if section in _BACKUP_MATERIALS:
+                    getattr(self, _BACKUP_MATERIALS[section]).set(
+                        params.get("material", "Glulam 24F-V4 DF (Fb=2400 psi)")
                     )
-                if "deflection_snow_limit" in self.entries:
-                    self.entries["ns_ridge_deflection_snow_limit"].delete(0, tk.END)
-                    self.entries["ns_ridge_deflection_snow_limit"].insert(
-                        0, ns_ridge_params.get("deflection_snow_limit", "360")
-                    )
-                # Update material properties
-                self.on_ns_ridge_material_change(None)
-
-            # Restore results if available
+                for key, field, default in fields:
+                    entry = self.entries[field]
+                    entry.delete(0, tk.END)
+                    entry.insert(0, params.get(key, default))
+                if section == "ns_ridge_beam_design":
+                    # Update material properties
+                    self.on_ns_ridge_material_change(None)
+
+            # Restore results if available (plain text, so the next Calculate
+            # must re-run to rebuild tags and diagrams)
+            self._last_calc_key = None
+            self._report_args = []
             results = backup_data.get("results", {})
             if results.get("output_text") and hasattr(self, "output_text"):
                 self.output_text.delete(1.0, tk.END)
@@ -907,6 +1172,11 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
     def on_closing(self):
         """Handle application closing - cleanup auto-save files."""
+        # Stop the auto-save timer
+        if self.auto_save_timer is not None:
+            self.master.after_cancel(self.auto_save_timer)
+            self.auto_save_timer = None
+
         # Remove crash flag since we're closing normally
         self.remove_crash_flag()
 
@@ -915,7 +1185,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             if os.path.exists(self.auto_save_file):
                 os.remove(self.auto_save_file)
         except Exception as e:
-            print(f"Warning: Could not remove auto-save file: {e}")
+            logger.warning("Could not remove auto-save file: %s", e)
 
         # Close the application
         self.master.quit()
@@ -924,46 +1194,18 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         """Initialize the output text area with ASCE 7-22 Section 7.6.1 information."""
         self.output_text.insert(
             tk.END,
-            "=== ASCE 7-22 SECTION 7.6.1: UNBALANCED SNOW LOADS FOR HIP AND GABLE ROOFS ===\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "Unbalanced snow loads (including valley drifts derived from them) are governed by Sec. 7.6.1.\n\n",
-            "blue",
-        )
-        self.output_text.insert(tk.END, "APPLICABILITY:\n", "blue")
-        self.output_text.insert(
-            tk.END,
-            "• Unbalanced loads are REQUIRED only for roof slopes between 0.5/12 (≈2.38°) and 7/12 (≈30.2°).\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "• Outside this range: Unbalanced loads and associated drifts are NOT required.\n\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "SPECIAL NARROW ROOF CASE (eave-to-ridge distance W ≤ 20 ft AND simply supported prismatic members):\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "  → Leeward side: Full ground snow load pg (windward unloaded)\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END, "  → No separate drift surcharge calculated\n\n", "blue"
-        )
-        self.output_text.insert(
-            tk.END,
+            "=== ASCE 7-22 SECTION 7.6.1: UNBALANCED SNOW LOADS FOR HIP AND GABLE ROOFS ===\n"
+            "Unbalanced snow loads (including valley drifts derived from them) are governed by Sec. 7.6.1.\n\n"
+            "APPLICABILITY:\n"
+            "• Unbalanced loads are REQUIRED only for roof slopes between 0.5/12 (≈2.38°) and 7/12 (≈30.2°).\n"
+            "• Outside this range: Unbalanced loads and associated drifts are NOT required.\n\n"
+            "SPECIAL NARROW ROOF CASE (eave-to-ridge distance W ≤ 20 ft AND simply supported prismatic members):\n"
+            "  → Leeward side: Full ground snow load pg (windward unloaded)\n"
+            "  → No separate drift surcharge calculated\n\n"
             "If unbalanced loads do not apply on either plane, drift surcharge = 0.\n",
             "blue",
-        )
-        self.output_text.insert(
-            tk.END,
             "Click 'Calculate' to analyze your specific roof geometry and see detailed results.\n",
+            "",
         )
 
     def _setup_roof_geometry(
@@ -1064,7 +1306,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         ax.text(
             center_x,
             -8,
-            f"Valley offset ±{valley_offset:.1f} ft → lv = {math.sqrt(south_span**2 + valley_offset**2):.1f} ft",
+            f"Valley offset ±{valley_offset:.1f} ft → lv = {math.hypot(south_span, valley_offset):.1f} ft",
             ha="center",
             va="top",
         )
@@ -1119,7 +1361,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             )
 
     def draw_plan_view(self, north_span, south_span, ew_half_width, valley_offset):
-        fig = plt.Figure(figsize=(8, 8))
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 8))
         ax = fig.add_subplot(111)
         ax.set_aspect("equal")
 
@@ -1156,7 +1400,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         ps,
         pd_north,
     ):
-        fig = plt.Figure(figsize=(12, 10))
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(12, 10))
         ax = fig.add_subplot(111)
         ax.set_aspect("equal")
 
@@ -1240,7 +1486,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         surcharge_width_north=0,
     ):
         """Draw north wind load distribution - shows North and South roof planes"""
-        fig = plt.Figure(figsize=(8, 8))
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 8))
         ax = fig.add_subplot(111)
         ax.set_aspect("equal")
 
@@ -1490,7 +1738,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         west_load = getattr(self, "governing_west", west_load_governing)
         east_load = getattr(self, "governing_east", east_load_governing)
 
-        fig = plt.Figure(figsize=(8, 8))
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 8))
         ax = fig.add_subplot(111)
         ax.set_aspect("equal")
 
@@ -1783,7 +2033,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         surcharge_width_west=0,
     ):
         """Draw west wind unbalanced load distribution on roof planes"""
-        fig = plt.Figure(figsize=(8, 8))
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 8))
         ax = fig.add_subplot(111)
         ax.set_aspect("equal")
 
@@ -2020,6 +2272,13 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         east_load_west_wind_final=0,
     ):
         """Generate five professional diagrams: plan view, SFD, BMD, drift profile, and sloped point loads."""
+        # Matplotlib is imported on first use to keep it out of startup
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import (
+            FigureCanvasTkAgg,
+            NavigationToolbar2Tk,
+        )
+
         # Clear previous plot but keep figures alive for PDF capture if needed
         for widget in self.plot_frame.winfo_children():
             widget.destroy()
@@ -2031,7 +2290,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # This ensures both valley beam and N-S ridge beam use the same arrow scaling
         # First, get valley beam max load from stored values or calculate from inputs
         max_load_valley = 0
-        if hasattr(self, "valley_beam_sloped_loads") and self.valley_beam_sloped_loads:
+        if self.valley_beam_sloped_loads:
             max_load_valley = max([abs(load) for load in self.valley_beam_sloped_loads])
         elif snow_point_loads and dead_point_loads:
             # Calculate from input point loads
@@ -2043,16 +2302,10 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
         # Get N-S ridge beam max load
         max_load_ns = 0
-        if hasattr(self, "ns_ridge_total_loads") and self.ns_ridge_total_loads:
+        if self.ns_ridge_total_loads:
             max_load_ns = max([abs(load) for load in self.ns_ridge_total_loads])
-        elif (
-            hasattr(self, "ns_ridge_snow_point_loads")
-            and self.ns_ridge_snow_point_loads
-        ):
-            if (
-                hasattr(self, "ns_ridge_dead_point_loads")
-                and self.ns_ridge_dead_point_loads
-            ):
+        elif self.ns_ridge_snow_point_loads:
+            if self.ns_ridge_dead_point_loads:
                 ns_loads = [
                     abs(snow + dead)
                     for (_, snow), (_, dead) in zip(
@@ -2142,9 +2395,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # Combine snow and dead loads for total point loads (jack rafter reactions)
         # Use stored values from comparison table to ensure diagrams match table
         total_point_loads = []
-        if hasattr(self, "valley_beam_sloped_positions") and hasattr(
-            self, "valley_beam_sloped_loads"
-        ):
+        if self.valley_beam_sloped_positions:
             # Use stored sloped positions and loads (these match the comparison table)
             for pos_sloped, total_load in zip(
                 self.valley_beam_sloped_positions, self.valley_beam_sloped_loads
@@ -2172,7 +2423,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             else 1000
         )
         max_load_ns_actual = 0
-        if hasattr(self, "ns_ridge_total_loads") and self.ns_ridge_total_loads:
+        if self.ns_ridge_total_loads:
             max_load_ns_actual = max([abs(load) for load in self.ns_ridge_total_loads])
 
         # Use the maximum load across BOTH beams for unified scaling
@@ -2611,24 +2862,15 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
         # Also check N-S ridge reactions if available to get unified reaction scale
         max_reaction_unified = max_reaction
-        if (
-            hasattr(self, "ns_ridge_snow_point_loads")
-            and self.ns_ridge_snow_point_loads
-        ):
+        if self.ns_ridge_snow_point_loads:
             # Calculate N-S ridge reactions to get unified reaction scale
-            if hasattr(self, "ns_ridge_total_loads") and self.ns_ridge_total_loads:
+            if self.ns_ridge_total_loads:
                 ns_total_temp = sum(self.ns_ridge_total_loads)
-                if (
-                    hasattr(self, "ns_ridge_beam_length")
-                    and self.ns_ridge_beam_length > 0
-                ):
+                if self.ns_ridge_beam_length > 0:
                     ns_loads_with_pos = [
                         (pos, load)
                         for pos, load in zip(
-                            self.ns_ridge_load_positions
-                            if hasattr(self, "ns_ridge_load_positions")
-                            else [],
-                            self.ns_ridge_total_loads,
+                            self.ns_ridge_load_positions, self.ns_ridge_total_loads
                         )
                     ]
                     if ns_loads_with_pos:
@@ -2783,11 +3025,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # ===== N-S RIDGE BEAM POINT LOADS DIAGRAM (LAST DIAGRAM) =====
         # Create diagram for N-S ridge beam (if loads are available)
         # This diagram is placed LAST, after all other diagrams
-        if (
-            hasattr(self, "ns_ridge_snow_point_loads")
-            and hasattr(self, "ns_ridge_beam_length")
-            and self.ns_ridge_snow_point_loads
-        ):
+        if self.ns_ridge_snow_point_loads:
             fig5, ax5 = plt.subplots(1, 1, figsize=(12, 7), dpi=100)
             self._current_figures.append(fig5)
 
@@ -2811,9 +3049,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
             # Get N-S ridge beam loads and reactions
             # Use stored total loads to ensure diagrams match comparison table
-            if hasattr(self, "ns_ridge_total_loads") and hasattr(
-                self, "ns_ridge_load_positions"
-            ):
+            if self.ns_ridge_total_loads:
                 # Use stored values that match the comparison table
                 ns_total_loads = [
                     (pos, load)
@@ -3185,15 +3421,12 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 # Get separate dead and snow loads for N-S Ridge Beam
                 ns_dead_point_loads_separate = []
                 ns_snow_point_loads_separate = []
-                if hasattr(self, "ns_ridge_snow_point_loads") and hasattr(
-                    self, "ns_ridge_dead_point_loads"
+                # Use stored point loads
+                for (pos_s, load_s), (pos_d, load_d) in zip(
+                    self.ns_ridge_snow_point_loads, self.ns_ridge_dead_point_loads
                 ):
-                    # Use stored point loads
-                    for (pos_s, load_s), (pos_d, load_d) in zip(
-                        self.ns_ridge_snow_point_loads, self.ns_ridge_dead_point_loads
-                    ):
-                        ns_dead_point_loads_separate.append((pos_d, load_d))
-                        ns_snow_point_loads_separate.append((pos_s, load_s))
+                    ns_dead_point_loads_separate.append((pos_d, load_d))
+                    ns_snow_point_loads_separate.append((pos_s, load_s))
 
                 # Calculate total dead and snow loads
                 total_dead_ns = sum(load for _, load in ns_dead_point_loads_separate)
@@ -3352,19 +3585,38 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             )
             return None
 
+    def _on_entry_key(self, event):
+        field_name = self._entry_keys.get(str(event.widget))
+        if field_name is not None:
+            self._schedule_validate(field_name)
+
+    def _schedule_validate(self, field_name):
+        """Validate a field once typing pauses rather than on every keystroke."""
+        pending = self._validate_after.pop(field_name, None)
+        if pending is not None:
+            self.master.after_cancel(pending)
+        self._validate_after[field_name] = self.master.after(
+            _VALIDATE_DELAY_MS, self._run_validate, field_name
+        )
+
+    def _run_validate(self, field_name):
+        self._validate_after.pop(field_name, None)
+        self.validate_input_realtime(self.entries[field_name].get(), field_name)
+
     def validate_input_realtime(self, value, field_name):
         """Validate input as user types and provide visual feedback."""
         try:
             if value.strip() == "":
                 # Allow empty fields (will be validated on calculate)
-                self.entries[field_name].config(bg="white")
+                self.entries[field_name].config(background="white")
                 return True
 
             float(value)
-            self.entries[field_name].config(bg="white")
+            self.entries[field_name].config(background="white")
             return True
         except ValueError:
-            self.entries[field_name].config(bg="#ffe6e6")  # Light red background
+            # Light red background
+            self.entries[field_name].config(background="#ffe6e6")
             return False
 
     def validate_all_inputs(self):
@@ -3663,15 +3915,33 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             if not filename:
                 return
 
-            if not REPORTLAB_AVAILABLE:
+            # ReportLab and matplotlib are imported on first use to keep them
+            # out of startup
+            try:
+                from reportlab.lib.pagesizes import letter
+                from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+                from reportlab.platypus import (
+                    SimpleDocTemplate,
+                    Paragraph,
+                    Spacer,
+                    Table,
+                    TableStyle,
+                    PageBreak,
+                    Image,
+                )
+                from reportlab.lib import colors
+                from reportlab.lib.units import inch
+            except ImportError:
+                logger.warning("ReportLab not available; writing an HTML report")
                 # Fallback to HTML if reportlab is not available
                 self.generate_html_report(filename.replace(".pdf", ".html"))
                 return
+            import matplotlib.pyplot as plt
 
             # Run calculations if not already done (to ensure we have results and diagrams)
             try:
                 # Check if we have results by looking at the output text
-                current_output = self.output_text.get(1.0, tk.END).strip()
+                current_output = self._report_text().strip()
                 if not current_output or "Run calculation" in current_output:
                     # No results yet, run calculation
                     self.calculate()
@@ -3681,13 +3951,11 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 pass  # Continue even if calculation fails
 
             # Get the calculation results
-            calculation_results = self.output_text.get(1.0, tk.END).strip()
+            calculation_results = self._report_text().strip()
 
             # Capture diagram images from current display
             diagram_images = []
             try:
-                import io
-
                 # Check if diagrams are currently displayed
                 if hasattr(self, "_current_figures") and self._current_figures:
                     # Use stored figures
@@ -3751,10 +4019,10 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                         plt.close(fig_drift)
 
                     except Exception as regen_error:
-                        print(f"Warning: Could not regenerate diagrams: {regen_error}")
+                        logger.warning("Could not regenerate diagrams: %s", regen_error)
 
             except Exception as e:
-                print(f"Warning: Could not capture diagrams for report: {e}")
+                logger.warning("Could not capture diagrams for report: %s", e)
                 diagram_images = []
 
             # Create PDF report using ReportLab
@@ -4200,13 +4468,13 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         """Fallback HTML report generation if PDF is not available."""
         try:
             # Get the calculation results
-            calculation_results = self.output_text.get(1.0, tk.END).strip()
+            calculation_results = self._report_text().strip()
 
             # Capture diagram images
             diagram_images_html = []
             try:
                 import base64
-                import io
+                import matplotlib.pyplot as plt
 
                 # Save current matplotlib figures as base64 encoded images
                 figures = [plt.figure(i) for i in plt.get_fignums()]
@@ -4218,7 +4486,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                     diagram_images_html.append(f"data:image/png;base64,{img_base64}")
                     plt.close(fig)
             except Exception as e:
-                print(f"Warning: Could not capture diagrams for HTML report: {e}")
+                logger.warning("Could not capture diagrams for HTML report: %s", e)
                 diagram_images_html = []
 
             # Create HTML report
@@ -4355,7 +4623,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         """Update material properties when material selection changes."""
         try:
             selected = self.material_combobox.get()
-            print(f"Material changed to: {selected}")  # Debug output
+            logger.debug("Material changed to: %s", selected)
 
             if "Sawn Lumber" in selected:
                 self.fb_allowable_value = 875
@@ -4398,16 +4666,13 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             self.on_data_changed()
 
         except Exception as e:
-            print(f"Error in on_material_change: {e}")  # Debug output
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Error in on_material_change: %s", e)
 
     def on_ns_ridge_material_change(self, event):
         """Update N-S ridge beam material properties when material selection changes."""
         try:
             selected = self.ns_ridge_material_combobox.get()
-            print(f"N-S Ridge Beam material changed to: {selected}")
+            logger.debug("N-S Ridge Beam material changed to: %s", selected)
 
             if "Sawn Lumber" in selected:
                 self.ns_ridge_fb_allowable_value = 875
@@ -4456,12 +4721,11 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             self.on_data_changed()
 
         except Exception as e:
-            print(f"Error in on_ns_ridge_material_change: {e}")
-            import traceback
+            logger.exception("Error in on_ns_ridge_material_change: %s", e)
 
-            traceback.print_exc()
-
-    def compute_s_theta(self, pitch):
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compute_s_theta(pitch):
         if pitch is None or pitch <= 0:
             return 0.0, 0.0, 0.0
         s = pitch / 12.0  # rise/run
@@ -4476,20 +4740,20 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         min_slope = theta  # For single pitch test
         condition_met = 2.38 <= min_slope <= 30.2
 
-        print("=== 6 PITCH ROOF TEST ===")
-        print(f"Pitch: {pitch}/12")
-        print(f"Slope ratio s: {s}")
-        print(f"Slope angle theta: {theta:.2f} degrees")
-        print(f"ASCE range check: 2.38 <= {theta:.2f} <= 30.2 = {condition_met}")
-        print(f"Should trigger unbalanced loads: {condition_met}")
+        logger.debug(
+            "6 pitch roof test: pitch=%s/12 s=%s theta=%.2f deg, "
+            "2.38 <= theta <= 30.2 (unbalanced) = %s",
+            pitch,
+            s,
+            theta,
+            condition_met,
+        )
         return condition_met
 
     def calculate_gable_drift(self, pg, lu, W2, Ce, ct, Cs, Is, s, S):
         gamma = min(0.13 * pg + 14, 30)
-        hd = 1.5 * math.sqrt(pg**0.74 * lu**0.7 * W2**1.7 / gamma)
-        pd = hd * gamma / math.sqrt(S)  # Uniform rectangular
-        pd_max = pd
-        w = (8 * hd * math.sqrt(S)) / 3
+        hd, pd, w = _gable_drift(pg**0.74, lu, W2**1.7, gamma, math.sqrt(S))
+        pd_max = pd  # Uniform rectangular
         ps = 0.7 * Ce * ct * Is * pg * Cs
         return {
             "hd_ft": hd,
@@ -4501,46 +4765,154 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             "gamma": gamma,
         }
 
+    def _on_frame_configure(self, event):
+        """Track the inner frame's size as the canvas scroll region"""
+        self._last_canvas_bbox = (0, 0, event.width, event.height)
+        # Layout sends a burst of <Configure> events; apply only the last one
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.master.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self._last_canvas_bbox)
+
+    def _bind_wheel(self, event=None):
+        """Route the mouse wheel to the canvas while the pointer is over it"""
+        for sequence, handler in self._wheel_bindings:
+            self.canvas.bind_all(sequence, handler)
+
+    def _queue_wheel(self, event, units):
+        """Add wheel ticks to the pending scroll, flushing once per idle"""
+        # Text widgets scroll themselves through their class bindings, and the
+        # plots sit in plot_frame; the wheel over either leaves the page alone
+        widget = event.widget
+        if isinstance(widget, tk.Text) or str(widget).startswith(
+            str(self.plot_frame) + "."
+        ):
+            return
+        self._wheel_accum += units
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.master.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self):
+        """Scroll the canvas by the wheel ticks gathered since the last flush"""
+        units = int(self._wheel_accum)
+        self._wheel_accum = 0.0
+        self._wheel_pending = False
+        if units:
+            self.canvas.yview_scroll(units, "units")
+
+    def _unbind_wheel(self, event):
+        """Release the mouse wheel once the pointer leaves the canvas"""
+        # Moving onto a widget inside the canvas also sends <Leave>; keep the
+        # binding until the pointer is really outside
+        if (
+            0 <= event.x < self.canvas.winfo_width()
+            and 0 <= event.y < self.canvas.winfo_height()
+        ):
+            return
+        for sequence, _ in self._wheel_bindings:
+            self.canvas.unbind_all(sequence)
+
+    def _scroll_to_summary(self):
+        """Fit the canvas scroll region to its content and show the beam summary"""
+        self.canvas.configure(scrollregion=self._last_canvas_bbox)
+        self.canvas.yview_moveto(0.3)
+
+    def _render_details(self):
+        """Show the last full report, or a short note while it is hidden"""
+        if not self._report_args:
+            return  # Nothing calculated yet; keep the introductory text
+        self.output_text.delete(1.0, tk.END)
+        if self.show_details_var.get():
+            self.output_text.insert(tk.END, *self._report_args)
+        else:
+            self.output_text.insert(
+                tk.END,
+                "Full calculation report hidden - tick 'Show full calculation report' "
+                "to display it.\nGoverning loads and beam checks are listed in the "
+                "Beam Design Summary above.\n",
+            )
+
     def calculate(self):
-        print("=" * 60)
-        print("CALCULATE METHOD CALLED")
-        print("=" * 60)
+        logger.debug("Calculate method called")
+        # Local aliases for names used hundreds of times below (ins writes to the
+        # results widget directly; the full report goes through report() below)
+        END = tk.END
+        sqrt = math.sqrt
+        ins = self.output_text.insert
+
+        # Results depend only on the entries, material selections and slippery
+        # flag, so an unchanged repeat leaves the current output in place.
+        # Each widget is read once here and the locals are used from then on.
+        # Results are not memoized to disk: a run also rebuilds the diagrams,
+        # summary panel and governing_* attributes, and the auto-save backup
+        # already persists the report text between sessions.
+        inputs_key = tuple(entry.get() for entry in self.entries.values())
+        selected_material = self.material_combobox.get()
+        ns_ridge_material = self.ns_ridge_material_combobox.get()
+        slippery = self.slippery_var.get()
+        calc_key = (inputs_key, selected_material, ns_ridge_material, slippery)
+        if calc_key == self._last_calc_key:
+            logger.debug("Inputs unchanged since last calculation - keeping results")
+            return
 
-        # Clear output first to show we're running
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, "CALCULATION STARTED...\n\n")
-        self.master.update()  # Force GUI update
+        # Clear output first; status lines are collected and written in one insert
+        self.output_text.delete(1.0, END)
+        # Forget the shown results until this run completes, so a run that
+        # stops on an error is never treated as current (nor redrawn by the
+        # details toggle)
+        self._last_calc_key = None
+        self._report_args = []
+        status = ["CALCULATION STARTED...\n\n"]
 
         # Test 6 pitch logic (for verification)
         try:
             self.test_6_pitch_logic()
         except Exception as e:
-            print(f"test_6_pitch_logic error (continuing): {e}")
+            logger.warning("test_6_pitch_logic error (continuing): %s", e)
+
+        # Both validation passes are skipped when the entries are unchanged since
+        # the last run that passed them
+        inputs_validated = inputs_key == self._validated_inputs
 
         # Validate all inputs before calculation
-        print("Validating inputs...")
-        validation_errors = self.validate_all_inputs()
+        validation_errors = [] if inputs_validated else self.validate_all_inputs()
         if validation_errors:
             error_message = "Please fix the following input errors:\n\n" + "\n".join(
                 f"• {error}" for error in validation_errors
             )
+            status.append(f"\nVALIDATION ERRORS:\n{error_message}\n")
+            ins(END, "".join(status))
             messagebox.showerror("Input Validation Errors", error_message)
-            self.output_text.insert(tk.END, f"\nVALIDATION ERRORS:\n{error_message}\n")
-            print(f"VALIDATION ERRORS: {validation_errors}")
+            logger.warning("Validation errors: %s", validation_errors)
             return
 
-        print("Validation passed, continuing...")
-        self.output_text.insert(
-            tk.END, "All inputs validated. Proceeding with calculation...\n\n"
-        )
-        self.master.update()  # Force GUI update
+        status.append("All inputs validated. Proceeding with calculation...\n\n")
+        ins(END, "".join(status))
+        self.master.update_idletasks()  # Redraw status without pumping user events
+
+        vals = {key: self.get_float(key) for key in _CALC_FIELDS}
+
+        # Check for missing required inputs and show error message
+        missing = [label for key, label in _REQUIRED if vals[key] is None]
+        if missing:
+            error_msg = "Please fill in the following required inputs:\n\n" + "\n".join(
+                f"• {name}" for name in missing
+            )
+            messagebox.showerror("Missing Required Inputs", error_msg)
+            ins(END, f"\nERROR: Missing inputs: {', '.join(missing)}\n")
+            logger.warning("Missing inputs: %s", missing)
+            return
 
-        pg = self.get_float("pg")
-        north_span = self.get_float("north_span")  # = lu_north
-        south_span = self.get_float("south_span")
-        ew_half_width = self.get_float("ew_half_width")  # = lu_west
+        pg = vals["pg"]
+        north_span = vals["north_span"]  # = lu_north
+        south_span = vals["south_span"]
+        ew_half_width = vals["ew_half_width"]  # = lu_west
 
-        valley_offset = self.get_float("valley_offset")
+        valley_offset = vals["valley_offset"]
         if valley_offset is None:
             valley_offset = ew_half_width  # fallback
 
@@ -4550,32 +4922,29 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # Cap at 500 ft per ASCE 7-22
         lu_north = min(lu_north, 500)
         lu_west = min(lu_west, 500)
-        w2 = self.get_float("w2")
-        ce = self.get_float("ce")
-        ct = self.get_float("ct")
-        pitch_n = self.get_float("pitch_north")
-        pitch_w = self.get_float("pitch_west")
-        valley_angle = self.get_float("valley_angle")
+        w2 = vals["w2"]
+        ce = vals["ce"]
+        ct = vals["ct"]
+        pitch_n = vals["pitch_north"]
+        pitch_w = vals["pitch_west"]
+        valley_angle = vals["valley_angle"]
 
         # Use new geometry variables
         de_n = north_span  # For compatibility with existing code
         de_w = south_span  # For compatibility with existing code
-        beam_width = self.get_float("beam_width")
-        modulus_e = self.get_float("modulus_e")
-        fb_allowable = self.get_float("fb_allowable")
-        fv_allowable = self.get_float("fv_allowable")
-        deflection_snow_limit = self.get_float("deflection_snow_limit")
-        deflection_total_limit = self.get_float("deflection_total_limit")
-        beam_depth_trial = self.get_float(
-            "beam_depth_trial"
-        )  # Can be None for back-calculation
+        beam_width = vals["beam_width"]
+        modulus_e = vals["modulus_e"]
+        fb_allowable = vals["fb_allowable"]
+        fv_allowable = vals["fv_allowable"]
+        deflection_snow_limit = vals["deflection_snow_limit"]
+        deflection_total_limit = vals["deflection_total_limit"]
+        beam_depth_trial = vals["beam_depth_trial"]  # Can be None for back-calculation
         if beam_depth_trial is None:
             beam_depth_trial = 16  # Default value
-        jack_spacing_inches = self.get_float("jack_spacing_inches")
-        dead_load_horizontal = self.get_float("dead_load_horizontal")
-        slippery = self.slippery_var.get()
+        jack_spacing_inches = vals["jack_spacing_inches"]
+        dead_load_horizontal = vals["dead_load_horizontal"]
 
-        # Validate beam design inputs
+        # Validate beam design inputs (defaulted, so never reported as missing)
         if beam_width is None or beam_width <= 0:
             beam_width = 3.125  # Default
         if modulus_e is None or modulus_e <= 0:
@@ -4585,62 +4954,10 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         if fv_allowable is None or fv_allowable <= 0:
             fv_allowable = 265.0  # Default Glulam
 
-        # Check for missing required inputs and show error message
-        missing = []
-        if pg is None:
-            missing.append("Ground snow load (pg)")
-        if lu_north is None:
-            missing.append("North span")
-        if lu_west is None:
-            missing.append("E-W half-width")
-        if w2 is None:
-            missing.append("Winter wind parameter (W2)")
-        if ce is None:
-            missing.append("Exposure factor (Ce)")
-        if ct is None:
-            missing.append("Thermal factor (Ct)")
-        if pitch_n is None:
-            missing.append("Pitch north")
-        if pitch_w is None:
-            missing.append("Pitch west")
-        if valley_angle is None:
-            missing.append("Valley angle")
-        if beam_width is None:
-            missing.append("Beam width")
-        if modulus_e is None:
-            missing.append("Modulus E")
-        if fb_allowable is None:
-            missing.append("Fb allowable")
-        if fv_allowable is None:
-            missing.append("Fv allowable")
-        if deflection_snow_limit is None:
-            missing.append("Deflection snow limit")
-        if deflection_total_limit is None:
-            missing.append("Deflection total limit")
-        if jack_spacing_inches is None:
-            missing.append("Jack spacing")
-        if dead_load_horizontal is None:
-            missing.append("Dead load horizontal")
-
-        if missing:
-            error_msg = "Please fill in the following required inputs:\n\n" + "\n".join(
-                f"• {name}" for name in missing
-            )
-            messagebox.showerror("Missing Required Inputs", error_msg)
-            self.output_text.insert(
-                tk.END, f"\nERROR: Missing inputs: {', '.join(missing)}\n"
-            )
-            print(f"ERROR: Missing inputs: {missing}")
-            return
-
-        print("All required inputs present, starting calculations...")
-
         # Calculate slopes for unbalanced load check
-        print(f"DEBUG: Computing slopes - pitch_n={pitch_n}, pitch_w={pitch_w}")
         try:
             s_n, theta_n, S_n = self.compute_s_theta(pitch_n)
             s_w, theta_w, S_w = self.compute_s_theta(pitch_w)
-            print(f"DEBUG: Slopes computed - theta_n={theta_n}, theta_w={theta_w}")
         except Exception as e:
             error_msg = (
                 f"Error computing slopes: {e}\npitch_n={pitch_n}, pitch_w={pitch_w}"
@@ -4659,32 +4976,40 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         narrow_roof_w = ew_half_width <= 20
 
         # Validation
-        errors = []
-        errors.append(validate_ground_snow_load(pg))
-        errors.append(validate_upwind_fetch(lu_north, "North"))
-        errors.append(validate_upwind_fetch(lu_west, "West"))
-        errors.append(validate_valley_angle(valley_angle))
-        errors.append(validate_pitch(pitch_n, "North"))
-        errors.append(validate_pitch(pitch_w, "West"))
-        errors.append(validate_exposure_factor(ce))
-        errors.append(validate_thermal_factor(ct))
-
-        errors = [e for e in errors if e is not None]
-        if errors:
-            messagebox.showwarning("Validation Warnings", "\n".join(errors))
-            return
+        if not inputs_validated:
+            errors = []
+            errors.append(validate_ground_snow_load(pg))
+            errors.append(validate_upwind_fetch(lu_north, "North"))
+            errors.append(validate_upwind_fetch(lu_west, "West"))
+            errors.append(validate_valley_angle(valley_angle))
+            errors.append(validate_pitch(pitch_n, "North"))
+            errors.append(validate_pitch(pitch_w, "West"))
+            errors.append(validate_exposure_factor(ce))
+            errors.append(validate_thermal_factor(ct))
+
+            errors = [e for e in errors if e is not None]
+            if errors:
+                messagebox.showwarning("Validation Warnings", "\n".join(errors))
+                return
+            self._validated_inputs = inputs_key
 
         # Flat roof snow load - ASCE 7-22 Equation 7.3-1
         pf = 0.7 * ce * ct * pg  # pf = 0.7 × Ce × Ct × pg
 
         # Slope factor calculations - ASCE 7-22 Section 7.4.1, Figure 7.4-1
-        cs_n = calculate_cs(theta_n, ct, slippery=slippery)
-        cs_w = calculate_cs(theta_w, ct, slippery=slippery)
+        cs_n = _calculate_cs_cached(theta_n, ct, slippery)
+        cs_w = _calculate_cs_cached(theta_w, ct, slippery)
         cs = min(cs_n, cs_w)  # governing slope factor
 
         # Snow density - ASCE 7-22 Equation 7.7-1
         gamma = min(0.13 * pg + 14, 30)  # γ = min(0.13 × pg + 14, 30) pcf
 
+        # Drift terms shared by both wind directions (Eq. 7.6-1 and 7.6-2)
+        pg_074 = pg**0.74
+        w2_17 = w2**1.7
+        sqrt_S_n = sqrt(S_n)
+        sqrt_S_w = sqrt(S_w)
+
         # Balanced sloped roof snow load - ASCE 7-22 Equation 7.4-1
         ps = cs * pf  # ps = Cs × pf (governing value)
 
@@ -4699,6 +5024,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         min_slope_deg = min(theta_n, theta_w)
         low_slope = min_slope_deg < 15.0
 
+        # Unbalanced loads per Figure 7.6-2 apply for 2.38° ≤ slope ≤ 30.2°
+        unbalanced_applies = 2.38 <= min_slope_deg <= 30.2
+
         # Calculate minimum snow load pm - ASCE 7-22 Equation 7.3-2
         # pm = 0.7 × Ce × Ct × pg × 0.6 (no Is factor in ASCE 7-22)
         pm = 0.7 * ce * ct * pg * 0.6
@@ -4712,20 +5040,12 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # Valley geometry - rectangular cross-gable roof
         # Valley Rafter: High point = Ridge intersection (N-S & E-W ridges meet)
         #               Low point = Eave intersection (where two gable roofs meet)
-        lv = math.sqrt(
-            south_span**2 + valley_offset**2
+        lv = math.hypot(
+            south_span, valley_offset
         )  # Horizontal valley length from low point to high point
 
-        # Compute valley angle for display (optional)
-        (
-            math.degrees(math.atan(south_span / valley_offset))
-            if valley_offset > 0
-            else 90
-        )
-
-        rafter_len = valley_rafter_length(
-            lv, pitch_n / 12.0, pitch_w / 12.0, north_span, south_span
-        )
+        # s_n and s_w from compute_s_theta are already pitch / 12
+        rafter_len = valley_rafter_length(lv, s_n, s_w, north_span, south_span)
 
         # ASCE 7-22 Section 7.6.1: Gable Unbalanced Loads
         # Analyze BOTH North and West wind directions and use governing (maximum) loads
@@ -4760,12 +5080,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # If slope outside 2.38°-30.2° range: BALANCED loads on ALL planes
         # If slope within range: UNBALANCED loads based on wind direction
 
-        # Optional debug output for unbalanced load condition
-        # min_calc_slope = min(theta_n, theta_w)
-        # print(f"DEBUG CALC: theta_n = {theta_n:.2f} degrees, theta_w = {theta_w:.2f} degrees, min_slope = {min_calc_slope:.2f} degrees")
-        # print(f"DEBUG CALC: Condition check: 2.38 <= {min_calc_slope:.2f} <= 30.2 = {2.38 <= min_calc_slope <= 30.2}")
-
-        if 2.38 <= min(theta_n, theta_w) <= 30.2:
+        if unbalanced_applies:
             # Calculate loads for BOTH wind directions and take maximums
 
             # ===== NORTH WIND ANALYSIS =====
@@ -4789,11 +5104,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 # Calculate surcharge for south plane
                 # Fetch lu = distance from ridge to upwind eave = north_span
                 lu_north = north_span
-                hd_north = 1.5 * math.sqrt(
-                    (pg**0.74 * lu_north**0.70 * w2**1.7) / gamma
+                _, surcharge_north, surcharge_width_north = _gable_drift(
+                    pg_074, lu_north, w2_17, gamma, sqrt_S_n
                 )
-                surcharge_north = hd_north * gamma / math.sqrt(S_n)
-                surcharge_width_north = (8 * hd_north * math.sqrt(S_n)) / 3
 
                 # Limit surcharge width to available roof dimension (east-west width)
                 # For roofs wider than 20 ft, surcharge width should not exceed perpendicular dimension
@@ -4823,9 +5136,9 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 # Calculate surcharge for east plane
                 # Fetch lu = distance from ridge to upwind eave = ew_half_width
                 lu_west = ew_half_width
-                hd_west = 1.5 * math.sqrt((pg**0.74 * lu_west**0.70 * w2**1.7) / gamma)
-                surcharge_west = hd_west * gamma / math.sqrt(S_w)
-                surcharge_width_west = (8 * hd_west * math.sqrt(S_w)) / 3
+                _, surcharge_west, surcharge_width_west = _gable_drift(
+                    pg_074, lu_west, w2_17, gamma, sqrt_S_w
+                )
 
                 # Limit surcharge width to available roof dimension (north-south span)
                 # For roofs wider than 20 ft, surcharge width should not exceed perpendicular dimension
@@ -4844,18 +5157,18 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             # ===== GOVERNING LOADS (Maximum from both wind directions) =====
             # Each roof plane takes the maximum load from either wind direction
             # This ensures conservative design for unknown wind conditions
-            north_load = max(
-                north_load, north_load_north_wind
-            )  # North plane: max from balanced + north wind
-            south_load = max(
-                south_load, south_load_north_wind
-            )  # South plane: max from balanced + north wind
-            west_load = max(
-                west_load, west_load_west_wind
-            )  # West plane: max from balanced + west wind
-            east_load = max(
-                east_load, east_load_west_wind
-            )  # East plane: max from balanced + west wind
+            # North/South planes: max from balanced + north wind
+            # West/East planes: max from balanced + west wind
+            north_load, south_load, west_load, east_load = map(
+                max,
+                (north_load, south_load, west_load, east_load),
+                (
+                    north_load_north_wind,
+                    south_load_north_wind,
+                    west_load_west_wind,
+                    east_load_west_wind,
+                ),
+            )
 
         # Set governing loads for diagram display (maximum from both wind directions)
         # These are always the maximum loads regardless of whether unbalanced loads apply
@@ -4865,7 +5178,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         self.governing_east = east_load
 
         # Store individual wind direction loads for valley governing load determination
-        if 2.38 <= min(theta_n, theta_w) <= 30.2:
+        if unbalanced_applies:
             self.south_load_north_wind = south_load_north_wind_final
             self.east_load_west_wind = east_load_west_wind_final
         else:
@@ -4873,8 +5186,6 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             self.south_load_north_wind = south_load
             self.east_load_west_wind = east_load
 
-        print("DEBUG: About to call generate_diagrams")
-
         # Create result dictionaries for compatibility with existing code
         result_north = {
             "hd_ft": 0,  # These will be updated for valley drifts later
@@ -4918,7 +5229,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # Jack Rafter Point Loads - calculate first since beam design needs these
         # Determine governing load and distance for jack rafter calculations
         # This matches the diagram: use governing load and governing distance for both ridges
-        if 2.38 <= min(theta_n, theta_w) <= 30.2:
+        if unbalanced_applies:
             # Determine which wind direction governs (larger total load)
             governing_valley_load_psf = max(
                 south_load_north_wind_final, east_load_west_wind_final
@@ -4986,46 +5297,35 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         # Ridge beam receives: j_w_total (j_w/2 from each side = full j_w)
         # For reactions to match: j_n/2 + j_w/2 should equal j_w_total, so j_n = j_w
         # Since geometry is symmetric and j_n = j_w, both beams use same reaction: (j_n + j_w)/2
-        snow_point_loads = []
-        dead_point_loads = []
-        num_jacks = len(jacks_data["jacks"]["west_side"])
+        north_side = jacks_data["jacks"]["north_side"]
+        west_side = jacks_data["jacks"]["west_side"]
+        num_jacks = len(west_side)
         # Use fixed 2.83-foot spacing along slope for Valley Beam: 0, 2.83, 5.66, 8.49, 11.32, 14.15, 16.98 ft
-        fixed_sloped_positions = [
-            i * 2.83 for i in range(num_jacks)
-        ]  # 0, 2.83, 5.66, 8.49, 11.32, 14.15, 16.98...
-
-        for i, (j_n, j_w) in enumerate(
-            zip(jacks_data["jacks"]["north_side"], jacks_data["jacks"]["west_side"])
-        ):
-            # Use fixed 2.83-foot spacing along the slope
-            pos_sloped = (
-                fixed_sloped_positions[i]
-                if i < len(fixed_sloped_positions)
-                else i * 2.83
-            )
-
-            # Valley beam receives half reaction from both j_n and j_w
-            # Reaction = (j_n_total + j_w_total) / 2
-            # Since j_n = j_w (symmetric), this equals j_w_total
-            reaction_snow = (j_n["total_snow_lb"] + j_w["total_snow_lb"]) / 2
-            reaction_dead = (j_n["dead_load_lb"] + j_w["dead_load_lb"]) / 2
-
-            snow_point_loads.append((pos_sloped, reaction_snow))
-            dead_point_loads.append((pos_sloped, reaction_dead))
+        fixed_sloped_positions = _fixed_positions(num_jacks, 2.83)
+
+        # Valley beam receives half reaction from both j_n and j_w
+        # Reaction = (j_n_total + j_w_total) / 2
+        # Since j_n = j_w (symmetric), this equals j_w_total
+        reactions_snow = [
+            (j_n.total_snow_lb + j_w.total_snow_lb) / 2
+            for j_n, j_w in zip(north_side, west_side)
+        ]
+        reactions_dead = [
+            (j_n.dead_load_lb + j_w.dead_load_lb) / 2
+            for j_n, j_w in zip(north_side, west_side)
+        ]
+        snow_point_loads = list(zip(fixed_sloped_positions, reactions_snow))
+        dead_point_loads = list(zip(fixed_sloped_positions, reactions_dead))
 
         # Design beam with separate snow and dead point loads
-        print(
-            f"DEBUG: About to call beam design - snow loads: {len(snow_point_loads) if snow_point_loads else 0}, dead loads: {len(dead_point_loads) if dead_point_loads else 0}, lv: {lv}, rafter_len: {rafter_len}"
-        )
-
         # Validate inputs before calling beam design
         if not snow_point_loads or not dead_point_loads:
-            print("DEBUG: No point loads available - skipping beam design")
+            logger.debug("No point loads available - skipping beam design")
             beam_results = {
                 "error": "No point loads calculated - check jack rafter configuration"
             }
         elif lv <= 0 or rafter_len <= 0:
-            print(f"DEBUG: Invalid dimensions - lv: {lv}, rafter_len: {rafter_len}")
+            logger.debug("Invalid dimensions - lv: %s, rafter_len: %s", lv, rafter_len)
             beam_results = {
                 "error": f"Invalid beam dimensions: lv={lv}, rafter_len={rafter_len}"
             }
@@ -5034,24 +5334,8 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 beam_results = beam.design_with_point_loads(
                     snow_point_loads, dead_point_loads, lv, rafter_len
                 )
-                print(
-                    f"DEBUG: beam.design_with_point_loads completed, result: {type(beam_results)}"
-                )
-                if beam_results and isinstance(beam_results, dict):
-                    print(f"DEBUG: beam_results keys: {list(beam_results.keys())}")
-                    print(f"DEBUG: beam_results has 'error': {'error' in beam_results}")
-                    print(
-                        f"DEBUG: beam_results has 'passes': {'passes' in beam_results}"
-                    )
-                else:
-                    print(
-                        f"DEBUG: beam_results is not a dict or is None: {beam_results}"
-                    )
             except Exception as e:
-                print(f"DEBUG: Exception in beam.design_with_point_loads: {e}")
-                import traceback
-
-                traceback.print_exc()
+                logger.exception("Exception in beam.design_with_point_loads: %s", e)
                 beam_results = {"error": f"Beam calculation failed: {str(e)}"}
 
         # === N-S RIDGE BEAM DESIGN (Calculate before diagrams) ===
@@ -5059,126 +5343,46 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         ns_ridge_beam_length = south_span  # Horizontal length of N-S ridge beam
 
         # Extract point loads from j_w jack rafters for N-S Ridge Beam
-        # Use actual horizontal positions from j_n (location_from_eave_ft) - these represent
-        # the horizontal distance from south eave in plan view (2 feet on center)
-        # Each j_w rafter reaction is split: half goes to N-S Ridge Beam, half goes to Valley Beam
-        ns_ridge_snow_point_loads = []
-        ns_ridge_dead_point_loads = []
-        ns_ridge_load_positions = []
-
-        # Store valley beam loads for comparison table (using same horizontal positions)
-        valley_beam_positions = []
-        valley_beam_total_loads = []
-
-        # Process each jack rafter pair (j_n and j_w)
-        # Use fixed 2-foot spacing (24 inches on center) for N-S Ridge Beam: 0, 2, 4, 6, 8, 10, 12, 14 ft
-        # Use fixed 2.83-foot spacing along slope for Valley Beam: 0, 2.83, 5.66, 8.49, 11.32, 14.15, 16.98 ft
-        num_jacks = len(jacks_data["jacks"]["west_side"])
-        fixed_horizontal_positions = [
-            i * 2.0 for i in range(num_jacks)
-        ]  # 0, 2, 4, 6, 8, 10, 12, 14...
-        fixed_sloped_positions = [
-            i * 2.83 for i in range(num_jacks)
-        ]  # 0, 2.83, 5.66, 8.49, 11.32, 14.15, 16.98...
-
-        # Initialize or clear sloped positions storage (always clear to prevent accumulation)
-        if not hasattr(self, "valley_beam_sloped_positions"):
-            self.valley_beam_sloped_positions = []
-            self.valley_beam_sloped_loads = []
-        else:
-            # Clear existing lists to prevent accumulation on subsequent calculations
-            self.valley_beam_sloped_positions.clear()
-            self.valley_beam_sloped_loads.clear()
-
-        for i, (j_n, j_w) in enumerate(
-            zip(jacks_data["jacks"]["north_side"], jacks_data["jacks"]["west_side"])
-        ):
-            # Use fixed 2-foot spacing position for ridge beam (24 inches on center)
-            pos_horizontal = (
-                fixed_horizontal_positions[i]
-                if i < len(fixed_horizontal_positions)
-                else i * 2.0
-            )
-
-            # Use fixed 2.83-foot spacing along slope for valley beam
-            pos_sloped_valley = (
-                fixed_sloped_positions[i]
-                if i < len(fixed_sloped_positions)
-                else i * 2.83
-            )
+        # Each jack rafter has equal reactions at both ends (half at each end)
+        # j_w rafter: half reaction goes to N-S Ridge Beam, half to Valley Beam
+        # j_n rafter: half reaction goes to E-W Ridge, half to Valley Beam
+        # Reactions change as tributary areas change (smaller going north), but equal at each end
+        # Since geometry is symmetric and j_n_total = j_w_total, the N-S Ridge Beam
+        # receives the same (j_n + j_w) / 2 reactions computed above for the valley beam
+        reactions_total = [
+            snow + dead for snow, dead in zip(reactions_snow, reactions_dead)
+        ]
 
-            # Each jack rafter has equal reactions at both ends (half at each end)
-            # j_w rafter: half reaction goes to N-S Ridge Beam, half to Valley Beam
-            # j_n rafter: half reaction goes to E-W Ridge, half to Valley Beam
-            # Reactions change as tributary areas change (smaller going north), but equal at each end
-
-            # Calculate reactions for this individual jack rafter pair
-            # Since geometry is symmetric and j_n_total = j_w_total:
-            # Valley beam receives: (j_n_total + j_w_total) / 2
-            # Ridge beam receives: j_w_total (from both sides)
-            # Since j_n = j_w: (j_n + j_w)/2 = (j_w + j_w)/2 = j_w_total
-            # So both should be equal - use same calculation
-            reaction_snow = (j_n["total_snow_lb"] + j_w["total_snow_lb"]) / 2
-            reaction_dead = (j_n["dead_load_lb"] + j_w["dead_load_lb"]) / 2
-            reaction_total = reaction_snow + reaction_dead
-
-            # Valley beam uses this reaction
-            valley_snow_load = reaction_snow
-            valley_dead_load = reaction_dead
-            valley_total = reaction_total
-
-            # N-S Ridge Beam uses same reaction (since j_n = j_w, j_w_total = (j_n + j_w)/2)
-            ns_ridge_snow_load = reaction_snow  # Same as valley beam
-            ns_ridge_dead_load = reaction_dead  # Same as valley beam
-            ns_ridge_total = reaction_total  # Same as valley beam
-
-            # Store N-S Ridge Beam point loads at fixed 2-foot spacing
-            ns_ridge_snow_point_loads.append((pos_horizontal, ns_ridge_snow_load))
-            ns_ridge_dead_point_loads.append((pos_horizontal, ns_ridge_dead_load))
-            ns_ridge_load_positions.append(pos_horizontal)
-
-            # Store valley beam data for comparison
-            valley_beam_positions.append(pos_horizontal)
-            valley_beam_total_loads.append(valley_total)
-
-            # Store N-S Ridge Beam total load (should equal valley_total since j_n = j_w)
-            if not hasattr(self, "ns_ridge_total_loads"):
-                self.ns_ridge_total_loads = []
-            self.ns_ridge_total_loads.append(
-                ns_ridge_total
-            )  # Same value as valley_total
-
-            # Store sloped position for valley beam (for diagram display)
-            # Use fixed 2.83-foot spacing along the slope
-            # Lists are already initialized/cleared above, just append
-            self.valley_beam_sloped_positions.append(pos_sloped_valley)
-            self.valley_beam_sloped_loads.append(valley_total)
+        # Use fixed 2-foot spacing (24 inches on center) for N-S Ridge Beam: 0, 2, 4, 6, 8, 10, 12, 14 ft
+        ns_ridge_load_positions = _fixed_positions(num_jacks, 2.0)
+        ns_ridge_snow_point_loads = list(zip(ns_ridge_load_positions, reactions_snow))
+        ns_ridge_dead_point_loads = list(zip(ns_ridge_load_positions, reactions_dead))
 
         # Store for diagram generation and comparison table
+        # Lists are rebuilt on every run so nothing accumulates across calculations
         self.ns_ridge_snow_point_loads = ns_ridge_snow_point_loads
         self.ns_ridge_dead_point_loads = ns_ridge_dead_point_loads
         self.ns_ridge_beam_length = ns_ridge_beam_length
-        self.ns_ridge_load_positions = (
-            ns_ridge_load_positions  # Store positions for diagram
-        )
-        self.valley_beam_positions = valley_beam_positions
-        self.valley_beam_total_loads = valley_beam_total_loads
-        # ns_ridge_total_loads is now calculated above in the loop
+        self.ns_ridge_load_positions = ns_ridge_load_positions  # For diagram
+        self.ns_ridge_total_loads = reactions_total  # Same as valley beam totals
+
+        # Valley beam data for comparison (same horizontal positions) and for the
+        # diagram (fixed 2.83-foot spacing along the slope)
+        self.valley_beam_positions = list(ns_ridge_load_positions)
+        self.valley_beam_total_loads = list(reactions_total)
+        self.valley_beam_sloped_positions = fixed_sloped_positions[
+            : len(reactions_total)
+        ]
+        self.valley_beam_sloped_loads = list(reactions_total)
 
         # Generate professional diagrams (using ASD loads D + 0.7S to match detailed analysis)
-        # Calculate ASD point loads for diagrams
-        asd_snow_point_loads = []
-        asd_dead_point_loads = []
-
-        for i, (pos_sloped, snow_load) in enumerate(snow_point_loads):
-            pos_sloped_dead, dead_load = dead_point_loads[i]
-            asd_snow_load = snow_load * 0.7  # ASD snow load
-            asd_snow_point_loads.append((pos_sloped, asd_snow_load))
-            asd_dead_point_loads.append((pos_sloped, dead_load))  # Dead load unchanged
+        # ASD snow point loads for diagrams; dead loads are used unchanged and
+        # already share the snow load positions
+        asd_snow_point_loads = [(pos, load * 0.7) for pos, load in snow_point_loads]
 
         self.generate_diagrams(
             snow_point_loads=asd_snow_point_loads,
-            dead_point_loads=asd_dead_point_loads,
+            dead_point_loads=dead_point_loads,
             rafter_len=rafter_len,
             ps_balanced=ps,
             gov_drift=gov_drift,
@@ -5268,10 +5472,7 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                     ns_ridge_beam_length,  # Same for horizontal beam
                 )
             except Exception as e:
-                print(f"DEBUG: Exception in N-S ridge beam design: {e}")
-                import traceback
-
-                traceback.print_exc()
+                logger.exception("N-S ridge beam design failed")
                 ns_ridge_beam_results = {
                     "error": f"N-S ridge beam calculation failed: {str(e)}"
                 }
@@ -5280,33 +5481,46 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
                 "error": "No point loads available for N-S ridge beam"
             }
 
+        # Decide success/error once; the summary panel and the report both branch
+        # on it, and check values are only unpacked on the success path
+        ns_ok = bool(ns_ridge_beam_results) and "error" not in ns_ridge_beam_results
+        if not ns_ok:
+            ns_error_msg = (
+                ns_ridge_beam_results.get("error", "Unknown error")
+                if ns_ridge_beam_results
+                else "Calculation failed"
+            )
+
         # Format beam design results
         beam_summary = "Beam design calculation in progress..."  # Initialize
 
         if beam_results and "error" not in beam_results:
-            print("DEBUG: Entering success case for beam summary")
-            print(f"DEBUG: beam_results content: {beam_results}")
+            logger.debug("Valley beam results: %s", beam_results)
             # Create summary for dedicated UI box
-            overall_pass = beam_results.get("passes", False)
-            bend_ratio = beam_results.get("ratio_bending", 0)
-            shear_ratio = beam_results.get("ratio_shear", 0)
-            snow_def_ratio = beam_results.get("ratio_deflection_snow", 0)
-            total_def_ratio = beam_results.get("ratio_deflection_total", 0)
-            print(
-                f"DEBUG: Extracted ratios - bend: {bend_ratio}, shear: {shear_ratio}, snow: {snow_def_ratio}, total: {total_def_ratio}, pass: {overall_pass}"
-            )
+            (
+                overall_pass,
+                bend_ratio,
+                shear_ratio,
+                snow_def_ratio,
+                total_def_ratio,
+                fb_actual,
+                fb_allowable,
+                fv_actual,
+                fv_allowable,
+                delta_snow_actual,
+                delta_snow_limit,
+                delta_total_actual,
+                delta_total_limit,
+            ) = _beam_check_values(beam_results)
         else:
-            print("DEBUG: Entering error case for beam summary")
             # Handle beam design error
             error_msg = (
                 beam_results.get("error", "Unknown beam design error")
                 if beam_results
                 else "Beam design calculation failed"
             )
-            print(f"BEAM DESIGN ERROR: {error_msg}")
-            self.output_text.insert(
-                tk.END, f"\n!!! BEAM DESIGN ERROR !!!\n{error_msg}\n\n"
-            )
+            logger.error("Beam design error: %s", error_msg)
+            ins(END, f"\n!!! BEAM DESIGN ERROR !!!\n{error_msg}\n\n")
             # Set error values for UI
             overall_pass = False
             bend_ratio = shear_ratio = snow_def_ratio = total_def_ratio = 0
@@ -5314,78 +5528,14 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
             # Update summary text widget with error
             self.summary_label.config(state="normal")
-            self.summary_label.delete(1.0, tk.END)
-            self.summary_label.tag_configure(
-                "error", foreground="red", font=("Helvetica", 11, "bold")
-            )
-            self.summary_label.insert(
-                tk.END, f"BEAM DESIGN ERROR: {error_msg}", "error"
-            )
+            self.summary_label.delete(1.0, END)
+            self.summary_label.insert(END, f"BEAM DESIGN ERROR: {error_msg}", "error")
             self.summary_label.config(state="disabled")
-            print(f"SUMMARY ERROR: {error_msg[:100]}...")
-            # Update canvas scroll region and scroll to summary
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            self.canvas.yview_moveto(0.3)  # Scroll to show summary
+            # Update canvas scroll region and scroll to summary once Tk is idle
+            self.canvas.after_idle(self._scroll_to_summary)
             return  # Exit early on error
 
         # Create beam design summary for both success and error cases
-        print("DEBUG: Creating summary text")
-        ratios = {
-            "Bending": bend_ratio,
-            "Shear": shear_ratio,
-            "Snow Deflection": snow_def_ratio,
-            "Total Deflection": total_def_ratio,
-        }
-        governing_check = max(ratios, key=ratios.get)
-        max_ratio = ratios[governing_check]
-
-        summary = "=== BEAM DESIGN SUMMARY ===\n\n"
-        if overall_pass:
-            summary += "OVERALL STATUS: PASS\n\n"
-            # Don't set widget foreground - use tags for individual line coloring
-        else:
-            summary += "OVERALL STATUS: FAIL\n\n"
-            summary += f"Governing Check: {governing_check} (ratio {max_ratio:.3f})\n\n"
-            # Don't set widget foreground - use tags for individual line coloring
-
-        summary += "VALLEY BEAM:\n"
-        summary += f"Beam Section: {beam_results.get('section', 'Unknown') if beam_results else 'Error'}\n\n"
-        summary += f"Bending Check: {bend_ratio:.3f} ({'PASS' if bend_ratio <= 1 else 'FAIL'})\n"
-        summary += f"Shear Check: {shear_ratio:.3f} ({'PASS' if shear_ratio <= 1 else 'FAIL'})\n"
-        summary += f"Snow Deflection: {snow_def_ratio:.3f} ({'PASS' if snow_def_ratio <= 1 else 'FAIL'})\n"
-
-        # Add N-S Ridge Beam summary
-        summary += f"\n{'='*50}\n"
-        summary += "N-S RIDGE BEAM:\n"
-        if ns_ridge_beam_results and "error" not in ns_ridge_beam_results:
-            ns_overall_pass = ns_ridge_beam_results.get("passes", False)
-            ns_bend_ratio = ns_ridge_beam_results.get("ratio_bending", 0)
-            ns_shear_ratio = ns_ridge_beam_results.get("ratio_shear", 0)
-            ns_snow_def_ratio = ns_ridge_beam_results.get("ratio_deflection_snow", 0)
-            ns_total_def_ratio = ns_ridge_beam_results.get("ratio_deflection_total", 0)
-
-            summary += f"Length: {ns_ridge_beam_length:.2f} ft\n"
-            summary += f"Material: {self.ns_ridge_material_combobox.get()}\n"
-            summary += f"Status: {'PASS' if ns_overall_pass else 'FAIL'}\n\n"
-            summary += f"Bending Check: {ns_bend_ratio:.3f} ({'PASS' if ns_bend_ratio <= 1 else 'FAIL'})\n"
-            summary += f"Shear Check: {ns_shear_ratio:.3f} ({'PASS' if ns_shear_ratio <= 1 else 'FAIL'})\n"
-            summary += f"Snow Deflection: {ns_snow_def_ratio:.3f} ({'PASS' if ns_snow_def_ratio <= 1 else 'FAIL'})\n"
-            summary += f"Total Deflection: {ns_total_def_ratio:.3f} ({'PASS' if ns_total_def_ratio <= 1 else 'FAIL'})\n"
-        else:
-            ns_error_msg = (
-                ns_ridge_beam_results.get("error", "Unknown error")
-                if ns_ridge_beam_results
-                else "Calculation failed"
-            )
-            summary += f"ERROR: {ns_error_msg}\n"
-
-        summary += f"Total Deflection: {total_def_ratio:.3f} ({'PASS' if total_def_ratio <= 1 else 'FAIL'})\n"
-
-        # Update canvas scroll region and scroll to summary
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.canvas.yview_moveto(0.3)  # Scroll to show summary
-
-        # Find governing check
         ratios = {
             "Bending": bend_ratio,
             "Shear": shear_ratio,
@@ -5394,206 +5544,155 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         }
         governing_check = max(ratios, key=ratios.get)
         max_ratio = ratios[governing_check]
-
-        # Update dedicated summary label
         bend_pass = bend_ratio <= 1
         shear_pass = shear_ratio <= 1
-        snow_pass = snow_def_ratio <= 1
-        total_pass = total_def_ratio <= 1
 
+        # Update dedicated summary label
         # Clear and enable the text widget
         self.summary_label.config(state="normal")
-        self.summary_label.delete(1.0, tk.END)
-
-        # Configure tags for colors
-        self.summary_label.tag_configure(
-            "pass", foreground="green", font=("Helvetica", 10, "bold")
-        )
-        self.summary_label.tag_configure(
-            "fail", foreground="red", font=("Helvetica", 10, "bold")
-        )
-        self.summary_label.tag_configure(
-            "ok", foreground="green", font=("Helvetica", 10, "bold")
-        )
-        self.summary_label.tag_configure(
-            "header", foreground="black", font=("Helvetica", 11, "bold")
-        )
+        self.summary_label.delete(1.0, END)
 
-        # Show actual vs allowable calculations
-        fb_actual = beam_results.get("fb_actual_psi", 0)
-        fb_allowable = beam_results.get("fb_allowable_psi", 1)
-        fv_actual = beam_results.get("fv_actual_psi", 0)
-        fv_allowable = beam_results.get("fv_allowable_psi", 1)
-        delta_snow_actual = beam_results.get("delta_snow_in", 0)
-        delta_snow_limit = beam_results.get("delta_limit_snow_in", 1)
-        delta_total_actual = beam_results.get("delta_total_in", 0)
-        delta_total_limit = beam_results.get("delta_limit_total_in", 1)
+        # Summary text is collected as (text, tag) segments and inserted once
+        segments = []
+        add = segments.append
 
         # Header
-        self.summary_label.insert(tk.END, "=== BEAM DESIGN SUMMARY ===\n\n", "header")
-        self.summary_label.insert(tk.END, "VALLEY BEAM:\n", "header")
+        add(("=== BEAM DESIGN SUMMARY ===\n\n", "header"))
+        add(("VALLEY BEAM:\n", "header"))
 
         # Overall status
         if overall_pass:
-            self.summary_label.insert(tk.END, "OVERALL STATUS: ", "")
-            self.summary_label.insert(tk.END, "PASS\n\n", "pass")
+            add(("OVERALL STATUS: ", ""))
+            add(("PASS\n\n", "pass"))
         else:
-            self.summary_label.insert(tk.END, "OVERALL STATUS: ", "")
-            self.summary_label.insert(tk.END, "FAIL\n", "fail")
-            self.summary_label.insert(
-                tk.END,
-                f"Governing Check: {governing_check} (ratio {max_ratio:.3f})\n\n",
-                "",
-            )
+            add(("OVERALL STATUS: ", ""))
+            add(("FAIL\n", "fail"))
+            add((f"Governing Check: {governing_check} (ratio {max_ratio:.3f})\n\n", ""))
 
         # Individual checks with color coding - entire line colored based on pass/fail
-        bend_line = f"Bending: {fb_actual:.0f}/{fb_allowable:.0f} psi = {bend_ratio:.3f} ({'PASS' if bend_pass else 'FAIL'})\n"
-        self.summary_label.insert(tk.END, bend_line, "pass" if bend_pass else "fail")
-
-        shear_line = f"Shear: {fv_actual:.0f}/{fv_allowable:.0f} psi = {shear_ratio:.3f} ({'PASS' if shear_pass else 'FAIL'})\n"
-        self.summary_label.insert(tk.END, shear_line, "pass" if shear_pass else "fail")
+        add(_check_segment("Bending", fb_actual, fb_allowable, bend_ratio))
+        add(_check_segment("Shear", fv_actual, fv_allowable, shear_ratio))
 
         combined_pass = bend_pass and shear_pass
-        snow_load_line = f"Snow Load Check (D + S): {bend_ratio:.3f} bending, {shear_ratio:.3f} shear ({'PASS' if combined_pass else 'FAIL'})\n"
-        self.summary_label.insert(
-            tk.END, snow_load_line, "pass" if combined_pass else "fail"
-        )
+        combined_pf, combined_tag = _PF[combined_pass], _PF_TAG[combined_pass]
+        snow_load_line = f"Snow Load Check (D + S): {bend_ratio:.3f} bending, {shear_ratio:.3f} shear ({combined_pf})\n"
+        add((snow_load_line, combined_tag))
 
-        total_load_line = f"Total Load Check (D + 0.7S): {bend_ratio:.3f} bending, {shear_ratio:.3f} shear ({'PASS' if combined_pass else 'FAIL'})\n"
-        self.summary_label.insert(
-            tk.END, total_load_line, "pass" if combined_pass else "fail"
-        )
+        total_load_line = f"Total Load Check (D + 0.7S): {bend_ratio:.3f} bending, {shear_ratio:.3f} shear ({combined_pf})\n"
+        add((total_load_line, combined_tag))
 
-        snow_def_line = f'Snow Deflection: {delta_snow_actual:.3f}"/{delta_snow_limit:.3f}" = {snow_def_ratio:.3f} ({"PASS" if snow_pass else "FAIL"})\n'
-        self.summary_label.insert(
-            tk.END, snow_def_line, "pass" if snow_pass else "fail"
+        add(
+            _check_segment(
+                "Snow Deflection",
+                delta_snow_actual,
+                delta_snow_limit,
+                snow_def_ratio,
+                "in",
+            )
         )
-
-        total_def_line = f'Total Deflection: {delta_total_actual:.3f}"/{delta_total_limit:.3f}" = {total_def_ratio:.3f} ({"PASS" if total_pass else "FAIL"})\n'
-        self.summary_label.insert(
-            tk.END, total_def_line, "pass" if total_pass else "fail"
+        add(
+            _check_segment(
+                "Total Deflection",
+                delta_total_actual,
+                delta_total_limit,
+                total_def_ratio,
+                "in",
+            )
         )
 
         # Add N-S Ridge Beam summary
-        self.summary_label.insert(tk.END, f"\n{'='*50}\n", "header")
-        self.summary_label.insert(tk.END, "N-S RIDGE BEAM:\n", "header")
-
-        if ns_ridge_beam_results and "error" not in ns_ridge_beam_results:
-            ns_overall_pass = ns_ridge_beam_results.get("passes", False)
-            ns_bend_ratio = ns_ridge_beam_results.get("ratio_bending", 0)
-            ns_shear_ratio = ns_ridge_beam_results.get("ratio_shear", 0)
-            ns_snow_def_ratio = ns_ridge_beam_results.get("ratio_deflection_snow", 0)
-            ns_total_def_ratio = ns_ridge_beam_results.get("ratio_deflection_total", 0)
-
-            ns_fb_actual = ns_ridge_beam_results.get("fb_actual_psi", 0)
-            ns_fb_allowable = ns_ridge_beam_results.get("fb_allowable_psi", 1)
-            ns_fv_actual = ns_ridge_beam_results.get("fv_actual_psi", 0)
-            ns_fv_allowable = ns_ridge_beam_results.get("fv_allowable_psi", 1)
-            ns_delta_snow_actual = ns_ridge_beam_results.get("delta_snow_in", 0)
-            ns_delta_snow_limit = ns_ridge_beam_results.get("delta_limit_snow_in", 1)
-            ns_delta_total_actual = ns_ridge_beam_results.get("delta_total_in", 0)
-            ns_delta_total_limit = ns_ridge_beam_results.get("delta_limit_total_in", 1)
-
-            self.summary_label.insert(
-                tk.END, f"Length: {ns_ridge_beam_length:.2f} ft\n", ""
-            )
-            self.summary_label.insert(
-                tk.END, f"Material: {self.ns_ridge_material_combobox.get()}\n", ""
-            )
+        add((f"\n{'='*50}\n", "header"))
+        add(("N-S RIDGE BEAM:\n", "header"))
+
+        if ns_ok:
+            (
+                ns_overall_pass,
+                ns_bend_ratio,
+                ns_shear_ratio,
+                ns_snow_def_ratio,
+                ns_total_def_ratio,
+                ns_fb_actual,
+                ns_fb_allowable,
+                ns_fv_actual,
+                ns_fv_allowable,
+                ns_delta_snow_actual,
+                ns_delta_snow_limit,
+                ns_delta_total_actual,
+                ns_delta_total_limit,
+            ) = _beam_check_values(ns_ridge_beam_results)
+
+            add((f"Length: {ns_ridge_beam_length:.2f} ft\n", ""))
+            add((f"Material: {ns_ridge_material}\n", ""))
 
             # Status line - color entire line based on pass/fail
             if ns_overall_pass:
                 ns_status_line = "Status: PASS\n\n"
-                self.summary_label.insert(tk.END, ns_status_line, "pass")
+                add((ns_status_line, "pass"))
             else:
                 ns_status_line = "Status: FAIL\n\n"
-                self.summary_label.insert(tk.END, ns_status_line, "fail")
-
-            ns_bend_pass = ns_bend_ratio <= 1
-            ns_shear_pass = ns_shear_ratio <= 1
-            ns_snow_pass = ns_snow_def_ratio <= 1
-            ns_total_pass = ns_total_def_ratio <= 1
-
-            ns_bend_line = f"Bending: {ns_fb_actual:.0f}/{ns_fb_allowable:.0f} psi = {ns_bend_ratio:.3f} ({'PASS' if ns_bend_pass else 'FAIL'})\n"
-            self.summary_label.insert(
-                tk.END, ns_bend_line, "pass" if ns_bend_pass else "fail"
-            )
-
-            ns_shear_line = f"Shear: {ns_fv_actual:.0f}/{ns_fv_allowable:.0f} psi = {ns_shear_ratio:.3f} ({'PASS' if ns_shear_pass else 'FAIL'})\n"
-            self.summary_label.insert(
-                tk.END, ns_shear_line, "pass" if ns_shear_pass else "fail"
-            )
-
-            ns_snow_def_line = f'Snow Deflection: {ns_delta_snow_actual:.3f}"/{ns_delta_snow_limit:.3f}" = {ns_snow_def_ratio:.3f} ({"PASS" if ns_snow_pass else "FAIL"})\n'
-            self.summary_label.insert(
-                tk.END, ns_snow_def_line, "pass" if ns_snow_pass else "fail"
+                add((ns_status_line, "fail"))
+
+            add(_check_segment("Bending", ns_fb_actual, ns_fb_allowable, ns_bend_ratio))
+            add(_check_segment("Shear", ns_fv_actual, ns_fv_allowable, ns_shear_ratio))
+            add(
+                _check_segment(
+                    "Snow Deflection",
+                    ns_delta_snow_actual,
+                    ns_delta_snow_limit,
+                    ns_snow_def_ratio,
+                    "in",
+                )
             )
-
-            ns_total_def_line = f'Total Deflection: {ns_delta_total_actual:.3f}"/{ns_delta_total_limit:.3f}" = {ns_total_def_ratio:.3f} ({"PASS" if ns_total_pass else "FAIL"})\n'
-            self.summary_label.insert(
-                tk.END, ns_total_def_line, "pass" if ns_total_pass else "fail"
+            add(
+                _check_segment(
+                    "Total Deflection",
+                    ns_delta_total_actual,
+                    ns_delta_total_limit,
+                    ns_total_def_ratio,
+                    "in",
+                )
             )
         else:
-            ns_error_msg = (
-                ns_ridge_beam_results.get("error", "Unknown error")
-                if ns_ridge_beam_results
-                else "Calculation failed"
-            )
-            self.summary_label.insert(tk.END, f"ERROR: {ns_error_msg}\n", "fail")
+            add((f"ERROR: {ns_error_msg}\n", "fail"))
 
         if not overall_pass:
-            # Calculate suggestions based on material
-            selected_material = self.material_combobox.get()
-            if "Sawn Lumber" in selected_material:
-                common_widths = [1.5, 3.5, 5.5]  # single, double, triple 2x
-                common_depths = [7.25, 9.25, 11.25]  # 2x8, 2x10, 2x12 actual
-                ply_factor = 1.5  # 2x nominal = 1.5" actual per ply
-            elif "Glulam" in selected_material:
-                common_widths = [3.125, 3.5, 5.125, 5.5, 6.75, 8.75]
-                common_depths = [9, 10.5, 12, 13.5, 15, 16.5, 18, 19.5, 21, 22.5, 24]
-                ply_factor = 1.5  # approximate for glulam
-            else:  # LVL
-                common_widths = [1.75, 3.5, 5.25, 7.0]  # individual ply, 2, 3, 4 plies
-                common_depths = [9.25, 9.5, 11.25, 11.875, 14, 16, 18, 20, 24]
-                ply_factor = 1.75  # inches per ply for LVL
+            # Calculate suggestions based on material (LVL unless sawn or glulam)
+            material_key = next(
+                (key for key in _MATERIAL_TABLES if key in selected_material), "LVL"
+            )
+            common_widths, common_depths, ply_factor = _MATERIAL_TABLES[material_key]
 
             current_width = beam_width
             current_depth = beam_depth_trial
 
-            # Find next larger width
-            next_width = None
-            next_width_plies = None
-            for w in common_widths:
-                if w > current_width:
-                    next_width = w
-                    next_width_plies = round(w / ply_factor)
-                    break
-
-            # Find next larger depth
-            next_depth = None
-            for d in common_depths:
-                if d > current_depth:
-                    next_depth = d
-                    break
-
-            self.summary_label.insert(tk.END, "\nSuggestions:", "")
+            # Next larger stock width and depth (tables are sorted ascending)
+            i = bisect_right(common_widths, current_width)
+            next_width = common_widths[i] if i < len(common_widths) else None
+            next_width_plies = round(next_width / ply_factor) if next_width else None
+            i = bisect_right(common_depths, current_depth)
+            next_depth = common_depths[i] if i < len(common_depths) else None
+
+            add(("\nSuggestions:", ""))
             if next_width:
-                self.summary_label.insert(
-                    tk.END,
-                    f'\n- Increase width to {next_width:.3f}" ({next_width_plies} plies)',
-                    "",
+                add(
+                    (
+                        f'\n- Increase width to {next_width:.3f}" ({next_width_plies} plies)',
+                        "",
+                    )
                 )
             if next_depth:
-                self.summary_label.insert(
-                    tk.END, f'\n- Increase depth to {next_depth:.3f}"', ""
-                )
+                add((f'\n- Increase depth to {next_depth:.3f}"', ""))
+
+        # One insert for the whole summary: (text, tag) pairs flattened into
+        # Text.insert's chars/tags argument list
+        self.summary_label.insert(END, *[x for pair in segments for x in pair])
 
         # Make the text widget read-only again
         self.summary_label.config(state="disabled")
 
-        # Update canvas scroll region and scroll to summary
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.canvas.yview_moveto(0.3)  # Scroll to show summary
+        # Update canvas scroll region and scroll to summary once Tk is idle, so
+        # the bbox walk happens once after the inserts above have been laid out
+        self.canvas.after_idle(self._scroll_to_summary)
 
         # Use only detailed beam analysis in results (no summary duplication)
         beam_summary = create_beam_summary(beam_results, beam_inputs)
@@ -5621,368 +5720,194 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         )
 
         # Output - Restructured per user request
-        self.output_text.delete(1.0, tk.END)
+        self.output_text.delete(1.0, END)
 
-        # === REFERENCES AND METHODOLOGY ===
-        self.output_text.insert(tk.END, "=== REFERENCES AND METHODOLOGY ===\n\n")
-        self.output_text.insert(tk.END, "CALCULATION BASED ON:\n")
-        self.output_text.insert(
-            tk.END,
-            "• ASCE 7-22: Minimum Design Loads for Buildings and Other Structures\n",
-        )
-        self.output_text.insert(tk.END, "• Chapter 7: Snow Loads\n")
-        self.output_text.insert(
-            tk.END,
-            "• Ground snow loads from ASCE Design Ground Snow Load Geodatabase (2022-1.0)\n",
-        )
-        self.output_text.insert(
-            tk.END, "• Risk-targeted ground snow loads (pg) for Risk Categories I-IV\n"
-        )
-        self.output_text.insert(
-            tk.END, "• Winter wind parameter W2 (percent time wind >10 mph Oct-Apr)\n\n"
+        # Values quoted throughout the report, formatted once
+        pg_s, ps_s, gamma_s, cs_s = (
+            f"{pg:.1f}",
+            f"{ps:.1f}",
+            f"{gamma:.1f}",
+            f"{cs:.3f}",
         )
+        theta_n_s, theta_w_s = f"{theta_n:.1f}", f"{theta_w:.1f}"
 
-        self.output_text.insert(tk.END, "METHODOLOGY:\n")
-        self.output_text.insert(
-            tk.END,
-            "• Determine ground snow load pg from geodatabase based on site location\n",
-        )
-        self.output_text.insert(
-            tk.END,
-            "• Calculate flat roof snow load pf using exposure and thermal factors\n",
-        )
-        self.output_text.insert(
-            tk.END, "• Calculate sloped roof snow load ps using slope factor Cs\n"
-        )
-        self.output_text.insert(
-            tk.END, "• Apply minimum snow load pm for low-slope roofs (Sec. 7.3)\n"
-        )
-        self.output_text.insert(
-            tk.END,
-            "• Determine balanced vs unbalanced loads based on roof geometry (Sec. 7.6)\n\n",
-        )
+        # The report is collected by report() as runs of consecutive text
+        # sharing the same tags and written with a single Text.insert at the
+        # end instead of one Tcl round-trip per line
+        report_runs = []  # (tags, StringIO) per run
+
+        def report(chars, tags=""):
+            if not report_runs or report_runs[-1][0] != tags:
+                report_runs.append((tags, io.StringIO()))
+            report_runs[-1][1].write(chars)
+
+        # === REFERENCES AND METHODOLOGY ===
+        report(_REFERENCES_BLOCK)
 
         # === GROUND SNOW LOAD ===
-        self.output_text.insert(tk.END, "=== GROUND SNOW LOAD ===\n")
-        self.output_text.insert(tk.END, "ASCE 7-22 Section 7.2: Ground Snow Loads\n\n")
-        self.output_text.insert(
-            tk.END, f"pg = {pg} psf (from geodatabase based on site location)\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report(
+            "=== GROUND SNOW LOAD ===\n"
+            "ASCE 7-22 Section 7.2: Ground Snow Loads\n\n"
+            f"pg = {pg} psf (from geodatabase based on site location)\n"
             f"W2 = {w2} (Winter wind parameter - % time wind >10 mph Oct-Apr)\n\n",
         )
 
         # === FLAT ROOF SNOW LOAD ===
-        self.output_text.insert(tk.END, "=== FLAT ROOF SNOW LOAD ===\n")
-        self.output_text.insert(tk.END, "ASCE 7-22 Section 7.3.1 & Equation 7.3-1\n\n")
-        self.output_text.insert(tk.END, "pf = 0.7 × Ce × Ct × pg\n")
-        self.output_text.insert(tk.END, f"pf = 0.7 × {ce} × {ct} × {pg}\n")
-        self.output_text.insert(tk.END, f"pf = {pf:.1f} psf\n\n")
+        report(
+            "=== FLAT ROOF SNOW LOAD ===\n"
+            "ASCE 7-22 Section 7.3.1 & Equation 7.3-1\n\n"
+            "pf = 0.7 × Ce × Ct × pg\n"
+            f"pf = 0.7 × {ce} × {ct} × {pg}\n"
+            f"pf = {pf:.1f} psf\n\n",
+        )
 
         # === MINIMUM SNOW LOAD ===
-        self.output_text.insert(tk.END, "=== MINIMUM SNOW LOAD ===\n")
-        self.output_text.insert(tk.END, "ASCE 7-22 Section 7.3.3 & Equation 7.3-2\n\n")
-        self.output_text.insert(tk.END, "pm = 0.7 × Ce × Ct × pg × 0.6\n")
-        self.output_text.insert(tk.END, f"pm = 0.7 × {ce} × {ct} × {pg} × 0.6\n")
-        self.output_text.insert(tk.END, f"pm = {pm:.1f} psf\n\n")
+        report("=== MINIMUM SNOW LOAD ===\n")
+        report("ASCE 7-22 Section 7.3.3 & Equation 7.3-2\n\n")
+        report("pm = 0.7 × Ce × Ct × pg × 0.6\n")
+        report(f"pm = 0.7 × {ce} × {ct} × {pg} × 0.6\n")
+        report(f"pm = {pm:.1f} psf\n\n")
 
         # === SLOPED ROOF SNOW LOAD ===
-        self.output_text.insert(tk.END, "=== SLOPED ROOF SNOW LOAD ===\n")
-        self.output_text.insert(tk.END, "ASCE 7-22 Section 7.4.1 & Equation 7.4-1\n\n")
-        self.output_text.insert(tk.END, "ps = pf × Cs\n")
-        self.output_text.insert(tk.END, f"ps = {pf:.1f} × {cs:.3f}\n")
-        self.output_text.insert(tk.END, f"ps = {ps:.1f} psf\n\n")
+        report("=== SLOPED ROOF SNOW LOAD ===\n")
+        report("ASCE 7-22 Section 7.4.1 & Equation 7.4-1\n\n")
+        report("ps = pf × Cs\n")
+        report(f"ps = {pf:.1f} × {cs_s}\n")
+        report(f"ps = {ps_s} psf\n\n")
 
         # === LOAD DETERMINATIONS ===
-        self.output_text.insert(tk.END, "=== LOAD DETERMINATIONS ===\n")
-        self.output_text.insert(
-            tk.END, "ASCE 7-22 Section 7.3: Minimum Snow Load Check\n\n"
-        )
+        report("=== LOAD DETERMINATIONS ===\n")
+        report("ASCE 7-22 Section 7.3: Minimum Snow Load Check\n\n")
 
         # Roof slope analysis
-        self.output_text.insert(
-            tk.END,
-            f"Roof slopes: North = {pitch_n:.1f}/12 ({theta_n:.1f}°), West = {pitch_w:.1f}/12 ({theta_w:.1f}°)\n",
+        report(
+            f"Roof slopes: North = {pitch_n:.1f}/12 ({theta_n_s}°), West = {pitch_w:.1f}/12 ({theta_w_s}°)\n",
         )
-        self.output_text.insert(tk.END, f"Minimum slope = {min_slope_deg:.1f}°\n\n")
+        report(f"Minimum slope = {min_slope_deg:.1f}°\n\n")
 
         # Balanced vs Unbalanced Load Determination
-        self.output_text.insert(tk.END, "BALANCED vs UNBALANCED LOAD DETERMINATION:\n")
-        self.output_text.insert(
-            tk.END, "ASCE 7-22 Section 7.6.1: Unbalanced snow loads apply when:\n"
-        )
-        self.output_text.insert(
-            tk.END, "• Roof slope ≥ 2.38° (0.5/12) AND ≤ 30.2° (7/12)\n"
-        )
-        self.output_text.insert(tk.END, "• Outside this range: Balanced loads only\n\n")
+        report("BALANCED vs UNBALANCED LOAD DETERMINATION:\n")
+        report("ASCE 7-22 Section 7.6.1: Unbalanced snow loads apply when:\n")
+        report("• Roof slope ≥ 2.38° (0.5/12) AND ≤ 30.2° (7/12)\n")
+        report("• Outside this range: Balanced loads only\n\n")
 
         if low_slope:
-            self.output_text.insert(
-                tk.END, "✓ Slope < 15° → Minimum snow load pm applies\n"
-            )
-            self.output_text.insert(
-                tk.END,
-                f"Governing balanced load = max(ps, pm) = max({ps:.1f}, {pm:.1f}) = {governing_roof_load:.1f} psf\n\n",
+            report("✓ Slope < 15° → Minimum snow load pm applies\n")
+            report(
+                f"Governing balanced load = max(ps, pm) = max({ps_s}, {pm:.1f}) = {governing_roof_load:.1f} psf\n\n",
             )
         else:
-            self.output_text.insert(
-                tk.END, "✗ Slope ≥ 15° → Minimum snow load pm does not apply\n"
-            )
-            self.output_text.insert(
-                tk.END, f"Governing balanced load = ps = {ps:.1f} psf\n\n"
-            )
+            report("✗ Slope ≥ 15° → Minimum snow load pm does not apply\n")
+            report(f"Governing balanced load = ps = {ps_s} psf\n\n")
 
         # Check if unbalanced loads apply
-        unbalanced_applies = 2.38 <= min_slope_deg <= 30.2
         if unbalanced_applies:
-            self.output_text.insert(
-                tk.END,
+            report(
                 "✓ Roof slope in unbalanced range → Calculate unbalanced loads per Section 7.6\n\n",
             )
         else:
-            self.output_text.insert(
-                tk.END,
+            report(
                 "✗ Roof slope outside unbalanced range → Balanced loads only\n\n",
             )
-        self.output_text.insert(
-            tk.END, "pf = 0.7 × Ce × Ct × pg   (ASCE 7-22 Equation 7.3-1)\n"
-        )
-        self.output_text.insert(tk.END, "ps = pf × Cs   (ASCE 7-22 Equation 7.4-1)\n")
-        self.output_text.insert(
-            tk.END,
+        report("pf = 0.7 × Ce × Ct × pg   (ASCE 7-22 Equation 7.3-1)\n")
+        report("ps = pf × Cs   (ASCE 7-22 Equation 7.4-1)\n")
+        report(
             "Cs determined from Figure 7.4-1 based on Ct and surface type   (ASCE 7-22 Section 7.4.1)\n",
         )
-        self.output_text.insert(
-            tk.END, "γ = min(0.13 × pg + 14, 30) pcf   (ASCE 7-22 Equation 7.7-1)\n\n"
-        )
+        report("γ = min(0.13 × pg + 14, 30) pcf   (ASCE 7-22 Equation 7.7-1)\n\n")
 
         # Additional parameters for reference
         surface_type = "slippery" if slippery else "non-slippery"
-        self.output_text.insert(
-            tk.END,
-            f"Slope factors: Cs = {cs:.3f} (based on Ct = {ct} and {surface_type} surface per Figure 7.4-1)\n",
+        report(
+            f"Slope factors: Cs = {cs_s} (based on Ct = {ct} and {surface_type} surface per Figure 7.4-1)\n",
         )
-        self.output_text.insert(
-            tk.END,
-            f"Snow density: γ = min(0.13 × pg + 14, 30) = {gamma:.1f} pcf (Eq. 7.7-1)\n",
+        report(
+            f"Snow density: γ = min(0.13 × pg + 14, 30) = {gamma_s} pcf (Eq. 7.7-1)\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             f"Balanced snow height: hb = ps / γ = {hb:.2f} ft (Section 7.7.1)\n\n",
         )
 
         # === SECTION 7.6: UNBALANCED SNOW LOADS ===
-        self.output_text.insert(tk.END, "=== SECTION 7.6: UNBALANCED SNOW LOADS ===\n")
-        self.output_text.insert(
-            tk.END,
+        report(
+            "=== SECTION 7.6: UNBALANCED SNOW LOADS ===\n"
             "ASCE 7-22 Section 7.6.1: Unbalanced Snow Loads for Hip and Gable Roofs\n\n",
         )
 
-        min_slope = min(theta_n, theta_w)
-        # Optional debug output in results (uncomment if needed)
-        # self.output_text.insert(tk.END, f"DEBUG: theta_n = {theta_n:.2f}°, theta_w = {theta_w:.2f}°, min_slope = {min_slope:.2f}°\n")
-        if 2.38 <= min_slope <= 30.2:
-            self.output_text.insert(tk.END, "UNBALANCED LOAD APPLICABILITY:\n")
-            self.output_text.insert(
-                tk.END, f"Roof slope range check: 2.38° ≤ {min_slope:.1f}° ≤ 30.2° ✓\n"
+        # Only the applicable branch formats the methodology and wind analyses
+        if unbalanced_applies:
+            report(
+                "UNBALANCED LOAD APPLICABILITY:\n"
+                f"Roof slope range check: 2.38° ≤ {min_slope_deg:.1f}° ≤ 30.2° ✓\n"
+                "→ Unbalanced loads apply per Section 7.6.1\n\n"
+                "CALCULATION METHODOLOGY:\n"
+                "• Evaluate both North and West wind directions\n"
+                "• Use maximum loads from both directions (conservative approach)\n"
+                "• Windward span W = dimension perpendicular to ridge\n"
+                "• Narrow roof: W ≤ 20 ft (special case)\n"
+                "• Wide roof: W > 20 ft (standard unbalanced calculation)\n\n",
+            )
+            drift_args = dict(
+                ps=ps, pg=pg, w2=w2, gamma=gamma, pg_074=pg_074, w2_17=w2_17
+            )
+
+            # North and West wind analyses (same layout, swapped planes)
+            report(
+                _wind_direction_report(
+                    "North", "South", north_span, ps_north, S_n, sqrt_S_n, **drift_args
+                ),
             )
-            self.output_text.insert(
-                tk.END, "→ Unbalanced loads apply per Section 7.6.1\n\n"
+            report(
+                _wind_direction_report(
+                    "West", "East", ew_half_width, ps_west, S_w, sqrt_S_w, **drift_args
+                ),
             )
 
-            self.output_text.insert(tk.END, "CALCULATION METHODOLOGY:\n")
-            self.output_text.insert(
-                tk.END, "• Evaluate both North and West wind directions\n"
-            )
-            self.output_text.insert(
-                tk.END,
-                "• Use maximum loads from both directions (conservative approach)\n",
-            )
-            self.output_text.insert(
-                tk.END, "• Windward span W = dimension perpendicular to ridge\n"
-            )
-            self.output_text.insert(tk.END, "• Narrow roof: W ≤ 20 ft (special case)\n")
-            self.output_text.insert(
-                tk.END, "• Wide roof: W > 20 ft (standard unbalanced calculation)\n\n"
-            )
+            # Governing loads summary eliminated per user request
 
-            # North Wind Analysis
-            self.output_text.insert(tk.END, "NORTH WIND ANALYSIS:\n")
-            lu_north = north_span  # Fetch distance to north eave
-            is_narrow_north = lu_north <= 20
-            self.output_text.insert(
-                tk.END,
-                f"Fetch lu = {lu_north:.1f} ft ({'Narrow' if is_narrow_north else 'Wide'} roof)\n",
+        else:
+            report(
+                "NO UNBALANCED LOADS REQUIRED:\n"
+                f"Roof slope {min_slope_deg:.1f}° outside 2.38°-30.2° range\n"
+                "ASCE 7-22 Section 7.6.1: Balanced loads only\n"
+                f"Uniform balanced load: {ps_s} psf on all planes\n\n",
             )
 
-            if is_narrow_north:
-                self.output_text.insert(tk.END, "Narrow roof case (W ≤ 20 ft):\n")
-                self.output_text.insert(tk.END, "• Windward (North): 0 psf\n")
-                self.output_text.insert(
-                    tk.END, f"• Leeward (South): pg = {pg:.1f} psf\n"
-                )
-            else:
-                self.output_text.insert(tk.END, "Wide roof case (W > 20 ft):\n")
-                self.output_text.insert(tk.END, "• Windward (North): 0.3 × ps\n")
-                north_load_north = 0.3 * ps_north if ps_north > 0 else 0
-                self.output_text.insert(
-                    tk.END,
-                    f"• Windward (North): 0.3 × {ps_north:.1f} = {north_load_north:.1f} psf\n",
-                )
-
-                self.output_text.insert(tk.END, "• Leeward surcharge calculation:\n")
-                self.output_text.insert(
-                    tk.END, "  Fetch lu = distance from ridge to upwind eave\n"
-                )
-                lu_north = north_span
-                self.output_text.insert(tk.END, f"  lu = {lu_north:.1f} ft\n")
-                self.output_text.insert(
-                    tk.END,
-                    "  hd = 1.5 × √[(pg^0.74 × lu^0.70 × W2^1.7) / γ]  (Eq. 7.6-1)\n",
-                )
-                hd_calc_north = (pg**0.74 * lu_north**0.70 * w2**1.7) / gamma
-                hd_north = 1.5 * math.sqrt(hd_calc_north)
-                self.output_text.insert(
-                    tk.END,
-                    f"  hd = 1.5 × √[({pg}^{0.74} × {lu_north}^{0.70} × {w2}^{1.7}) / {gamma}] = {hd_north:.2f} ft\n",
-                )
-
-                self.output_text.insert(tk.END, "  pd = hd × γ / √S  (Eq. 7.6-2)\n")
-                surcharge_north = hd_north * gamma / math.sqrt(S_n)
-                self.output_text.insert(
-                    tk.END,
-                    f"  pd = {hd_north:.2f} × {gamma:.1f} / √{S_n:.2f} = {surcharge_north:.1f} psf\n",
-                )
-
-                south_load_north = ps + surcharge_north
-                self.output_text.insert(
-                    tk.END,
-                    f"• Leeward (South): ps + pd = {ps:.1f} + {surcharge_north:.1f} = {south_load_north:.1f} psf\n",
-                )
+        # Valley drift load calculations eliminated per user request
 
-                surcharge_width_north = (8 * hd_north * math.sqrt(S_n)) / 3
+        # Beam ASD formulas (no drift load)
+        report(
+            f"ASD Snow Load = 0.7 × ps per IBC/ASCE serviceability = 0.7 × {ps_s} = {0.7 * ps:.1f} psf\n",
+        )
+        report(f"Mu = maximum moment (exact point loads) = {mu_ftlb:.0f} ft-lb\n")
+        report(f"Vu = maximum shear = {vu_lb:.0f} lb\n\n")
 
-            self.output_text.insert(tk.END, "\n")
+        # References and methodology notes after unbalanced snow load cases eliminated per user request
 
-            # West Wind Analysis
-            self.output_text.insert(tk.END, "WEST WIND ANALYSIS:\n")
-            lu_west = ew_half_width  # Fetch distance to west eave
-            is_narrow_west = lu_west <= 20
-            self.output_text.insert(
-                tk.END,
-                f"Fetch lu = {lu_west:.1f} ft ({'Narrow' if is_narrow_west else 'Wide'} roof)\n",
+        report("\n=== UNBALANCED LOAD APPLICABILITY (Sec. 7.6.1) ===\n")
+        if unbalanced_applies_n:
+            report(
+                f"North roof plane (θ_n = {theta_n_s}°): Unbalanced loads APPLY\n",
             )
-
-            if is_narrow_west:
-                self.output_text.insert(tk.END, "Narrow roof case (W ≤ 20 ft):\n")
-                self.output_text.insert(tk.END, "• Windward (West): 0 psf\n")
-                self.output_text.insert(
-                    tk.END, f"• Leeward (East): pg = {pg:.1f} psf\n"
-                )
-            else:
-                self.output_text.insert(tk.END, "Wide roof case (W > 20 ft):\n")
-                self.output_text.insert(tk.END, "• Windward (West): 0.3 × ps\n")
-                west_load_west = 0.3 * ps_west if ps_west > 0 else 0
-                self.output_text.insert(
-                    tk.END,
-                    f"• Windward (West): 0.3 × {ps_west:.1f} = {west_load_west:.1f} psf\n",
-                )
-
-                self.output_text.insert(tk.END, "• Leeward surcharge calculation:\n")
-                self.output_text.insert(
-                    tk.END, "  Fetch lu = distance from ridge to upwind eave\n"
-                )
-                lu_west = ew_half_width
-                self.output_text.insert(tk.END, f"  lu = {lu_west:.1f} ft\n")
-                self.output_text.insert(
-                    tk.END,
-                    "  hd = 1.5 × √[(pg^0.74 × lu^0.70 × W2^1.7) / γ]  (Eq. 7.6-1)\n",
-                )
-                hd_calc_west = (pg**0.74 * lu_west**0.70 * w2**1.7) / gamma
-                hd_west = 1.5 * math.sqrt(hd_calc_west)
-                self.output_text.insert(
-                    tk.END,
-                    f"  hd = 1.5 × √[({pg}^{0.74} × {lu_west}^{0.70} × {w2}^{1.7}) / {gamma}] = {hd_west:.2f} ft\n",
-                )
-
-                self.output_text.insert(tk.END, "  pd = hd × γ / √S  (Eq. 7.6-2)\n")
-                surcharge_west = hd_west * gamma / math.sqrt(S_w)
-                self.output_text.insert(
-                    tk.END,
-                    f"  pd = {hd_west:.2f} × {gamma:.1f} / √{S_w:.2f} = {surcharge_west:.1f} psf\n",
-                )
-
-                east_load_west = ps + surcharge_west
-                self.output_text.insert(
-                    tk.END,
-                    f"• Leeward (East): ps + pd = {ps:.1f} + {surcharge_west:.1f} = {east_load_west:.1f} psf\n",
+            if narrow_roof_n:
+                report(
+                    f"   Narrow roof (de_north ≤ 20 ft): Leeward = pg = {pg_s} psf (windward unloaded)\n",
                 )
-
-                surcharge_width_west = (8 * hd_west * math.sqrt(S_w)) / 3
-
-            self.output_text.insert(tk.END, "\n")
-
-            # Governing loads summary eliminated per user request
-
         else:
-            self.output_text.insert(tk.END, "NO UNBALANCED LOADS REQUIRED:\n")
-            self.output_text.insert(
-                tk.END, f"Roof slope {min_slope:.1f}° outside 2.38°-30.2° range\n"
-            )
-            self.output_text.insert(
-                tk.END, "ASCE 7-22 Section 7.6.1: Balanced loads only\n"
-            )
-            self.output_text.insert(
-                tk.END, f"Uniform balanced load: {ps:.1f} psf on all planes\n\n"
-            )
-
-        # Valley drift load calculations eliminated per user request
-
-        # Beam ASD formulas (no drift load)
-        self.output_text.insert(
-            tk.END,
-            f"ASD Snow Load = 0.7 × ps per IBC/ASCE serviceability = 0.7 × {ps:.1f} = {0.7 * ps:.1f} psf\n",
-        )
-        self.output_text.insert(
-            tk.END, f"Mu = maximum moment (exact point loads) = {mu_ftlb:.0f} ft-lb\n"
-        )
-        self.output_text.insert(tk.END, f"Vu = maximum shear = {vu_lb:.0f} lb\n\n")
-
-        # References and methodology notes after unbalanced snow load cases eliminated per user request
-
-        self.output_text.insert(
-            tk.END, "\n=== UNBALANCED LOAD APPLICABILITY (Sec. 7.6.1) ===\n"
-        )
-        if unbalanced_applies_n:
-            self.output_text.insert(
-                tk.END,
-                f"North roof plane (θ_n = {theta_n:.1f}°): Unbalanced loads APPLY\n",
-            )
-            if narrow_roof_n:
-                self.output_text.insert(
-                    tk.END,
-                    f"   Narrow roof (de_north ≤ 20 ft): Leeward = pg = {pg:.1f} psf (windward unloaded)\n",
-                )
-        else:
-            self.output_text.insert(
-                tk.END,
-                f"North roof plane (θ_n = {theta_n:.1f}°): Unbalanced loads NOT required (slope outside 2.38°–30.2°)\n",
+            report(
+                f"North roof plane (θ_n = {theta_n_s}°): Unbalanced loads NOT required (slope outside 2.38°–30.2°)\n",
             )
         if unbalanced_applies_w:
-            self.output_text.insert(
-                tk.END,
-                f"West roof plane (θ_w = {theta_w:.1f}°): Unbalanced loads APPLY\n",
+            report(
+                f"West roof plane (θ_w = {theta_w_s}°): Unbalanced loads APPLY\n",
             )
             if narrow_roof_w:
-                self.output_text.insert(
-                    tk.END,
-                    f"   Narrow roof (de_west ≤ 20 ft): Leeward = pg = {pg:.1f} psf (windward unloaded)\n",
+                report(
+                    f"   Narrow roof (de_west ≤ 20 ft): Leeward = pg = {pg_s} psf (windward unloaded)\n",
                 )
         else:
-            self.output_text.insert(
-                tk.END,
-                f"West roof plane (θ_w = {theta_w:.1f}°): Unbalanced loads NOT required (slope outside 2.38°–30.2°)\n",
+            report(
+                f"West roof plane (θ_w = {theta_w_s}°): Unbalanced loads NOT required (slope outside 2.38°–30.2°)\n",
             )
         # Determine Figure 7.4-1 part and roof classification
         if ct == 1.1:
@@ -5994,411 +5919,279 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
         surface_type = "slippery" if slippery else "non-slippery"
         surface_type = "Slippery" if slippery else "Non-slippery"
-        self.output_text.insert(
-            tk.END,
+        report(
             f"Surface: {surface_type} (Cs from corresponding line in Figure 7.4-1)\n",
         )
-        self.output_text.insert(
-            tk.END,
-            f"Governing Slope Factor (Cs): {cs:.3f} (automatically calculated from Figure 7.4-1 based on Ct and surface)\n",
-        )
-        self.output_text.insert(tk.END, f"Sloped Roof Snow Load (ps): {ps:.1f} psf\n\n")
-        self.output_text.insert(tk.END, f"Valley horizontal length (lv): {lv:.2f} ft\n")
-        self.output_text.insert(tk.END, f"Valley rafter length: {rafter_len:.2f} ft\n")
-
-        self.output_text.insert(tk.END, "\n")
-        self.output_text.insert(
-            tk.END,
-            "=== ASCE 7-22 SECTION 7.6.1: UNBALANCED SNOW LOADS FOR HIP AND GABLE ROOFS ===\n",
+        report(
+            f"Governing Slope Factor (Cs): {cs_s} (automatically calculated from Figure 7.4-1 based on Ct and surface)\n",
+        )
+        report(f"Sloped Roof Snow Load (ps): {ps_s} psf\n\n")
+        report(f"Valley horizontal length (lv): {lv:.2f} ft\n")
+        report(f"Valley rafter length: {rafter_len:.2f} ft\n")
+
+        report("\n")
+        report(
+            "=== ASCE 7-22 SECTION 7.6.1: UNBALANCED SNOW LOADS FOR HIP AND GABLE ROOFS ===\n"
+            "[LOCATION: RESULTS - AFTER GEOMETRY CALCULATIONS]\n"
+            "Unbalanced snow loads (including valley drifts derived from them) are governed by Sec. 7.6.1.\n\n"
+            "APPLICABILITY:\n"
+            "• Unbalanced loads are REQUIRED only for roof slopes between 0.5/12 (≈2.38°) and 7/12 (≈30.2°).\n"
+            "• Outside this range: Unbalanced loads and associated drifts are NOT required.\n\n"
+            "SPECIAL NARROW ROOF CASE (eave-to-ridge distance W ≤ 20 ft AND simply supported prismatic members):\n"
+            "  → Leeward side: Full ground snow load pg (windward unloaded)\n"
+            "  → No separate drift surcharge calculated\n\n",
             "blue",
         )
-        self.output_text.insert(
-            tk.END, "[LOCATION: RESULTS - AFTER GEOMETRY CALCULATIONS]\n", "blue"
-        )
-        self.output_text.insert(
-            tk.END,
-            "Unbalanced snow loads (including valley drifts derived from them) are governed by Sec. 7.6.1.\n\n",
-            "blue",
-        )
-        self.output_text.insert(tk.END, "APPLICABILITY:\n", "blue")
-        self.output_text.insert(
-            tk.END,
-            "• Unbalanced loads are REQUIRED only for roof slopes between 0.5/12 (≈2.38°) and 7/12 (≈30.2°).\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "• Outside this range: Unbalanced loads and associated drifts are NOT required.\n\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "SPECIAL NARROW ROOF CASE (eave-to-ridge distance W ≤ 20 ft AND simply supported prismatic members):\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END,
-            "  → Leeward side: Full ground snow load pg (windward unloaded)\n",
-            "blue",
-        )
-        self.output_text.insert(
-            tk.END, "  → No separate drift surcharge calculated\n\n", "blue"
-        )
-        self.output_text.insert(
-            tk.END, f"North Roof Plane (θ_n = {theta_n:.1f}°): ", "blue"
-        )
-        self.output_text.insert(
-            tk.END,
+        report(f"North Roof Plane (θ_n = {theta_n_s}°): ", "blue")
+        report(
             "Unbalanced APPLIES"
             if unbalanced_applies_n
             else "Unbalanced NOT required (slope outside 2.38°–30.2°)",
             "blue",
         )
         if narrow_roof_n and unbalanced_applies_n:
-            self.output_text.insert(
-                tk.END, f" → Narrow roof: Leeward = pg = {pg:.1f} psf\n", "blue"
-            )
-        self.output_text.insert(tk.END, "\n", "blue")
-        self.output_text.insert(
-            tk.END, f"West Roof Plane (θ_w = {theta_w:.1f}°): ", "blue"
-        )
-        self.output_text.insert(
-            tk.END,
+            report(f" → Narrow roof: Leeward = pg = {pg_s} psf\n", "blue")
+        report("\n", "blue")
+        report(f"West Roof Plane (θ_w = {theta_w_s}°): ", "blue")
+        report(
             "Unbalanced APPLIES"
             if unbalanced_applies_w
             else "Unbalanced NOT required (slope outside 2.38°–30.2°)",
             "blue",
         )
         if narrow_roof_w and unbalanced_applies_w:
-            self.output_text.insert(
-                tk.END, f" → Narrow roof: Leeward = pg = {pg:.1f} psf\n", "blue"
-            )
-        self.output_text.insert(tk.END, "\n", "blue")
-        self.output_text.insert(
-            tk.END,
+            report(f" → Narrow roof: Leeward = pg = {pg_s} psf\n", "blue")
+        report("\n", "blue")
+        report(
             "If unbalanced loads do not apply on either plane, drift surcharge = 0.\n",
             "blue",
         )
 
         # === VALLEY RAFTER BEAM DESIGN ANALYSIS (FULL DEAD + SNOW LOADS) ===
-        self.output_text.insert(
-            tk.END, "\n============================================================\n"
-        )
-        self.output_text.insert(tk.END, "VALLEY RAFTER BEAM DESIGN ANALYSIS\n")
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(tk.END, f"Sloped Length: {rafter_len:.2f} ft\n")
-        self.output_text.insert(
-            tk.END,
+        report("\n============================================================\n")
+        report("VALLEY RAFTER BEAM DESIGN ANALYSIS\n")
+        report("------------------------------------------------------------\n")
+        report(f"Sloped Length: {rafter_len:.2f} ft\n")
+        report(
             f"Point Loads: {jacks_data['num_per_side']} locations (combined North + West, including full dead load + balanced snow + valley drift)\n",
         )
 
-        # Default roof dead load (from user input or default)
-        roof_dead_load_psf = self.get_float("dead_load_horizontal")
-        if roof_dead_load_psf is None:
-            roof_dead_load_psf = 15.0  # Default value
+        # Roof dead load (required input, already read above)
+        roof_dead_load_psf = dead_load_horizontal
 
         # Extract jack rafter data for detailed analysis
+        # j_n = North-South Valley Rafter: frames from Valley Beam to East-West Ridge
+        # j_w = East-West Valley Rafter: frames from Valley Beam to North-South Ridge
         spacing_along_ridge_ft = jack_spacing_inches / 12.0  # Convert to feet
-        combined_point_loads = []
-        distances_from_eave = []
+        jacks_n = jacks_data["jacks"]["north_side"]
+        jacks_w = jacks_data["jacks"]["west_side"]
+        # (j_n, j_w) full snow + dead load per jack, for the reaction tables
+        jack_totals = [
+            (j_n.total_snow_lb + j_n.dead_load_lb, j_w.total_snow_lb + j_w.dead_load_lb)
+            for j_n, j_w in zip(jacks_n, jacks_w)
+        ]
+        # Half reactions: the valley beam receives both, the ridge only j_w's
+        jack_reactions = [(t_n / 2, t_w / 2) for t_n, t_w in jack_totals]
+        valley_beam_loads = [r_n + r_w for r_n, r_w in jack_reactions]
+
+        # Per-jack tributary areas, dead loads and reactions (simply supported, so
+        # half the full load) as parallel lists; the loop below only formats them
+        trib_areas_n = [j.horiz_length_ft * spacing_along_ridge_ft for j in jacks_n]
+        trib_areas_w = [j.horiz_length_ft * spacing_along_ridge_ft for j in jacks_w]
+        dead_loads_n = [roof_dead_load_psf * area for area in trib_areas_n]
+        dead_loads_w = [roof_dead_load_psf * area for area in trib_areas_w]
+        rafter_reactions_n = [
+            (dl + j.total_snow_lb) / 2 for dl, j in zip(dead_loads_n, jacks_n)
+        ]
+        rafter_reactions_w = [
+            (dl + j.total_snow_lb) / 2 for dl, j in zip(dead_loads_w, jacks_w)
+        ]
+        combined_point_loads = [
+            r_n + r_w for r_n, r_w in zip(rafter_reactions_n, rafter_reactions_w)
+        ]
+        distances_from_eave = [j.location_from_eave_ft for j in jacks_n]
 
-        self.output_text.insert(tk.END, f"\nRoof Dead Load: {roof_dead_load_psf} psf\n")
-        self.output_text.insert(
-            tk.END, "\n=== JACK RAFTER POINT LOADS (Eave → Ridge) ===\n"
-        )
-        self.output_text.insert(
-            tk.END, f"Number of jacks per side: {jacks_data['num_per_side']}\n"
-        )
-        self.output_text.insert(
-            tk.END, f"Spacing along ridges: {jack_spacing_inches:.1f} inches o.c.\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report(f"\nRoof Dead Load: {roof_dead_load_psf} psf\n")
+        report("\n=== JACK RAFTER POINT LOADS (Eave → Ridge) ===\n")
+        report(f"Number of jacks per side: {jacks_data['num_per_side']}\n")
+        report(f"Spacing along ridges: {jack_spacing_inches:.1f} inches o.c.\n")
+        report(
             f"Spacing along valley: {jacks_data['spacing_along_valley_ft']*12:.1f} inches o.c.\n\n",
         )
 
-        for i in range(jacks_data["num_per_side"]):
-            # j_n = North-South Valley Rafter: frames from Valley Beam to East-West Ridge
-            # j_w = East-West Valley Rafter: frames from Valley Beam to North-South Ridge
-            j_n = jacks_data["jacks"]["north_side"][i]
-            j_w = jacks_data["jacks"]["west_side"][i]
-
-            # Tributary area calculations
-            trib_area_n = j_n["horiz_length_ft"] * spacing_along_ridge_ft
-            trib_area_w = j_w["horiz_length_ft"] * spacing_along_ridge_ft
-
-            # Dead loads
-            dl_n = roof_dead_load_psf * trib_area_n
-            dl_w = roof_dead_load_psf * trib_area_w
-            dl_n + dl_w
-
+        # One pass over the jacks fills both jack tables; the second is buffered
+        jack_summary = []
+        for i, (
+            j_n,
+            j_w,
+            trib_area_n,
+            trib_area_w,
+            dl_n,
+            dl_w,
+            reaction_n,
+            reaction_w,
+            combined_point,
+        ) in enumerate(
+            zip(
+                jacks_n,
+                jacks_w,
+                trib_areas_n,
+                trib_areas_w,
+                dead_loads_n,
+                dead_loads_w,
+                rafter_reactions_n,
+                rafter_reactions_w,
+                combined_point_loads,
+            )
+        ):
             # Snow loads (already calculated)
-            snow_n = j_n["total_snow_lb"]
-            snow_w = j_w["total_snow_lb"]
-            snow_n + snow_w
-
-            # Get surcharge and balanced load breakdown for verification
-            surcharge_n = j_n.get("surcharge_snow_lb", 0.0)
-            balanced_portion_n = j_n.get("balanced_snow_lb", 0.0)
-            surcharge_length_n = j_n.get("surcharge_length_ft", 0.0)
-            balanced_length_n = j_n.get("balanced_length_ft", j_n["horiz_length_ft"])
-            surcharge_psf_n = j_n.get("surcharge_psf", 0.0)
-            balanced_psf_n = j_n.get("balanced_psf", ps)
-
-            surcharge_w = j_w.get("surcharge_snow_lb", 0.0)
-            balanced_portion_w = j_w.get("balanced_snow_lb", 0.0)
-            surcharge_length_w = j_w.get("surcharge_length_ft", 0.0)
-            balanced_length_w = j_w.get("balanced_length_ft", j_w["horiz_length_ft"])
-            surcharge_psf_w = j_w.get("surcharge_psf", 0.0)
-            balanced_psf_w = j_w.get("balanced_psf", ps)
-
-            # Full loads and reactions
-            full_load_n = dl_n + snow_n
-            full_load_w = dl_w + snow_w
-            reaction_n = full_load_n / 2  # Simply supported
-            reaction_w = full_load_w / 2
-            combined_point = reaction_n + reaction_w
-
-            combined_point_loads.append(combined_point)
-            distances_from_eave.append(j_n.get("location_from_eave_ft", 0))
+            snow_n = j_n.total_snow_lb
+            snow_w = j_w.total_snow_lb
 
-            self.output_text.insert(
-                tk.END,
-                f"Jack {i+1} (from eave {j_n.get('location_from_eave_ft', 0):.2f} ft):\n",
-            )
-            self.output_text.insert(
-                tk.END,
+            pos_from_eave = j_n.location_from_eave_ft
+            report(f"Jack {i+1} (from eave {pos_from_eave:.2f} ft):\n")
+            report(
                 f"  North-South Rafter (Valley Beam → E-W Ridge):\n"
                 f"    Trib area: {trib_area_n:.1f} ft²\n"
-                f"    Load Distribution: surcharge zone {surcharge_length_n:.2f} ft @ {surcharge_psf_n:.1f} psf ({surcharge_n:.0f} lb), balanced zone {balanced_length_n:.2f} ft @ {balanced_psf_n:.1f} psf ({balanced_portion_n:.0f} lb)\n"
-                f"    DL: {dl_n:.0f} lb, Snow: {snow_n:.0f} lb (surcharge={surcharge_n:.0f} lb @ {surcharge_psf_n:.1f} psf + balanced={balanced_portion_n:.0f} lb @ {balanced_psf_n:.1f} psf + drift={j_n.get('drift_load_lb', 0):.0f} lb), Reaction: {reaction_n:.0f} lb\n",
+                f"    Load Distribution: surcharge zone {j_n.surcharge_length_ft:.2f} ft @ {j_n.surcharge_psf:.1f} psf ({j_n.surcharge_snow_lb:.0f} lb), balanced zone {j_n.balanced_length_ft:.2f} ft @ {j_n.balanced_psf:.1f} psf ({j_n.balanced_snow_lb:.0f} lb)\n"
+                f"    DL: {dl_n:.0f} lb, Snow: {snow_n:.0f} lb (surcharge={j_n.surcharge_snow_lb:.0f} lb @ {j_n.surcharge_psf:.1f} psf + balanced={j_n.balanced_snow_lb:.0f} lb @ {j_n.balanced_psf:.1f} psf + drift={j_n.drift_load_lb:.0f} lb), Reaction: {reaction_n:.0f} lb\n",
             )
-            self.output_text.insert(
-                tk.END,
+            report(
                 f"  East-West Rafter (Valley Beam → N-S Ridge):\n"
                 f"    Trib area: {trib_area_w:.1f} ft²\n"
-                f"    Load Distribution: surcharge zone {surcharge_length_w:.2f} ft @ {surcharge_psf_w:.1f} psf ({surcharge_w:.0f} lb), balanced zone {balanced_length_w:.2f} ft @ {balanced_psf_w:.1f} psf ({balanced_portion_w:.0f} lb)\n"
-                f"    DL: {dl_w:.0f} lb, Snow: {snow_w:.0f} lb (surcharge={surcharge_w:.0f} lb @ {surcharge_psf_w:.1f} psf + balanced={balanced_portion_w:.0f} lb @ {balanced_psf_w:.1f} psf + drift={j_w.get('drift_load_lb', 0):.0f} lb), Reaction: {reaction_w:.0f} lb\n",
+                f"    Load Distribution: surcharge zone {j_w.surcharge_length_ft:.2f} ft @ {j_w.surcharge_psf:.1f} psf ({j_w.surcharge_snow_lb:.0f} lb), balanced zone {j_w.balanced_length_ft:.2f} ft @ {j_w.balanced_psf:.1f} psf ({j_w.balanced_snow_lb:.0f} lb)\n"
+                f"    DL: {dl_w:.0f} lb, Snow: {snow_w:.0f} lb (surcharge={j_w.surcharge_snow_lb:.0f} lb @ {j_w.surcharge_psf:.1f} psf + balanced={j_w.balanced_snow_lb:.0f} lb @ {j_w.balanced_psf:.1f} psf + drift={j_w.drift_load_lb:.0f} lb), Reaction: {reaction_w:.0f} lb\n",
             )
-            self.output_text.insert(
-                tk.END, f"  Combined point load on valley: {combined_point:.0f} lb\n\n"
+            report(f"  Combined point load on valley: {combined_point:.0f} lb\n\n")
+
+            # Detailed per-jack entry for the summary table emitted after beam_summary
+            total_p = j_n.point_load_lb + j_w.point_load_lb
+            jack_summary.append(
+                f"Jack {i+1} (from eave {pos_from_eave:.2f} ft):\n"
+                f"  North-South Rafter (Valley Beam → E-W Ridge):\n"
+                f"    Length: sloped={j_n.sloped_length_ft:.2f} ft, horiz={j_n.horiz_length_ft:.2f} ft\n"
+                f"    Load Distribution:\n"
+                f"      Surcharge zone: {j_n.surcharge_length_ft:.2f} ft @ {j_n.surcharge_psf:.1f} psf (ps + surcharge) = {j_n.surcharge_snow_lb:.0f} lb\n"
+                f"      Balanced zone: {j_n.balanced_length_ft:.2f} ft @ {j_n.balanced_psf:.1f} psf (ps only) = {j_n.balanced_snow_lb:.0f} lb\n"
+                f"    Snow Loads: surcharge={j_n.surcharge_snow_lb:.0f} lb ({j_n.surcharge_psf:.1f} psf), balanced={j_n.balanced_snow_lb:.0f} lb ({j_n.balanced_psf:.1f} psf), drift={j_n.drift_load_lb:.0f} lb, total snow={j_n.total_snow_lb:.0f} lb\n"
+                f"    Dead Load: {j_n.dead_load_lb:.0f} lb\n"
+                f"    Full Load: {j_n.full_load_on_jack_lb:.0f} lb\n"
+                f"    Reaction to Valley Beam: {j_n.point_load_lb:.0f} lb\n"
+                f"  East-West Rafter (Valley Beam → N-S Ridge):\n"
+                f"    Length: sloped={j_w.sloped_length_ft:.2f} ft, horiz={j_w.horiz_length_ft:.2f} ft\n"
+                f"    Load Distribution:\n"
+                f"      Surcharge zone: {j_w.surcharge_length_ft:.2f} ft @ {j_w.surcharge_psf:.1f} psf (ps + surcharge) = {j_w.surcharge_snow_lb:.0f} lb\n"
+                f"      Balanced zone: {j_w.balanced_length_ft:.2f} ft @ {j_w.balanced_psf:.1f} psf (ps only) = {j_w.balanced_snow_lb:.0f} lb\n"
+                f"    Snow Loads: surcharge={j_w.surcharge_snow_lb:.0f} lb ({j_w.surcharge_psf:.1f} psf), balanced={j_w.balanced_snow_lb:.0f} lb ({j_w.balanced_psf:.1f} psf), drift={j_w.drift_load_lb:.0f} lb, total snow={j_w.total_snow_lb:.0f} lb\n"
+                f"    Dead Load: {j_w.dead_load_lb:.0f} lb\n"
+                f"    Full Load: {j_w.full_load_on_jack_lb:.0f} lb\n"
+                f"    Reaction to Valley Beam: {j_w.point_load_lb:.0f} lb\n"
+                f"  Combined point load at location: {total_p:.0f} lb\n\n"
             )
 
-        # Valley rafter equilibrium
-        total_load = sum(combined_point_loads)
-        moment_about_eave = sum(
-            load * dist for load, dist in zip(combined_point_loads, distances_from_eave)
-        )
-        reaction_ridge = moment_about_eave / rafter_len
-        reaction_eave = total_load - reaction_ridge
-
-        # Calculate max moment and shear
-        max_moment = 0.0
-        max_shear = reaction_eave
-        current_shear = reaction_eave
-        current_moment = 0.0
-        prev_dist = 0.0
-
-        for dist, load in zip(distances_from_eave, combined_point_loads):
-            delta = dist - prev_dist
-            current_moment += current_shear * delta
-            max_moment = max(max_moment, current_moment)
-            current_shear -= load
-            max_shear = max(max_shear, abs(current_shear))
-            prev_dist = dist
-
-        # Final segment to ridge
-        delta = rafter_len - prev_dist
-        current_moment += current_shear * delta
-        max_moment = max(max_moment, current_moment)
+        # Valley rafter equilibrium, max moment and shear
+        total_load, reaction_eave, reaction_ridge, shears, moments = _beam_equilibrium(
+            distances_from_eave, combined_point_loads, rafter_len
+        )
+        max_moment = max(moments)
+        max_shear = max([reaction_eave] + [abs(v) for v in shears[1:]])
 
-        self.output_text.insert(
-            tk.END,
+        report(
             f"Valley Rafter Reactions: {reaction_eave:.0f} lb @ eave, {reaction_ridge:.0f} lb @ ridge\n",
         )
-        self.output_text.insert(tk.END, f"Maximum Moment: {max_moment:.0f} ft-lb\n")
-        self.output_text.insert(tk.END, f"Maximum Shear: {max_shear:.0f} lb\n")
-        self.output_text.insert(tk.END, f"Total Load: {total_load:.0f} lb\n")
-        self.output_text.insert(
-            tk.END,
+        report(f"Maximum Moment: {max_moment:.0f} ft-lb\n")
+        report(f"Maximum Shear: {max_shear:.0f} lb\n")
+        report(f"Total Load: {total_load:.0f} lb\n")
+        report(
             "Note: Loads include full dead load + full snow (balanced + valley drift). Reactions verified by equilibrium.\n\n",
         )
 
         # Add to output
-        self.output_text.insert(tk.END, beam_summary)
+        report(beam_summary)
 
         # Display jack rafter summary in results
-        self.output_text.insert(
-            tk.END, "\n=== JACK RAFTER POINT LOADS (Eave → Ridge) ===\n"
-        )
-        self.output_text.insert(
-            tk.END, f"Number of jacks per side: {jacks_data['num_per_side']}\n"
-        )
-        self.output_text.insert(
-            tk.END, f"Spacing along ridges: {jack_spacing_inches} inches o.c.\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("\n=== JACK RAFTER POINT LOADS (Eave → Ridge) ===\n")
+        report(f"Number of jacks per side: {jacks_data['num_per_side']}\n")
+        report(f"Spacing along ridges: {jack_spacing_inches} inches o.c.\n")
+        report(
             f"Spacing along valley: {jacks_data['spacing_along_valley_ft']*12:.1f} inches o.c.\n\n",
         )
 
-        for i in range(jacks_data["num_per_side"]):
-            # j_n = North-South Valley Rafter: frames from Valley Beam to East-West Ridge
-            # j_w = East-West Valley Rafter: frames from Valley Beam to North-South Ridge
-            j_n = jacks_data["jacks"]["north_side"][i]
-            j_w = jacks_data["jacks"]["west_side"][i]
-            total_p = j_n["point_load_lb"] + j_w["point_load_lb"]
-            pos_from_eave = j_n.get("location_from_eave_ft", "N/A")
-
-            # Get surcharge and balanced load breakdown
-            surcharge_n = j_n.get("surcharge_snow_lb", 0.0)
-            balanced_portion_n = j_n.get("balanced_snow_lb", 0.0)
-            surcharge_length_n = j_n.get("surcharge_length_ft", 0.0)
-            balanced_length_n = j_n.get("balanced_length_ft", j_n["horiz_length_ft"])
-            surcharge_psf_n = j_n.get("surcharge_psf", 0.0)
-            balanced_psf_n = j_n.get("balanced_psf", ps)
-
-            surcharge_w = j_w.get("surcharge_snow_lb", 0.0)
-            balanced_portion_w = j_w.get("balanced_snow_lb", 0.0)
-            surcharge_length_w = j_w.get("surcharge_length_ft", 0.0)
-            balanced_length_w = j_w.get("balanced_length_ft", j_w["horiz_length_ft"])
-            surcharge_psf_w = j_w.get("surcharge_psf", 0.0)
-            balanced_psf_w = j_w.get("balanced_psf", ps)
-
-            self.output_text.insert(
-                tk.END,
-                f"Jack {i+1} (from eave {pos_from_eave:.2f} ft):\n"
-                f"  North-South Rafter (Valley Beam → E-W Ridge):\n"
-                f"    Length: sloped={j_n['sloped_length_ft']:.2f} ft, horiz={j_n['horiz_length_ft']:.2f} ft\n"
-                f"    Load Distribution:\n"
-                f"      Surcharge zone: {surcharge_length_n:.2f} ft @ {surcharge_psf_n:.1f} psf (ps + surcharge) = {surcharge_n:.0f} lb\n"
-                f"      Balanced zone: {balanced_length_n:.2f} ft @ {balanced_psf_n:.1f} psf (ps only) = {balanced_portion_n:.0f} lb\n"
-                f"    Snow Loads: surcharge={surcharge_n:.0f} lb ({surcharge_psf_n:.1f} psf), balanced={balanced_portion_n:.0f} lb ({balanced_psf_n:.1f} psf), drift={j_n['drift_load_lb']:.0f} lb, total snow={j_n['total_snow_lb']:.0f} lb\n"
-                f"    Dead Load: {j_n['dead_load_lb']:.0f} lb\n"
-                f"    Full Load: {j_n['full_load_on_jack_lb']:.0f} lb\n"
-                f"    Reaction to Valley Beam: {j_n['point_load_lb']:.0f} lb\n"
-                f"  East-West Rafter (Valley Beam → N-S Ridge):\n"
-                f"    Length: sloped={j_w['sloped_length_ft']:.2f} ft, horiz={j_w['horiz_length_ft']:.2f} ft\n"
-                f"    Load Distribution:\n"
-                f"      Surcharge zone: {surcharge_length_w:.2f} ft @ {surcharge_psf_w:.1f} psf (ps + surcharge) = {surcharge_w:.0f} lb\n"
-                f"      Balanced zone: {balanced_length_w:.2f} ft @ {balanced_psf_w:.1f} psf (ps only) = {balanced_portion_w:.0f} lb\n"
-                f"    Snow Loads: surcharge={surcharge_w:.0f} lb ({surcharge_psf_w:.1f} psf), balanced={balanced_portion_w:.0f} lb ({balanced_psf_w:.1f} psf), drift={j_w['drift_load_lb']:.0f} lb, total snow={j_w['total_snow_lb']:.0f} lb\n"
-                f"    Dead Load: {j_w['dead_load_lb']:.0f} lb\n"
-                f"    Full Load: {j_w['full_load_on_jack_lb']:.0f} lb\n"
-                f"    Reaction to Valley Beam: {j_w['point_load_lb']:.0f} lb\n"
-                f"  Combined point load at location: {total_p:.0f} lb\n\n",
-            )
+        report("".join(jack_summary))
 
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: Point loads are reactions (half-span) assuming simply supported jack at ridge.\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: Load Distribution Explanation:\n"
             "  - Surcharge zone: Within surcharge width, load = balanced (ps) + surcharge (pd)\n"
             "  - Balanced zone: After surcharge width, load = balanced (ps) only\n"
             "  - Each jack rafter's length is divided into surcharge and balanced portions\n"
             "  - Reaction is calculated based on the total distributed load along the jack rafter\n\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: Drift load is higher at the ridge (higher pd intensity), but jack rafters are shorter there. Point loads may be higher at eave due to longer lengths despite lower drift. This is correct per ASCE 7-22 drift taper and framing geometry.\n\n",
         )
 
         # === VALLEY RAFTER REACTION VERIFICATION (STATIC EQUILIBRIUM CHECK) ===
-        self.output_text.insert(
-            tk.END, "============================================================\n"
-        )
-        self.output_text.insert(tk.END, "VALLEY RAFTER END REACTION VERIFICATION\n")
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("============================================================\n")
+        report("VALLEY RAFTER END REACTION VERIFICATION\n")
+        report("------------------------------------------------------------\n")
+        report(
             "Using jack rafter combined point loads and distances to independently verify reactions via equilibrium.\n\n",
         )
 
-        # Extract data from jacks_data for verification
-        distances_from_eave = []
-        point_loads_combined = []
-
-        for i in range(jacks_data["num_per_side"]):
-            j_n = jacks_data["jacks"]["north_side"][i]
-            j_w = jacks_data["jacks"]["west_side"][i]
-            pos_from_eave = j_n.get("location_from_eave_ft", 0)
-            total_p = j_n["point_load_lb"] + j_w["point_load_lb"]
-
-            distances_from_eave.append(pos_from_eave)
-            point_loads_combined.append(total_p)
+        # Point loads for verification, at the distances_from_eave used above
+        point_loads_combined = [
+            j_n.point_load_lb + j_w.point_load_lb for j_n, j_w in zip(jacks_n, jacks_w)
+        ]
 
         L_valley_sloped = rafter_len  # Valley rafter length
 
         # Step 1: Total downward load
         total_downward = sum(point_loads_combined)
-        self.output_text.insert(
-            tk.END,
+        report(
             f"Total downward load from {len(point_loads_combined)} point loads: {total_downward} lb\n",
         )
 
         # Step 2: Moment about eave end
-        moment_about_eave = sum(
-            load * dist for load, dist in zip(point_loads_combined, distances_from_eave)
-        )
-        self.output_text.insert(
-            tk.END, f"Moment about eave: {moment_about_eave:.0f} ft-lb\n"
-        )
+        moment_about_eave = sum(map(mul, point_loads_combined, distances_from_eave))
+        report(f"Moment about eave: {moment_about_eave:.0f} ft-lb\n")
 
         # Step 3: Reaction at ridge
         reaction_ridge = moment_about_eave / L_valley_sloped
-        self.output_text.insert(
-            tk.END, f"Calculated reaction at ridge: {reaction_ridge:.0f} lb (upward)\n"
-        )
+        report(f"Calculated reaction at ridge: {reaction_ridge:.0f} lb (upward)\n")
 
         # Step 4: Reaction at eave
         reaction_eave = total_downward - reaction_ridge
-        self.output_text.insert(
-            tk.END, f"Calculated reaction at eave: {reaction_eave:.0f} lb (upward)\n"
-        )
+        report(f"Calculated reaction at eave: {reaction_eave:.0f} lb (upward)\n")
 
         # Step 5: Verification check
         sum_reactions = reaction_eave + reaction_ridge
         if abs(sum_reactions - total_downward) < 10:  # tolerance for rounding
-            self.output_text.insert(
-                tk.END,
+            report(
                 f"Verification: Reactions sum ({sum_reactions:.0f} lb) matches total load ({total_downward} lb) — EQUILIBRIUM SATISFIED\n",
             )
         else:
-            self.output_text.insert(
-                tk.END,
+            report(
                 f"Verification: DISCREPANCY — Reactions sum {sum_reactions:.0f} lb vs total load {total_downward} lb\n",
             )
 
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: These reactions are independently derived for shear/moment diagram use. Max shear ≈ eave reaction.\n\n",
         )
 
         # === VALLEY RAFTER ASD ANALYSIS (D + 0.7S FOR STRESS CHECKS) ===
-        self.output_text.insert(
-            tk.END, "============================================================\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("============================================================\n")
+        report(
             "VALLEY RAFTER ASD LOAD COMBINATION: DEAD + 0.7 SNOW (STRESS CHECKS)\n",
         )
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("------------------------------------------------------------\n")
+        report(
             "Per ASCE 7-22 Sec. 2.4.1: Ultimate snow scaled by 0.7 for ASD service-level equivalent.\n",
         )
-        self.output_text.insert(tk.END, f"Sloped Beam Length: {rafter_len:.2f} ft\n")
-        self.output_text.insert(
-            tk.END,
+        report(f"Sloped Beam Length: {rafter_len:.2f} ft\n")
+        report(
             "Jack reactions calculated as half tributary load (uniform on horizontal projection for snow).\n\n",
         )
 
@@ -6407,19 +6200,11 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
         if roof_dead_load_psf is None:
             roof_dead_load_psf = 15.0  # Default value
 
-        # Extract horizontal jack lengths (reverse order for eave to ridge)
-        horiz_jack_full = []
-        distances_from_eave = []
-
-        for i in range(jacks_data["num_per_side"]):
-            j_n = jacks_data["jacks"]["north_side"][i]
-            horiz_full = j_n["horiz_length_ft"] * 2  # Full horizontal span
-            horiz_jack_full.append(horiz_full)
-            distances_from_eave.append(j_n.get("location_from_eave_ft", 0))
-
-        # Reverse to eave to ridge order
-        horiz_jack_full.reverse()
-        distances_from_eave.sort()
+        # Horizontal jack lengths and snow, reversed from the jack list order,
+        # against the same eave distances (the jacks run eave to ridge, so
+        # those are already ascending)
+        jacks_reversed = jacks_n[::-1]
+        horiz_jack_full = [j.horiz_length_ft * 2 for j in jacks_reversed]
 
         # Spacing along ridge
         spacing_ridge = jacks_data.get(
@@ -6428,459 +6213,330 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
 
         # Calculate average height for sloped jack length approximation
         avg_pitch = (pitch_n + pitch_w) / 2
-        h_avg = math.tan(math.atan(avg_pitch / 12)) * (
-            sum(horiz_jack_full) / len(horiz_jack_full)
-        )
-
-        # Extract snow values from jacks_data
-        balanced_one_side = []
-        drift_one_side = []
-
-        for i in range(jacks_data["num_per_side"]):
-            # j_n = North-South Valley Rafter: frames from Valley Beam to East-West Ridge
-            j_n = jacks_data["jacks"]["north_side"][i]
-            balanced_one_side.append(j_n["balanced_snow_lb"])
-            drift_one_side.append(j_n["drift_load_lb"])
-
-        # Reverse to match eave to ridge order
-        balanced_one_side.reverse()
-        drift_one_side.reverse()
-
-        snow_one_side_full = [b + d for b, d in zip(balanced_one_side, drift_one_side)]
-
-        # ASD snow one side = 0.7 * full snow
-        asd_snow_one_side = [0.7 * s for s in snow_one_side_full]
-
-        # DL one side: based on sloped area
-        sloped_jack = [math.sqrt(h**2 + h_avg**2) for h in horiz_jack_full]
-        trib_area_sloped_one_side = [s * spacing_ridge for s in sloped_jack]
-        dl_one_side = [roof_dead_load_psf * a for a in trib_area_sloped_one_side]
-
-        # ASD full one side = DL + ASD snow
-        asd_full_one_side = [
-            dl + asd_s for dl, asd_s in zip(dl_one_side, asd_snow_one_side)
+        h_avg = (avg_pitch / 12) * (sum(horiz_jack_full) / len(horiz_jack_full))
+
+        # Combined ASD point load on valley = 2 × (half of DL on the sloped jack
+        # area + 0.7 × full snow), one pass over the jacks
+        asd_point_loads = [
+            roof_dead_load_psf * (math.hypot(h, h_avg) * spacing_ridge)
+            + 0.7 * (j.balanced_snow_lb + j.drift_load_lb)
+            for h, j in zip(horiz_jack_full, jacks_reversed)
         ]
 
-        # ASD jack reaction one side = half ASD full
-        asd_reaction_one_side = [f / 2 for f in asd_full_one_side]
-
-        # Combined ASD point load on valley = 2 * reaction one side (North + West)
-        asd_point_loads = [2 * r for r in asd_reaction_one_side]
-
         L = rafter_len
 
-        # Equilibrium for ASD
-        total_asd = sum(asd_point_loads)
-        moment_about_eave = sum(
-            p * d for p, d in zip(asd_point_loads, distances_from_eave)
+        # Equilibrium for ASD and traverse for max shear/moment (positive sagging)
+        _, reaction_eave, reaction_ridge, shear_values, moment_values = (
+            _beam_equilibrium(distances_from_eave, asd_point_loads, L)
         )
-        reaction_ridge = moment_about_eave / L
-        reaction_eave = total_asd - reaction_ridge
-
-        # Traverse for max ASD shear/moment (corrected for positive sagging moment)
-        max_moment = 0.0
-        max_shear = abs(reaction_eave)  # absolute max shear
-        current_shear = reaction_eave  # positive at eave
-        current_moment = 0.0
-        prev_dist = 0.0
-
-        shear_values = [current_shear]  # for optional detailed output
-        moment_values = [0.0]
-
-        for dist, load in zip(distances_from_eave, asd_point_loads):
-            delta = dist - prev_dist
-            # Moment increment = shear * delta (trapezoidal, but linear between points)
-            current_moment += current_shear * delta
-            moment_values.append(current_moment)
-            max_moment = max(max_moment, current_moment)  # positive sagging
-
-            current_shear -= load
-            shear_values.append(current_shear)
-            max_shear = max(max_shear, abs(current_shear))
-
-            prev_dist = dist
-
-        # Final segment to ridge
-        delta = L - prev_dist
-        current_moment += current_shear * delta
-        moment_values.append(current_moment)
-        max_moment = max(max_moment, current_moment)  # should be near 0
+        current_moment = moment_values[-1]  # at the ridge, should be near 0
+        max_moment = max(moment_values)  # positive sagging
+        max_shear = max(abs(v) for v in shear_values)  # absolute max shear
 
         # Ensure final moment ~0 (rounding tolerance)
         if abs(current_moment) > 10:
-            self.output_text.insert(
-                tk.END,
+            report(
                 "Warning: Final moment not zero — check equilibrium (rounding error possible)\n",
             )
 
         # Output updated max (positive)
-        self.output_text.insert(
-            tk.END, f"Max ASD Moment (positive sagging): {max_moment:.0f} ft-lb\n"
-        )
+        report(f"Max ASD Moment (positive sagging): {max_moment:.0f} ft-lb\n")
 
         # Updated text diagrams with positive moment
-        self.output_text.insert(
-            tk.END, "\n=== ASD SHEAR FORCE DIAGRAM (Sloped Valley Beam) ===\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("\n=== ASD SHEAR FORCE DIAGRAM (Sloped Valley Beam) ===\n")
+        report(
             f"Eave reaction: +{reaction_eave:.0f} lb (upward) → initial shear +{reaction_eave:.0f} lb\n",
         )
-        self.output_text.insert(
-            tk.END, "Shear decreases with each downward ASD point load\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("Shear decreases with each downward ASD point load\n")
+        report(
             "Crosses zero mid-span, ends just left of ridge at -{reaction_ridge:.0f} lb\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             f"Ridge reaction: +{reaction_ridge:.0f} lb (upward) → shear back to 0\n",
         )
-        self.output_text.insert(tk.END, f"Max |shear| = {max_shear:.0f} lb\n\n")
+        report(f"Max |shear| = {max_shear:.0f} lb\n\n")
 
-        self.output_text.insert(
-            tk.END, "=== ASD BENDING MOMENT DIAGRAM (Sloped Valley Beam) ===\n"
-        )
-        self.output_text.insert(tk.END, "Moment starts at 0 at eave\n")
-        self.output_text.insert(
-            tk.END, "Increases positively (sagging) due to gravity loads\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("=== ASD BENDING MOMENT DIAGRAM (Sloped Valley Beam) ===\n")
+        report("Moment starts at 0 at eave\n")
+        report("Increases positively (sagging) due to gravity loads\n")
+        report(
             f"Peaks at +{max_moment:.0f} ft-lb (positive sagging, typically 9-12 ft from eave)\n",
         )
-        self.output_text.insert(tk.END, "Decreases to 0 at ridge\n")
-        self.output_text.insert(
-            tk.END, "NO NEGATIVE MOMENT for this simply supported gravity-loaded beam\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("Decreases to 0 at ridge\n")
+        report("NO NEGATIVE MOMENT for this simply supported gravity-loaded beam\n")
+        report(
             "Shape: Polygonal curve, convex upward (positive throughout interior)\n",
         )
 
         # Detailed values for verification
-        self.output_text.insert(tk.END, "\nDetailed values for verification:\n")
-        distances_all = [0] + distances_from_eave + [L]
-        moments_all = moment_values + [current_moment]
-        shears_all = shear_values + [0]  # Final shear = 0 due to ridge reaction
-
-        for i, (dist, m, v) in enumerate(zip(distances_all, moments_all, shears_all)):
-            self.output_text.insert(
-                tk.END,
-                f"At {dist:.2f} ft: Moment = {m:.0f} ft-lb, Shear = {v:.0f} lb\n",
-            )
+        # One row per station of the sweep: eave, each load, ridge (where the
+        # ridge reaction brings the shear back to 0)
+        report("\nDetailed values for verification:\n")
+        report(
+            "".join(
+                f"At {dist:.2f} ft: Moment = {m:.0f} ft-lb, Shear = {v:.0f} lb\n"
+                for dist, m, v in zip(
+                    chain((0,), distances_from_eave, (L,)),
+                    moment_values,
+                    chain(shear_values, (0,)),
+                )
+            ),
+        )
 
-        self.output_text.insert(tk.END, "\n")
+        report("\n")
 
         # === JACK RAFTER REACTION COMPARISON TABLE ===
-        self.output_text.insert(
-            tk.END, "\n============================================================\n"
-        )
-        self.output_text.insert(tk.END, "JACK RAFTER REACTION COMPARISON TABLE\n")
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("\n============================================================\n")
+        report("JACK RAFTER REACTION COMPARISON TABLE\n")
+        report("------------------------------------------------------------\n")
+        report(
             "Comparison of reactions at each jack rafter location (0, 2, 4, 6, 8, 10, 12, 14 ft)\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: Each jack rafter reaction is one half the total load at that location.\n",
         )
-        self.output_text.insert(
-            tk.END, "j_n reaction goes to Valley Beam (half) and E-W Ridge (half)\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("j_n reaction goes to Valley Beam (half) and E-W Ridge (half)\n")
+        report(
             "j_w reaction goes to Valley Beam (half) and N-S Ridge Beam (half)\n\n",
         )
 
         # Create detailed jack rafter reaction table
-        if hasattr(self, "valley_beam_positions") and jacks_data:
-            self.output_text.insert(
-                tk.END,
-                f"{'Position':<12} {'j_n Total':<15} {'j_w Total':<15} {'j_n Reaction':<18} {'j_w Reaction':<18} {'Valley Beam':<18} {'Ridge Beam':<18}\n",
+        if jacks_data:
+            report(
+                _JACK_TABLE_HEADER.format(
+                    "Position",
+                    "j_n Total",
+                    "j_w Total",
+                    "j_n Reaction",
+                    "j_w Reaction",
+                    "Valley Beam",
+                    "Ridge Beam",
+                )
+                + _JACK_TABLE_HEADER.format(
+                    "(ft)",
+                    "(lb)",
+                    "(lb)",
+                    "(lb, j_n/2)",
+                    "(lb, j_w/2)",
+                    "(lb, j_n/2+j_w/2)",
+                    "(lb, j_w/2)",
+                ),
             )
-            self.output_text.insert(
-                tk.END,
-                f"{'(ft)':<12} {'(lb)':<15} {'(lb)':<15} {'(lb, j_n/2)':<18} {'(lb, j_w/2)':<18} {'(lb, j_n/2+j_w/2)':<18} {'(lb, j_w/2)':<18}\n",
+            report("-" * 114 + "\n")
+
+            # Rows at a fixed 2-foot spacing: 0, 2, 4, 6, 8, ...
+            report(
+                "".join(
+                    _JACK_TABLE_ROW.format(
+                        i * 2.0,
+                        j_n_total,
+                        j_w_total,
+                        j_n_reaction,
+                        j_w_reaction,
+                        valley_load,
+                        j_w_reaction,
+                    )
+                    for i, (
+                        (j_n_total, j_w_total),
+                        (j_n_reaction, j_w_reaction),
+                        valley_load,
+                    ) in enumerate(zip(jack_totals, jack_reactions, valley_beam_loads))
+                ),
             )
-            self.output_text.insert(tk.END, "-" * 114 + "\n")
-
-            # Get jack rafter data and create fixed 2-foot spacing positions
-            num_jacks = len(jacks_data["jacks"]["north_side"])
-            fixed_positions = [
-                i * 2.0 for i in range(num_jacks)
-            ]  # 0, 2, 4, 6, 8, 10, 12, 14...
-
-            for i, (j_n, j_w) in enumerate(
-                zip(jacks_data["jacks"]["north_side"], jacks_data["jacks"]["west_side"])
-            ):
-                pos = fixed_positions[i] if i < len(fixed_positions) else i * 2.0
-
-                j_n_total = j_n["total_snow_lb"] + j_n["dead_load_lb"]
-                j_w_total = j_w["total_snow_lb"] + j_w["dead_load_lb"]
-
-                j_n_reaction = j_n_total / 2  # Half reaction
-                j_w_reaction = j_w_total / 2  # Half reaction
 
-                valley_beam_load = (
-                    j_n_reaction + j_w_reaction
-                )  # Valley receives both reactions
-                ridge_beam_load = j_w_reaction  # Ridge receives only j_w reaction
-
-                self.output_text.insert(
-                    tk.END,
-                    f"{pos:<12.1f} {j_n_total:<15.0f} {j_w_total:<15.0f} {j_n_reaction:<18.0f} {j_w_reaction:<18.0f} {valley_beam_load:<18.0f} {ridge_beam_load:<18.0f}\n",
-                )
-
-            self.output_text.insert(tk.END, "-" * 114 + "\n")
-            self.output_text.insert(tk.END, "\n")
+            report("-" * 114 + "\n")
+            report("\n")
 
         # === REACTION COMPARISON TABLE ===
-        self.output_text.insert(
-            tk.END, "\n============================================================\n"
-        )
-        self.output_text.insert(tk.END, "REACTION COMPARISON TABLE\n")
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("\n============================================================\n")
+        report("REACTION COMPARISON TABLE\n")
+        report("------------------------------------------------------------\n")
+        report(
             "Comparison of reactions at corresponding points on Valley Beam vs N-S Ridge Beam\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: Ridge Beam uses horizontal positions, Valley Beam uses sloped positions.\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             "Ridge Beam reaction at 2 ft (horizontal) = Valley Beam reaction at 2.83 ft (sloped)\n",
         )
-        self.output_text.insert(
-            tk.END, "Valley Beam: receives (j_n + j_w)/2 reactions\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("Valley Beam: receives (j_n + j_w)/2 reactions\n")
+        report(
             "N-S Ridge Beam: receives j_w_total reactions (from both sides)\n",
         )
-        self.output_text.insert(
-            tk.END, "Reactions should be EQUAL at each corresponding point.\n\n"
-        )
+        report("Reactions should be EQUAL at each corresponding point.\n\n")
 
         # Create detailed reaction comparison table
-        if (
-            hasattr(self, "valley_beam_positions")
-            and hasattr(self, "valley_beam_total_loads")
-            and hasattr(self, "ns_ridge_total_loads")
-            and self.valley_beam_positions
-            and jacks_data
-        ):
-            self.output_text.insert(
-                tk.END,
-                f"{'Ridge Pos':<12} {'Valley Pos':<15} {'j_n Total':<15} {'j_w Total':<15} {'Valley Beam':<18} {'Ridge Beam':<18} {'Match?':<10}\n",
-            )
-            self.output_text.insert(
-                tk.END,
-                f"{'(ft horiz)':<12} {'(ft sloped)':<15} {'(lb)':<15} {'(lb)':<15} {'(lb, (j_n+j_w)/2)':<18} {'(lb, j_w total)':<18} {'':<10}\n",
+        # Diagram results, read once for the comparison and totals below
+        valley_positions = self.valley_beam_positions
+        valley_total_loads = self.valley_beam_total_loads
+        ns_total_loads = self.ns_ridge_total_loads
+        if valley_positions and jacks_data:
+            report(
+                _COMPARE_TABLE_HEADER.format(
+                    "Ridge Pos",
+                    "Valley Pos",
+                    "j_n Total",
+                    "j_w Total",
+                    "Valley Beam",
+                    "Ridge Beam",
+                    "Match?",
+                )
+                + _COMPARE_TABLE_HEADER.format(
+                    "(ft horiz)",
+                    "(ft sloped)",
+                    "(lb)",
+                    "(lb)",
+                    "(lb, (j_n+j_w)/2)",
+                    "(lb, j_w total)",
+                    "",
+                ),
             )
-            self.output_text.insert(tk.END, "-" * 103 + "\n")
+            report("-" * 103 + "\n")
 
-            # Get sloped positions for valley beam
-            valley_sloped_positions = []
-            if hasattr(self, "valley_beam_sloped_positions"):
-                valley_sloped_positions = self.valley_beam_sloped_positions
-            else:
-                # Calculate sloped positions if not stored
-                for pos_horiz in self.valley_beam_positions:
-                    pos_sloped = pos_horiz * (rafter_len / lv) if lv > 0 else pos_horiz
-                    valley_sloped_positions.append(pos_sloped)
-
-            # Sort by horizontal position
-            combined_data = list(
-                zip(
-                    self.valley_beam_positions,
-                    valley_sloped_positions,
-                    self.valley_beam_total_loads,
-                    self.ns_ridge_total_loads,
-                )
+            # Rows by horizontal position (sloped positions for the valley beam);
+            # calculate() builds the positions on an ascending 2-foot grid, so no
+            # sort is needed
+            combined_data = zip(
+                valley_positions,
+                self.valley_beam_sloped_positions,
+                valley_total_loads,
+                ns_total_loads,
             )
-            combined_data.sort(key=lambda x: x[0])
 
+            rows = []
+            row = rows.append
             for i, (pos_horiz, pos_sloped, valley_load, ns_load) in enumerate(
                 combined_data
             ):
-                if i < len(jacks_data["jacks"]["north_side"]) and i < len(
-                    jacks_data["jacks"]["west_side"]
-                ):
-                    j_n = jacks_data["jacks"]["north_side"][i]
-                    j_w = jacks_data["jacks"]["west_side"][i]
-
-                    j_n_total = j_n["total_snow_lb"] + j_n["dead_load_lb"]
-                    j_w_total = j_w["total_snow_lb"] + j_w["dead_load_lb"]
+                if i < len(jack_totals):
+                    j_n_total, j_w_total = jack_totals[i]
 
                     # Check if reactions match (should be equal)
                     reactions_match = "✓" if abs(valley_load - ns_load) < 0.1 else "✗"
 
-                    self.output_text.insert(
-                        tk.END,
-                        f"{pos_horiz:<12.1f} {pos_sloped:<15.2f} {j_n_total:<15.0f} {j_w_total:<15.0f} {valley_load:<18.0f} {ns_load:<18.0f} {reactions_match:<10}\n",
+                    row(
+                        _COMPARE_TABLE_ROW.format(
+                            pos_horiz,
+                            pos_sloped,
+                            j_n_total,
+                            j_w_total,
+                            valley_load,
+                            ns_load,
+                            reactions_match,
+                        )
                     )
                 else:
-                    self.output_text.insert(
-                        tk.END,
-                        f"{pos_horiz:<12.1f} {pos_sloped:<15.2f} {'N/A':<15} {'N/A':<15} {valley_load:<18.0f} {ns_load:<18.0f} {'':<10}\n",
+                    row(
+                        _COMPARE_TABLE_NA_ROW.format(
+                            pos_horiz,
+                            pos_sloped,
+                            "N/A",
+                            "N/A",
+                            valley_load,
+                            ns_load,
+                            "",
+                        )
                     )
+            report("".join(rows))
 
             # Summary
-            total_valley = sum(self.valley_beam_total_loads)
-            total_ns = sum(self.ns_ridge_total_loads)
-            self.output_text.insert(tk.END, "-" * 103 + "\n")
-            self.output_text.insert(
-                tk.END,
+            total_valley = sum(valley_total_loads)
+            total_ns = sum(ns_total_loads)
+            report("-" * 103 + "\n")
+            report(
                 f"{'Total:':<12} {'':<15} {'':<15} {'':<15} {total_valley:<18.0f} {total_ns:<18.0f}\n",
             )
 
             # Check if all reactions match
-            all_match = all(
-                abs(v - n) < 0.1
-                for v, n in zip(self.valley_beam_total_loads, self.ns_ridge_total_loads)
+            # Every valley/ridge pair must agree within 0.1 lb (largest mismatch)
+            all_match = (
+                max(map(abs, map(sub, valley_total_loads, ns_total_loads)), default=0.0)
+                < 0.1
             )
             if all_match:
-                self.output_text.insert(
-                    tk.END,
+                report(
                     "\n✓ Reactions are EQUAL at each corresponding point\n",
-                    "green",
+                    _TAG_OK,
                 )
             else:
-                self.output_text.insert(
-                    tk.END, "\n✗ Reactions do not match - check calculations\n", "red"
-                )
+                report("\n✗ Reactions do not match - check calculations\n", _TAG_BAD)
 
         # === EQUILIBRIUM VERIFICATION (STATIC CHECK) ===
-        self.output_text.insert(
-            tk.END, "\n============================================================\n"
-        )
-        self.output_text.insert(tk.END, "EQUILIBRIUM VERIFICATION\n")
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("\n============================================================\n")
+        report("EQUILIBRIUM VERIFICATION\n")
+        report("------------------------------------------------------------\n")
+        report(
             "Static Equilibrium Check: Sum of reactions should equal total applied point loads\n\n",
         )
 
         # Valley Beam Equilibrium Check
-        if hasattr(self, "valley_equilibrium_check"):
-            check = self.valley_equilibrium_check
-            self.output_text.insert(tk.END, "VALLEY BEAM:\n")
-            self.output_text.insert(
-                tk.END,
+        check = getattr(self, "valley_equilibrium_check", None)
+        if check is not None:
+            report("VALLEY BEAM:\n")
+            report(
                 f"  Sum of Reactions (R_eave + R_ridge): {check['sum_reactions']:.2f} lb\n",
             )
-            self.output_text.insert(
-                tk.END, f"  Total Point Loads: {check['total_loads']:.2f} lb\n"
-            )
-            self.output_text.insert(
-                tk.END, f"  Difference: {check['difference']:.4f} lb\n"
-            )
+            report(f"  Total Point Loads: {check['total_loads']:.2f} lb\n")
+            report(f"  Difference: {check['difference']:.4f} lb\n")
             if check["passes"]:
-                self.output_text.insert(
-                    tk.END, "  ✓ EQUILIBRIUM SATISFIED\n\n", "green"
-                )
+                report("  ✓ EQUILIBRIUM SATISFIED\n\n", _TAG_OK)
             else:
-                self.output_text.insert(
-                    tk.END,
+                report(
                     "  ✗ EQUILIBRIUM NOT SATISFIED - CHECK CALCULATIONS\n\n",
-                    "red",
+                    _TAG_BAD,
                 )
         else:
-            self.output_text.insert(
-                tk.END, "VALLEY BEAM: Equilibrium check not available\n\n"
-            )
+            report("VALLEY BEAM: Equilibrium check not available\n\n")
 
         # N-S Ridge Beam Equilibrium Check
-        if hasattr(self, "ns_ridge_equilibrium_check"):
-            check = self.ns_ridge_equilibrium_check
-            self.output_text.insert(tk.END, "N-S RIDGE BEAM:\n")
-            self.output_text.insert(
-                tk.END,
+        check = getattr(self, "ns_ridge_equilibrium_check", None)
+        if check is not None:
+            report("N-S RIDGE BEAM:\n")
+            report(
                 f"  Sum of Reactions (R_top + R_bottom): {check['sum_reactions']:.2f} lb\n",
             )
-            self.output_text.insert(
-                tk.END, f"  Total Point Loads: {check['total_loads']:.2f} lb\n"
-            )
-            self.output_text.insert(
-                tk.END, f"  Difference: {check['difference']:.4f} lb\n"
-            )
+            report(f"  Total Point Loads: {check['total_loads']:.2f} lb\n")
+            report(f"  Difference: {check['difference']:.4f} lb\n")
             if check["passes"]:
-                self.output_text.insert(
-                    tk.END, "  ✓ EQUILIBRIUM SATISFIED\n\n", "green"
-                )
+                report("  ✓ EQUILIBRIUM SATISFIED\n\n", _TAG_OK)
             else:
-                self.output_text.insert(
-                    tk.END,
+                report(
                     "  ✗ EQUILIBRIUM NOT SATISFIED - CHECK CALCULATIONS\n\n",
-                    "red",
+                    _TAG_BAD,
                 )
         else:
-            self.output_text.insert(
-                tk.END, "N-S RIDGE BEAM: Equilibrium check not available\n\n"
-            )
+            report("N-S RIDGE BEAM: Equilibrium check not available\n\n")
 
-        self.output_text.insert(tk.END, "\n")
+        report("\n")
 
-        self.output_text.insert(tk.END, "\n")
+        report("\n")
 
         # === N-S RIDGE BEAM DESIGN ANALYSIS ===
-        self.output_text.insert(
-            tk.END, "\n============================================================\n"
-        )
-        self.output_text.insert(tk.END, "N-S RIDGE BEAM DESIGN ANALYSIS\n")
-        self.output_text.insert(
-            tk.END, "------------------------------------------------------------\n"
-        )
-        self.output_text.insert(
-            tk.END, f"Horizontal Length: {ns_ridge_beam_length:.2f} ft\n"
-        )
-        self.output_text.insert(
-            tk.END, f"Material: {self.ns_ridge_material_combobox.get()}\n"
-        )
-        self.output_text.insert(
-            tk.END,
+        report("\n============================================================\n")
+        report("N-S RIDGE BEAM DESIGN ANALYSIS\n")
+        report("------------------------------------------------------------\n")
+        report(f"Horizontal Length: {ns_ridge_beam_length:.2f} ft\n")
+        report(f"Material: {ns_ridge_material}\n")
+        report(
             f"Point Loads: {len(ns_ridge_snow_point_loads)} locations from j_w jack rafters (East-West Valley Rafters)\n",
         )
-        self.output_text.insert(
-            tk.END,
+        report(
             "Note: Each j_w rafter reaction is applied to the N-S ridge beam\n\n",
         )
 
-        if ns_ridge_beam_results and "error" not in ns_ridge_beam_results:
+        if ns_ok:
+            # Check ratios were unpacked for the summary panel above
             ns_max_moment = ns_ridge_beam_results.get("max_moment_ft_kip", 0) * 1000
             ns_max_shear = ns_ridge_beam_results.get("max_shear_kip", 0) * 1000
-            ns_bend_ratio = ns_ridge_beam_results.get("ratio_bending", 0)
-            ns_shear_ratio = ns_ridge_beam_results.get("ratio_shear", 0)
-            ns_snow_def_ratio = ns_ridge_beam_results.get("ratio_deflection_snow", 0)
-            ns_total_def_ratio = ns_ridge_beam_results.get("ratio_deflection_total", 0)
 
             # Calculate reactions for N-S ridge beam
             ns_total_load = sum(load for _, load in ns_ridge_snow_point_loads) + sum(
                 load for _, load in ns_ridge_dead_point_loads
             )
+            # reactions_total already holds snow + dead at each position
             ns_moment_about_top = sum(
-                load * pos
-                for (pos, load) in zip(
-                    ns_ridge_load_positions,
-                    [
-                        s + d
-                        for s, d in zip(
-                            [l for _, l in ns_ridge_snow_point_loads],
-                            [l for _, l in ns_ridge_dead_point_loads],
-                        )
-                    ],
-                )
+                map(mul, reactions_total, ns_ridge_load_positions)
             )
             ns_reaction_bottom = (
                 ns_moment_about_top / ns_ridge_beam_length
@@ -6889,52 +6545,41 @@ SPECIAL NARROW ROOF CASE (W ≤ 20 ft, simply supported prismatic members):
             )
             ns_reaction_top = ns_total_load - ns_reaction_bottom
 
-            self.output_text.insert(
-                tk.END,
+            report(
                 f"Reactions: Top (E-W ridge) = {ns_reaction_top:.0f} lb, Bottom (south eave) = {ns_reaction_bottom:.0f} lb\n",
             )
-            self.output_text.insert(
-                tk.END, f"Maximum Moment: {ns_max_moment:.0f} ft-lb\n"
-            )
-            self.output_text.insert(tk.END, f"Maximum Shear: {ns_max_shear:.0f} lb\n")
-            self.output_text.insert(tk.END, f"Total Load: {ns_total_load:.0f} lb\n\n")
+            report(f"Maximum Moment: {ns_max_moment:.0f} ft-lb\n")
+            report(f"Maximum Shear: {ns_max_shear:.0f} lb\n")
+            report(f"Total Load: {ns_total_load:.0f} lb\n\n")
 
-            self.output_text.insert(tk.END, "=== DESIGN CHECKS ===\n")
-            self.output_text.insert(
-                tk.END,
-                f"Bending: {ns_bend_ratio:.3f} ({'PASS' if ns_bend_ratio <= 1 else 'FAIL'})\n",
+            report("=== DESIGN CHECKS ===\n")
+            report(
+                f"Bending: {ns_bend_ratio:.3f} ({_PF[ns_bend_ratio <= 1]})\n",
             )
-            self.output_text.insert(
-                tk.END,
-                f"Shear: {ns_shear_ratio:.3f} ({'PASS' if ns_shear_ratio <= 1 else 'FAIL'})\n",
+            report(
+                f"Shear: {ns_shear_ratio:.3f} ({_PF[ns_shear_ratio <= 1]})\n",
             )
-            self.output_text.insert(
-                tk.END,
-                f"Snow Deflection: {ns_snow_def_ratio:.3f} ({'PASS' if ns_snow_def_ratio <= 1 else 'FAIL'})\n",
+            report(
+                f"Snow Deflection: {ns_snow_def_ratio:.3f} ({_PF[ns_snow_def_ratio <= 1]})\n",
             )
-            self.output_text.insert(
-                tk.END,
-                f"Total Deflection: {ns_total_def_ratio:.3f} ({'PASS' if ns_total_def_ratio <= 1 else 'FAIL'})\n",
+            report(
+                f"Total Deflection: {ns_total_def_ratio:.3f} ({_PF[ns_total_def_ratio <= 1]})\n",
             )
 
-            if ns_ridge_beam_results.get("passes", False):
-                self.output_text.insert(tk.END, "\nOVERALL STATUS: PASS\n", "green")
+            if ns_overall_pass:
+                report("\nOVERALL STATUS: PASS\n", _TAG_OK)
             else:
-                self.output_text.insert(
-                    tk.END, "\nOVERALL STATUS: FAIL - Redesign required\n", "red"
-                )
+                report("\nOVERALL STATUS: FAIL - Redesign required\n", _TAG_BAD)
         else:
-            ns_error_msg = (
-                ns_ridge_beam_results.get("error", "Unknown error")
-                if ns_ridge_beam_results
-                else "Calculation failed"
-            )
-            self.output_text.insert(tk.END, f"\nERROR: {ns_error_msg}\n", "red")
+            report(f"\nERROR: {ns_error_msg}\n", _TAG_BAD)
 
-        self.output_text.insert(tk.END, "\n")
+        report("\n")
 
-        self.output_text.insert(tk.END, "Validation passed. GUI working correctly!\n")
-        self.output_text.insert(
-            tk.END, "Complete ASCE 7-22 Valley Snow Load Calculator"
-        )
-        print("DEBUG: Calculate method completed successfully")
+        report("Validation passed. GUI working correctly!\n")
+        report("Complete ASCE 7-22 Valley Snow Load Calculator")
+        self._report_args = [
+            arg for tags, buf in report_runs for arg in (buf.getvalue(), tags)
+        ]
+        self._render_details()
+        self._last_calc_key = calc_key
+        logger.debug("Calculate method completed successfully")
@@ -1,6 +1,38 @@
 # jack_rafter_module.py - Jack rafter calculations for valley snow drift loads
 
 import math
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class JackRafter:
+    """Loads and geometry of one jack rafter framing into the valley beam.
+
+    The surcharge/balanced breakdown defaults to no surcharge zone, with the
+    whole horizontal length in the balanced zone.
+    """
+
+    sloped_length_ft: float
+    horiz_length_ft: float
+    trib_width_ft: float
+    balanced_snow_lb: float
+    drift_load_lb: float
+    total_snow_lb: float
+    dead_load_lb: float
+    full_load_on_jack_lb: float
+    point_load_lb: float  # Reaction to valley beam
+    location_from_ridge_ft: float
+    location_from_eave_ft: float = 0.0
+    surcharge_snow_lb: float = 0.0
+    surcharge_length_ft: float = 0.0
+    balanced_length_ft: Optional[float] = None
+    surcharge_psf: float = 0.0
+    balanced_psf: float = 0.0
+
+    def __post_init__(self):
+        if self.balanced_length_ft is None:
+            self.balanced_length_ft = self.horiz_length_ft
 
 
 def calculate_jack_rafters(
@@ -16,7 +48,7 @@ def calculate_jack_rafters(
     dead_load_psf_horizontal=20.0,
 ):
     """Calculate jack rafters starting from eave (longest) to ridge (shortest).
-    Returns separate point loads for north and west sides at each location.
+    Returns separate JackRafter records for north and west sides at each location.
     """
     # Spacing is measured along ridges, convert to spacing along sloped valley
     valley_angle_rad = math.radians(valley_angle_deg)
@@ -104,32 +136,34 @@ def calculate_jack_rafters(
         P_total_w = full_load_on_jack_w / 2
 
         jacks_north.append(
-            {
-                "sloped_length_ft": sloped_length_n,
-                "horiz_length_ft": horiz_length_n,
-                "trib_width_ft": trib_width_ft,
-                "balanced_snow_lb": P_balanced_n,
-                "drift_load_lb": P_drift_n,
-                "total_snow_lb": P_total_snow_n,
-                "dead_load_lb": P_dead_n,
-                "full_load_on_jack_lb": full_load_on_jack_n,
-                "point_load_lb": P_total_n,  # Reaction to valley beam
-                "location_from_ridge_ft": pos_from_ridge,
-            }
+            JackRafter(
+                sloped_length_ft=sloped_length_n,
+                horiz_length_ft=horiz_length_n,
+                trib_width_ft=trib_width_ft,
+                balanced_snow_lb=P_balanced_n,
+                drift_load_lb=P_drift_n,
+                total_snow_lb=P_total_snow_n,
+                dead_load_lb=P_dead_n,
+                full_load_on_jack_lb=full_load_on_jack_n,
+                point_load_lb=P_total_n,
+                location_from_ridge_ft=pos_from_ridge,
+                balanced_psf=ps_psf,
+            )
         )
         jacks_west.append(
-            {
-                "sloped_length_ft": sloped_length_w,
-                "horiz_length_ft": horiz_length_w,
-                "trib_width_ft": trib_width_ft,
-                "balanced_snow_lb": P_balanced_w,
-                "drift_load_lb": P_drift_w,
-                "total_snow_lb": P_total_snow_w,
-                "dead_load_lb": P_dead_w,
-                "full_load_on_jack_lb": full_load_on_jack_w,
-                "point_load_lb": P_total_w,  # Reaction to valley beam
-                "location_from_ridge_ft": pos_from_ridge,
-            }
+            JackRafter(
+                sloped_length_ft=sloped_length_w,
+                horiz_length_ft=horiz_length_w,
+                trib_width_ft=trib_width_ft,
+                balanced_snow_lb=P_balanced_w,
+                drift_load_lb=P_drift_w,
+                total_snow_lb=P_total_snow_w,
+                dead_load_lb=P_dead_w,
+                full_load_on_jack_lb=full_load_on_jack_w,
+                point_load_lb=P_total_w,
+                location_from_ridge_ft=pos_from_ridge,
+                balanced_psf=ps_psf,
+            )
         )
 
     # Reverse for eave-first (longest to shortest)
@@ -138,7 +172,7 @@ def calculate_jack_rafters(
 
     # Update locations to from eave (optional, or keep from ridge)
     for j in jacks_north + jacks_west:
-        j["location_from_eave_ft"] = lv - j["location_from_ridge_ft"]
+        j.location_from_eave_ft = lv - j.location_from_ridge_ft
 
     return {
         "num_per_side": len(jacks_north),
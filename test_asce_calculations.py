@@ -6,6 +6,11 @@ Tests the updated calculation logic with examples from the user requirements.
 
 import math
 
+import pytest
+
+from beam_design import _point_load_envelope
+from gui_interface import _beam_equilibrium, _shear_moment_sweep
+
 
 def calculate_cs_fig_7_4_1(
     theta_deg: float, ct: float, slippery: bool = False, warm_roof: bool = False
@@ -164,6 +169,145 @@ def test_shallow_slope():
     print()
 
 
+def _sweep_by_loop(distances, loads, length, reaction_eave):
+    """Reference shear/moment walk written as the original explicit loop"""
+    shear = reaction_eave
+    moment = 0.0
+    prev_dist = 0.0
+    shears = [shear]
+    moments = [moment]
+    for dist, load in zip(distances, loads):
+        moment += shear * (dist - prev_dist)
+        moments.append(moment)
+        shear -= load
+        shears.append(shear)
+        prev_dist = dist
+    moments.append(moment + shear * (length - prev_dist))
+    return shears, moments
+
+
+def _envelope_by_loop(
+    point_loads_sorted, reaction_eave_point, reaction_eave_self_weight, w_plf, lv
+):
+    """Reference moment/shear envelope written as the original station loops"""
+    num_points = max(50, int(lv / 0.1))
+    positions = [i * lv / (num_points - 1) for i in range(num_points)]
+    moments = []
+    for x in positions:
+        moment = reaction_eave_point * x
+        for pos, load in point_loads_sorted:
+            if pos < x:
+                moment -= load * (x - pos)
+        moments.append(abs(moment + w_plf * x * (lv - x) / 2.0))
+    max_moment = max(moments)
+    max_moment_location = positions[moments.index(max_moment)]
+
+    shears = []
+    for x in [0] + [pos for pos, _ in point_loads_sorted] + [lv]:
+        shear = reaction_eave_point
+        for pos, load in point_loads_sorted:
+            if pos < x:
+                shear -= load
+        shears.append(abs(shear + reaction_eave_self_weight - w_plf * x))
+    return max_moment, max_moment_location, max(shears)
+
+
+# (distances from eave, loads, length): one load, several loads, and loads
+# sitting on the supports at 0 and at L
+BEAM_CASES = [
+    ([5.0], [1000.0], 10.0),
+    ([2.83, 5.66, 8.49, 11.32, 14.15], [820.0, 640.5, 470.25, 300.0, 130.75], 17.0),
+    ([0.0, 4.0, 12.0], [500.0, 750.0, 250.0], 12.0),
+]
+
+
+@pytest.mark.parametrize("distances, loads, length", BEAM_CASES)
+def test_shear_moment_sweep_matches_loop(distances, loads, length):
+    """The running-sum sweep reproduces the explicit loop, N+1 shears and N+2 moments"""
+    reaction_ridge = sum(l * d for d, l in zip(distances, loads)) / length
+    reaction_eave = sum(loads) - reaction_ridge
+
+    shears, moments = _shear_moment_sweep(distances, loads, length, reaction_eave)
+    loop_shears, loop_moments = _sweep_by_loop(distances, loads, length, reaction_eave)
+
+    assert len(shears) == len(loads) + 1
+    assert len(moments) == len(loads) + 2
+    assert shears == pytest.approx(loop_shears)
+    assert moments == pytest.approx(loop_moments)
+    # Equilibrium: the last shear is minus the ridge reaction, moment closes at L
+    assert shears[-1] == pytest.approx(-reaction_ridge)
+    assert moments[-1] == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("distances, loads, length", BEAM_CASES)
+def test_beam_equilibrium_matches_loop(distances, loads, length):
+    """Reactions and sweep from _beam_equilibrium agree with the loop version"""
+    total, reaction_eave, reaction_ridge, shears, moments = _beam_equilibrium(
+        distances, loads, length
+    )
+    loop_ridge = sum(l * d for d, l in zip(distances, loads)) / length
+    loop_shears, loop_moments = _sweep_by_loop(
+        distances, loads, length, sum(loads) - loop_ridge
+    )
+
+    assert total == pytest.approx(sum(loads))
+    assert reaction_ridge == pytest.approx(loop_ridge)
+    assert reaction_eave + reaction_ridge == pytest.approx(total)
+    assert shears == pytest.approx(loop_shears)
+    assert moments == pytest.approx(loop_moments)
+
+
+def test_beam_equilibrium_single_midspan_load():
+    """P at midspan: reactions P/2, max |shear| P/2, max moment PL/4"""
+    total, reaction_eave, reaction_ridge, shears, moments = _beam_equilibrium(
+        [5.0], [1000.0], 10.0
+    )
+    assert reaction_eave == pytest.approx(500.0)
+    assert reaction_ridge == pytest.approx(500.0)
+    assert max(abs(v) for v in shears) == pytest.approx(500.0)
+    assert max(moments) == pytest.approx(2500.0)
+
+
+def test_beam_equilibrium_loads_on_supports():
+    """Loads at 0 and at L go straight into the reactions and add no moment"""
+    total, reaction_eave, reaction_ridge, shears, moments = _beam_equilibrium(
+        [0.0, 10.0], [400.0, 600.0], 10.0
+    )
+    assert reaction_eave == pytest.approx(400.0)
+    assert reaction_ridge == pytest.approx(600.0)
+    assert shears == pytest.approx([400.0, 0.0, -600.0])
+    assert moments == pytest.approx([0.0, 0.0, 0.0, 0.0], abs=1e-9)
+    assert max(abs(v) for v in shears) == pytest.approx(600.0)
+
+
+@pytest.mark.parametrize("distances, loads, length", BEAM_CASES)
+@pytest.mark.parametrize("w_plf", [0.0, 12.5])
+def test_point_load_envelope_matches_loop(distances, loads, length, w_plf):
+    """Max moment, its location and max shear match the original station loops"""
+    point_loads = sorted(zip(distances, loads))
+    reaction_eave_point = sum(loads) - sum(l * d for d, l in point_loads) / length
+    reaction_eave_self_weight = w_plf * length / 2.0
+
+    result = _point_load_envelope(
+        point_loads, reaction_eave_point, reaction_eave_self_weight, w_plf, length
+    )
+    expected = _envelope_by_loop(
+        point_loads, reaction_eave_point, reaction_eave_self_weight, w_plf, length
+    )
+    assert result == pytest.approx(expected)
+
+
+def test_point_load_envelope_single_midspan_load():
+    """P at midspan with no self-weight: max moment PL/4 at L/2, max shear P/2"""
+    max_moment, location, max_shear = _point_load_envelope(
+        [(5.0, 1000.0)], 500.0, 0.0, 0.0, 10.0
+    )
+    # Stations fall every L/99, so the peak is sampled next to midspan
+    assert max_moment == pytest.approx(2500.0, rel=0.02)
+    assert location == pytest.approx(5.0, abs=0.11)
+    assert max_shear == pytest.approx(500.0)
+
+
 if __name__ == "__main__":
     print("ASCE 7-22 Snow Load Calculation Tests")
     print("=" * 50)
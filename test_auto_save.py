@@ -7,6 +7,9 @@ import os
 import json
 from datetime import datetime
 
+import gui_interface
+from gui_interface import ValleySnowCalculator, _BACKUP_SECTIONS
+
 
 def test_python_auto_save():
     """Test the Python auto-save functionality"""
@@ -302,6 +305,88 @@ def test_typescript_simulation():
     print("\n🎉 TypeScript auto-save simulation tests completed!")
 
 
+class _BackupText:
+    """Text widget stand-in with Tk's modified flag"""
+
+    def __init__(self, text):
+        self.text = text
+        self.modified = True
+
+    def get(self, *args):
+        return self.text
+
+    def edit_modified(self, flag=None):
+        if flag is None:
+            return self.modified
+        self.modified = flag
+
+
+class _BackupValue:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _backup_calculator(auto_save_file):
+    """The real ValleySnowCalculator with just the state save_current_state reads"""
+    calc = ValleySnowCalculator.__new__(ValleySnowCalculator)
+    calc.auto_save_file = str(auto_save_file)
+    calc._last_saved_state = None
+    calc._saved_texts = {}
+    calc._report_args = []  # No full report yet: results come from the widget
+    calc.entries = {
+        field: _BackupValue(default)
+        for _, fields in _BACKUP_SECTIONS
+        for _, field, default in fields
+    }
+    calc.material_combobox = _BackupValue("Glulam 24F-V4 DF (Fb=2400 psi)")
+    calc.ns_ridge_material_combobox = _BackupValue("Glulam 24F-V4 DF (Fb=2400 psi)")
+    calc.output_text = _BackupText("Calculation report\n")
+    calc.summary_label = _BackupText("Beam design summary\n")
+    return calc
+
+
+def test_save_current_state_skips_unchanged_state(tmp_path, monkeypatch):
+    """ValleySnowCalculator.save_current_state writes atomically and only on change"""
+    replaced = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        replaced.append((src, dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(gui_interface.os, "replace", counting_replace)
+    backup = tmp_path / "state.backup.json"
+    calc = _backup_calculator(backup)
+
+    calc.save_current_state()
+    assert len(replaced) == 1
+    assert replaced[0] == (str(backup) + ".tmp", str(backup))
+    saved = json.loads(backup.read_text())
+    assert saved["inputs"] == calc._backup_inputs()
+    assert saved["inputs"]["beam_design"]["material"].startswith("Glulam")
+    assert saved["results"]["output_text"] == "Calculation report\n"
+    assert not (tmp_path / "state.backup.json.tmp").exists()
+    first_write = backup.read_text()
+
+    # Same inputs and results: no second write, even though the timestamp differs
+    calc.save_current_state()
+    assert len(replaced) == 1
+    assert backup.read_text() == first_write
+    assert not (tmp_path / "state.backup.json.tmp").exists()
+
+    # A changed entry is written again
+    calc.entries["pg"].value = "60"
+    calc.save_current_state()
+    assert len(replaced) == 2
+    assert (
+        json.loads(backup.read_text())["inputs"]["snow_load_parameters"]["pg"] == "60"
+    )
+    assert os.listdir(tmp_path) == ["state.backup.json"]
+
+
 if __name__ == "__main__":
     print("🚀 Valley Snow Load Calculator - Auto-Save Protocol Test")
     print("=" * 60)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the unchanged-inputs short-circuit in ValleySnowCalculator.calculate()
+and for the stored full report it leaves behind
+
+The calculator is built without a Tk window: widgets are replaced by small
+stand-ins that record the text written to them.
+"""
+
+import json
+
+import gui_interface
+from gui_interface import ValleySnowCalculator
+
+DEFAULT_INPUTS = {
+    "pg": "50",
+    "w2": "0.55",
+    "ce": "1.0",
+    "ct": "1.2",
+    "pitch_north": "10",
+    "pitch_west": "10",
+    "north_span": "16",
+    "south_span": "16",
+    "ew_half_width": "42",
+    "valley_offset": "16",
+    "valley_angle": "90",
+    "jack_spacing_inches": "24",
+    "dead_load_horizontal": "15",
+    "beam_width": "3.5",
+    "beam_depth_trial": "16",
+    "fb_allowable": "2400",
+    "fv_allowable": "265",
+    "modulus_e": "1800000",
+    "deflection_total_limit": "240",
+    "deflection_snow_limit": "360",
+    "ns_ridge_beam_width": "3.5",
+    "ns_ridge_beam_depth_trial": "16",
+    "ns_ridge_fb_allowable": "2400",
+    "ns_ridge_fv_allowable": "265",
+    "ns_ridge_modulus_e": "1800000",
+    "ns_ridge_deflection_total_limit": "240",
+    "ns_ridge_deflection_snow_limit": "360",
+}
+
+GLULAM = "Glulam 24F-V4 DF (Fb=2400 psi)"
+
+
+class _Widget:
+    """Accepts and ignores any Tk call not modelled below"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _Text(_Widget):
+    def __init__(self):
+        self.text = ""
+
+    def insert(self, index, *chars_and_tags):
+        self.text += "".join(chars_and_tags[::2])
+
+    def delete(self, *args):
+        self.text = ""
+
+    def get(self, *args):
+        return self.text + "\n"
+
+
+class _Entry(_Widget):
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _make_calculator():
+    calc = ValleySnowCalculator.__new__(ValleySnowCalculator)
+    calc.master = _Widget()
+    calc.canvas = _Widget()
+    calc.plot_frame = _Widget()
+    calc.scrollable_frame = _Widget()
+    calc.output_text = _Text()
+    calc.summary_label = _Text()
+    calc.entries = {key: _Entry(value) for key, value in DEFAULT_INPUTS.items()}
+    calc.material_combobox = _Var(GLULAM)
+    calc.ns_ridge_material_combobox = _Var(GLULAM)
+    calc.slippery_var = _Var(False)
+    calc.show_details_var = _Var(True)
+    calc.fb_allowable_value = 2400
+    calc.fv_allowable_value = 265
+    calc.modulus_e_value = 1800000
+    calc.ns_ridge_fb_allowable_value = 2400
+    calc.ns_ridge_fv_allowable_value = 265
+    calc.ns_ridge_modulus_e_value = 1800000
+    calc.data_changed = False
+    calc._validated_inputs = None
+    calc._last_calc_key = None
+    calc._report_args = []
+    calc.generate_diagrams = lambda **kwargs: None
+    return calc
+
+
+def test_failed_run_does_not_keep_earlier_results(monkeypatch):
+    """Inputs A, then failing inputs B, then A again must recalculate A"""
+    monkeypatch.setattr(gui_interface, "messagebox", _Widget())
+    calc = _make_calculator()
+
+    calc.calculate()
+    report_a = calc.output_text.text
+    assert "VALIDATION ERRORS" not in report_a
+
+    calc.entries["pg"].value = "-5"  # Negative ground snow load fails validation
+    calc.calculate()
+    assert "VALIDATION ERRORS" in calc.output_text.text
+    assert calc._last_calc_key is None
+
+    calc.entries["pg"].value = DEFAULT_INPUTS["pg"]
+    calc.calculate()
+    assert calc.output_text.text == report_a
+
+
+def test_details_toggle_after_failed_run_keeps_error(monkeypatch):
+    """Toggling the full report after a failed run must not redraw the old one"""
+    monkeypatch.setattr(gui_interface, "messagebox", _Widget())
+    calc = _make_calculator()
+
+    calc.calculate()
+    assert calc._report_args
+
+    calc.entries["pg"].value = "-5"
+    calc.calculate()
+    assert calc._report_args == []
+    error_text = calc.output_text.text
+
+    calc.show_details_var.value = False
+    calc._render_details()
+    calc.show_details_var.value = True
+    calc._render_details()
+    assert calc.output_text.text == error_text
+
+
+def test_unchanged_inputs_keep_results(monkeypatch):
+    """A repeat with the same inputs leaves the report untouched"""
+    monkeypatch.setattr(gui_interface, "messagebox", _Widget())
+    calc = _make_calculator()
+
+    calc.calculate()
+    calc.output_text.text = "marker"
+    calc.calculate()
+    assert calc.output_text.text == "marker"
+
+
+def test_hidden_report_is_still_exported_and_saved(tmp_path, monkeypatch):
+    """With the full report hidden, exports and auto-save keep the results"""
+    monkeypatch.setattr(gui_interface, "messagebox", _Widget())
+    calc = _make_calculator()
+    calc.calculate()
+    report = calc.output_text.text
+
+    calc.show_details_var.value = False
+    calc._render_details()
+    assert "report hidden" in calc.output_text.text
+
+    html_file = tmp_path / "report.html"
+    calc.generate_html_report(str(html_file))
+    html = html_file.read_text()
+    assert "MINIMUM SNOW LOAD" in html
+    assert "report hidden" not in html
+
+    calc.auto_save_file = str(tmp_path / "state.backup.json")
+    calc._last_saved_state = None
+    calc._saved_texts = {}
+    calc.save_current_state()
+    with open(calc.auto_save_file) as f:
+        saved = json.load(f)
+    assert saved["results"]["output_text"] == report